@@ -4,10 +4,22 @@ Professional Diagram Generator for TeamACE CRM-ERP Phase 1 SRS
 Creates architecture and ERD diagrams using Pillow
 """
 
-from PIL import Image, ImageDraw, ImageFont
 import os
+import sys
+
+from wireframe_kit import profiling
+from wireframe_kit.build import build_outputs, describe, parse_args
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.fonts import HELVETICA, get_font, print_font_cache_info
+from wireframe_kit.graph_layout import layered_layout
+from wireframe_kit.registry import collect, generates
+from wireframe_kit.routing import route_edges
+from wireframe_kit.schema import load_schema, migration_paths
+from wireframe_kit.watch import watch
 
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATHS = (HELVETICA,)
+MIGRATIONS_DIR = os.path.normpath(os.path.join(OUTPUT_DIR, '..', '..', 'backend', 'migrations'))
 
 # Professional Color Palette
 COLORS = {
@@ -31,18 +43,29 @@ COLORS = {
     'shadow': '#00000015',
 }
 
+# ERD entity colors, assigned per migration file
+ERD_PALETTE = [
+    (COLORS['success_light'], '#388E3C'),
+    (COLORS['warning_light'], '#EF6C00'),
+    (COLORS['info_light'], '#0097A7'),
+    (COLORS['purple_light'], '#7B1FA2'),
+    (COLORS['primary_light'], '#1565C0'),
+    ('#FCE4EC', '#C2185B'),
+    ('#FFF3E0', '#E65100'),
+    ('#E1F5FE', '#0277BD'),
+]
+ERD_ENTITY_WIDTH = 210
+ERD_HEADER_HEIGHT = 28
+ERD_ROW_HEIGHT = 16
+ERD_GAP = 40
+ERD_MARGIN = 50
+# Nearly every table points at these; their edges would hide everything else
+ERD_IMPLICIT_TABLES = ('tenants', 'users')
+
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-def get_font(size=12, bold=False):
-    try:
-        if bold:
-            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-    except:
-        return ImageFont.load_default()
-
 def draw_rounded_rect(draw, coords, radius=8, fill=None, outline=None, width=1):
     """Draw a rounded rectangle"""
     x1, y1, x2, y2 = coords
@@ -53,7 +76,7 @@ def draw_box(draw, x, y, width, height, text, subtext=None, fill_color='#FFFFFF'
     """Draw a professional box with text"""
     # Shadow
     if shadow:
-        draw.rounded_rectangle((x+4, y+4, x+width+4, y+height+4), radius=radius, fill=COLORS['shadow'])
+        draw.shadow((x+4, y+4, x+width+4, y+height+4), radius=radius, blur=4, color=COLORS['shadow'])
 
     # Main box
     draw.rounded_rectangle((x, y, x+width, y+height), radius=radius, fill=fill_color, outline=border_color, width=2)
@@ -101,12 +124,17 @@ def draw_connector_line(draw, points, color='#757575', width=2):
     for i in range(len(points) - 1):
         draw.line([points[i], points[i+1]], fill=color, width=width)
 
+def new_canvas(width, height):
+    """Create a display list canvas; it also serves as its own draw surface"""
+    canvas = DisplayList(width, height, COLORS['bg'])
+    return canvas, canvas
+
+@generates("architecture_diagram.png", "architecture")
 def create_architecture_diagram():
     """Create the Platform Architecture Diagram"""
     width = 1000
     height = 700
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     # Title
     title_font = get_font(20, bold=True)
@@ -226,207 +254,157 @@ def create_architecture_diagram():
 
     return img
 
+def erd_group_colors(sources):
+    """Map each migration file to a (fill, border) pair"""
+    return {source: ERD_PALETTE[i % len(ERD_PALETTE)] for i, source in enumerate(sorted(sources))}
+
+def erd_entity_size(schema, table):
+    """Width and height of the box drawn for a table"""
+    rows = len(schema.key_columns(table)) + 1
+    return ERD_ENTITY_WIDTH, ERD_HEADER_HEIGHT + rows * ERD_ROW_HEIGHT + 6
+
+def draw_entity(draw, box, schema, table, fill, border):
+    """Draw a table box: name header, key columns and a count of the rest"""
+    x1, y1, x2, y2 = box
+    draw.shadow((x1+3, y1+3, x2+3, y2+3), radius=8, blur=3, color=COLORS['shadow'])
+    draw.rounded_rectangle(box, radius=8, fill=COLORS['white'], outline=border, width=2)
+    draw.rounded_rectangle((x1, y1, x2, y1 + ERD_HEADER_HEIGHT), radius=8, fill=fill, outline=border, width=2)
+    draw.rectangle((x1 + 2, y1 + ERD_HEADER_HEIGHT - 8, x2 - 2, y1 + ERD_HEADER_HEIGHT - 1), fill=fill)
+    draw.text((x1 + 10, y1 + 7), table.upper(), fill=COLORS['text'], font=get_font(11, bold=True))
+
+    keys = schema.key_columns(table)
+    fks = {fk.column for fk in schema.foreign_keys if fk.table == table}
+    y = y1 + ERD_HEADER_HEIGHT + 4
+    for column in keys:
+        marker = 'PK' if column.primary_key else 'FK'
+        draw.text((x1 + 10, y), marker, fill=border if column.name in fks or column.primary_key else COLORS['text_secondary'],
+                  font=get_font(9, bold=True))
+        draw.text((x1 + 34, y), column.name, fill=COLORS['text'], font=get_font(10))
+        y += ERD_ROW_HEIGHT
+
+    others = len(schema.tables[table].columns) - len(keys)
+    draw.text((x1 + 34, y), f"+ {others} more columns", fill=COLORS['text_secondary'], font=get_font(9))
+
+def draw_relationship(draw, points, label=None, label_xy=None, color=None):
+    """Draw a routed primary key -> foreign key connector with its label"""
+    color = color or COLORS['text_secondary']
+    draw.line(points, fill=color, width=1)
+
+    # Arrowhead pointing along the last segment into the child
+    (px, py), (ex, ey) = points[-2], points[-1]
+    if ex > px:
+        draw.polygon([(ex, ey), (ex-8, ey-4), (ex-8, ey+4)], fill=color)
+    elif ex < px:
+        draw.polygon([(ex, ey), (ex+8, ey-4), (ex+8, ey+4)], fill=color)
+    elif ey > py:
+        draw.polygon([(ex, ey), (ex-4, ey-8), (ex+4, ey-8)], fill=color)
+    else:
+        draw.polygon([(ex, ey), (ex-4, ey+8), (ex+4, ey+8)], fill=color)
+
+    if label and label_xy:
+        lx, ly = label_xy
+        draw.text((lx, ly), label, fill=color, font=get_font(9))
+
+@generates("erd_diagram.png", "erd", "schema")
 def create_erd_diagram():
-    """Create the Entity Relationship Diagram"""
-    width = 1100
-    height = 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    """Create the Entity Relationship Diagram from the backend migrations"""
+    schema = load_schema(MIGRATIONS_DIR, cache_dir=OUTPUT_DIR)
+    relationships = [fk for fk in schema.edges() if fk.ref_table not in ERD_IMPLICIT_TABLES]
+    layout = layered_layout(schema.tables, [(fk.ref_table, fk.table) for fk in relationships],
+                            {table: erd_entity_size(schema, table) for table in schema.tables},
+                            max_columns=max(4, round((len(schema.tables) * 1.6) ** 0.5)),
+                            gap_x=ERD_GAP, gap_y=ERD_GAP + 20)
+    boxes = {table: (x1 + ERD_MARGIN, y1 + 90, x2 + ERD_MARGIN, y2 + 90)
+             for table, (x1, y1, x2, y2) in layout.boxes.items()}
+    bottom = layout.height + 90
+    groups = erd_group_colors({table.source for table in schema.tables.values()})
+
+    legend_rows = -(-len(groups) // 4)
+    width = max(2 * ERD_MARGIN + layout.width, 1300)
+    height = bottom + 60 + legend_rows * 26 + 50
+    img, draw = new_canvas(width, height)
 
     # Title
     title_font = get_font(20, bold=True)
-    draw.text((width//2 - 150, 20), "Phase 1 Entity Relationship Diagram", fill=COLORS['primary_dark'], font=title_font)
-
-    # Entity box dimensions
-    entity_w = 140
-    entity_h = 50
-
-    # Define entities with positions
-    entities = {
-        'LEADS': (100, 120, COLORS['warning_light'], '#EF6C00'),
-        'OPPORTUNITIES': (100, 280, COLORS['info_light'], '#0097A7'),
-        'PROPOSALS': (100, 440, COLORS['purple_light'], '#7B1FA2'),
-        'CLIENTS': (400, 200, COLORS['success_light'], '#388E3C'),
-        'CONTACTS': (400, 360, COLORS['primary_light'], '#1565C0'),
-        'ENGAGEMENTS': (700, 200, '#FCE4EC', '#C2185B'),
-        'ASSIGNMENTS': (700, 360, '#FFF3E0', '#E65100'),
-        'INVOICES': (700, 520, '#E8F5E9', '#2E7D32'),
-        'DEPLOYMENTS': (950, 360, '#E1F5FE', '#0277BD'),
-        'SERVICE_LOGS': (950, 520, '#F3E5F5', '#7B1FA2'),
-    }
-
-    # Draw entities
-    for name, (x, y, fill, border) in entities.items():
-        draw.rounded_rectangle((x, y, x + entity_w, y + entity_h), radius=8,
-                              fill=fill, outline=border, width=2)
-        # Shadow
-        draw.rounded_rectangle((x+3, y+3, x + entity_w + 3, y + entity_h + 3), radius=8,
-                              fill=COLORS['shadow'])
-        draw.rounded_rectangle((x, y, x + entity_w, y + entity_h), radius=8,
-                              fill=fill, outline=border, width=2)
-
-        font = get_font(12, bold=True)
-        bbox = draw.textbbox((0, 0), name, font=font)
-        text_w = bbox[2] - bbox[0]
-        draw.text((x + (entity_w - text_w) // 2, y + 17), name, fill=COLORS['text'], font=font)
-
-    # Draw relationships with labels
-    def draw_relationship(start_entity, end_entity, label, start_side='right', end_side='left', offset=0):
-        sx, sy, _, _ = entities[start_entity]
-        ex, ey, _, _ = entities[end_entity]
-
-        if start_side == 'right':
-            sx += entity_w
-            sy += entity_h // 2 + offset
-        elif start_side == 'bottom':
-            sx += entity_w // 2 + offset
-            sy += entity_h
-        elif start_side == 'left':
-            sy += entity_h // 2 + offset
-        else:  # top
-            sx += entity_w // 2 + offset
-
-        if end_side == 'left':
-            ey += entity_h // 2 + offset
-        elif end_side == 'top':
-            ex += entity_w // 2 + offset
-        elif end_side == 'right':
-            ex += entity_w
-            ey += entity_h // 2 + offset
-        else:  # bottom
-            ex += entity_w // 2 + offset
-            ey += entity_h
-
-        # Draw line with label
-        mid_x = (sx + ex) // 2
-        mid_y = (sy + ey) // 2
-
-        draw.line([(sx, sy), (ex, ey)], fill=COLORS['text_secondary'], width=2)
-
-        # Draw arrowhead at end
-        if end_side == 'left':
-            draw.polygon([(ex, ey), (ex+8, ey-5), (ex+8, ey+5)], fill=COLORS['text_secondary'])
-        elif end_side == 'top':
-            draw.polygon([(ex, ey), (ex-5, ey+8), (ex+5, ey+8)], fill=COLORS['text_secondary'])
-        elif end_side == 'right':
-            draw.polygon([(ex, ey), (ex-8, ey-5), (ex-8, ey+5)], fill=COLORS['text_secondary'])
-        else:
-            draw.polygon([(ex, ey), (ex-5, ey-8), (ex+5, ey-8)], fill=COLORS['text_secondary'])
-
-        # Label background
-        label_font = get_font(10)
+    draw.text((ERD_MARGIN, 20), "TeamACE CRM-ERP Entity Relationship Diagram", fill=COLORS['primary_dark'], font=title_font)
+    draw.text((ERD_MARGIN, 52), f"{len(schema.tables)} tables and {len(schema.foreign_keys)} foreign keys "
+              f"from backend/migrations", fill=COLORS['text_secondary'], font=get_font(12))
+
+    # Relationships first so entity boxes sit on top of them
+    edges = {(fk.ref_table, fk.table): fk.column for fk in relationships}
+    label_font = get_font(9)
+    label_sizes = {}
+    for edge, label in edges.items():
         bbox = draw.textbbox((0, 0), label, font=label_font)
-        lw = bbox[2] - bbox[0]
-        lh = bbox[3] - bbox[1]
-        draw.rectangle((mid_x - lw//2 - 4, mid_y - lh//2 - 2, mid_x + lw//2 + 4, mid_y + lh//2 + 4),
-                      fill=COLORS['white'])
-        draw.text((mid_x - lw//2, mid_y - lh//2), label, fill=COLORS['text_secondary'], font=label_font)
-
-    # Draw relationships
-    # LEADS -> OPPORTUNITIES
-    draw.line([(170, 170), (170, 270)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(170, 270), (165, 262), (175, 262)], fill=COLORS['text_secondary'])
-    draw.text((130, 210), "creates", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # LEADS -> CLIENTS (converts)
-    draw.line([(240, 145), (400, 225)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(400, 225), (392, 220), (394, 230)], fill=COLORS['text_secondary'])
-    draw.text((290, 165), "converts", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # OPPORTUNITIES -> CLIENTS
-    draw.line([(240, 305), (400, 250)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(400, 250), (392, 248), (394, 258)], fill=COLORS['text_secondary'])
-
-    # OPPORTUNITIES -> PROPOSALS
-    draw.line([(170, 330), (170, 430)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(170, 430), (165, 422), (175, 422)], fill=COLORS['text_secondary'])
-    draw.text((125, 375), "generates", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # CLIENTS -> CONTACTS
-    draw.line([(470, 250), (470, 350)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(470, 350), (465, 342), (475, 342)], fill=COLORS['text_secondary'])
-    draw.text((480, 295), "has", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # CLIENTS -> ENGAGEMENTS
-    draw.line([(540, 225), (700, 225)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(700, 225), (692, 220), (692, 230)], fill=COLORS['text_secondary'])
-    draw.text((600, 205), "signs", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # ENGAGEMENTS -> ASSIGNMENTS
-    draw.line([(770, 250), (770, 350)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(770, 350), (765, 342), (775, 342)], fill=COLORS['text_secondary'])
-    draw.text((780, 295), "has", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # ENGAGEMENTS -> INVOICES
-    draw.line([(770, 250), (770, 510)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(770, 510), (765, 502), (775, 502)], fill=COLORS['text_secondary'])
-    draw.text((720, 420), "generates", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # ASSIGNMENTS -> DEPLOYMENTS
-    draw.line([(840, 385), (950, 385)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(950, 385), (942, 380), (942, 390)], fill=COLORS['text_secondary'])
-    draw.text((875, 365), "has", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # ASSIGNMENTS -> SERVICE_LOGS
-    draw.line([(840, 410), (950, 520)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(950, 520), (942, 516), (946, 526)], fill=COLORS['text_secondary'])
-    draw.text((870, 460), "logs", fill=COLORS['text_secondary'], font=get_font(10))
-
-    # PROPOSALS -> ENGAGEMENTS (when accepted)
-    draw.line([(240, 465), (600, 465), (600, 250), (700, 250)], fill=COLORS['text_secondary'], width=2)
-    # Multi-segment line
-    draw.line([(240, 465), (600, 465)], fill=COLORS['text_secondary'], width=2)
-    draw.line([(600, 465), (600, 250)], fill=COLORS['text_secondary'], width=2)
-    draw.line([(600, 250), (700, 250)], fill=COLORS['text_secondary'], width=2)
-    draw.polygon([(700, 250), (692, 245), (692, 255)], fill=COLORS['text_secondary'])
-    draw.text((380, 445), "becomes (when accepted)", fill=COLORS['text_secondary'], font=get_font(10))
+        label_sizes[edge] = (bbox[2] + 2, bbox[3] + 2)
+    routes = route_edges(boxes, list(edges), label_sizes)
+    for edge, route in routes.items():
+        draw_relationship(draw, route.points, edges[edge], route.label_xy)
 
-    # Legend
-    legend_y = 650
-    draw.text((50, legend_y), "Legend:", fill=COLORS['text'], font=get_font(12, bold=True))
-
-    legend_items = [
-        ("CRM Entities", COLORS['success_light'], '#388E3C'),
-        ("Sales Pipeline", COLORS['warning_light'], '#EF6C00'),
-        ("HR Operations", '#FFF3E0', '#E65100'),
-        ("Finance", '#E8F5E9', '#2E7D32'),
-    ]
+    for name, table in schema.tables.items():
+        fill, border = groups[table.source]
+        draw_entity(draw, boxes[name], schema, name, fill, border)
 
-    lx = 120
-    for label, fill, border in legend_items:
-        draw.rounded_rectangle((lx, legend_y - 5, lx + 20, legend_y + 15), radius=4, fill=fill, outline=border, width=2)
-        draw.text((lx + 30, legend_y - 2), label, fill=COLORS['text_secondary'], font=get_font(11))
-        lx += 180
+    # Legend
+    legend_y = bottom + 30
+    draw.text((ERD_MARGIN, legend_y), "Migrations:", fill=COLORS['text'], font=get_font(12, bold=True))
+    for i, (source, (fill, border)) in enumerate(groups.items()):
+        lx = ERD_MARGIN + 110 + (i % 4) * 300
+        ly = legend_y + (i // 4) * 26
+        draw.rounded_rectangle((lx, ly - 3, lx + 20, ly + 17), radius=4, fill=fill, outline=border, width=2)
+        draw.text((lx + 30, ly), os.path.splitext(source)[0], fill=COLORS['text_secondary'], font=get_font(11))
 
     # Cardinality note
-    draw.text((50, height - 50), "All relationships show primary key → foreign key direction. Multi-tenant isolation via organization_id.",
+    implicit = ' and '.join(ERD_IMPLICIT_TABLES)
+    draw.text((ERD_MARGIN, height - 40), "All relationships show primary key → foreign key direction. "
+              f"References to {implicit} (tenant_id, created_by, ...) are omitted.",
               fill=COLORS['text_secondary'], font=get_font(11))
 
     return img
 
+create_erd_diagram.inputs = lambda: migration_paths(MIGRATIONS_DIR)
+
+GENERATORS = collect(globals())
+
 def main():
     """Generate all technical diagrams"""
+    args = parse_args(__doc__)
+    if args.profile:
+        profiling.instrument(globals())
+
     print("Generating Professional Technical Diagrams...")
     print("=" * 50)
 
-    diagrams = [
-        ("architecture_diagram.png", create_architecture_diagram),
-        ("erd_diagram.png", create_erd_diagram),
-    ]
-
-    for filename, generator in diagrams:
-        try:
-            img = generator()
-            filepath = os.path.join(OUTPUT_DIR, filename)
-            img.save(filepath, 'PNG', quality=95)
-            print(f"  Generated: {filename}")
-        except Exception as e:
-            print(f"  ERROR: {filename} - {e}")
-            import traceback
-            traceback.print_exc()
+    failed = 0
+    for result in build_outputs(GENERATORS, OUTPUT_DIR, jobs=args.jobs,
+                                force=args.force, font_paths=FONT_PATHS,
+                                formats=args.formats, quality=args.quality):
+        if result.error:
+            failed += 1
+            print(f"  ERROR: {result.filename} - {result.error}")
+            print(result.traceback, end='', file=sys.stderr)
+            continue
+        if result.skipped:
+            print(f"  Unchanged: {result.filename}")
+            continue
+        details = describe(result)
+        print(f"  Generated: {result.filename}" + (f" ({details})" if details else ""))
 
     print("=" * 50)
-    print(f"All diagrams generated in: {OUTPUT_DIR}")
+    if failed:
+        print(f"{len(GENERATORS) - failed} of {len(GENERATORS)} diagrams generated in: {OUTPUT_DIR}, "
+              f"{failed} failed")
+    else:
+        print(f"All diagrams generated in: {OUTPUT_DIR}")
+    if args.jobs == 1:
+        print_font_cache_info()
+    if args.profile:
+        profiling.print_report()
+    if args.watch:
+        watch(__file__, OUTPUT_DIR, font_paths=FONT_PATHS, formats=args.formats,
+              quality=args.quality)
+    elif failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -2,17 +2,46 @@
 """
 Professional Wireframe Generator for TeamACE CRM-ERP Phase 1 SRS
 Creates high-quality, modern UI wireframes using Pillow
+
+Screens declared in YAML under screens/ need PyYAML (pip install pyyaml);
+without it they are reported and skipped and every other screen is built.
+
+Only the spec screens and the dashboard are laid out with wireframe_kit.layout
+and follow the content width. The other generators place their widgets at
+hand-picked offsets from content_x (filter rows, stat strips, kanban columns,
+form fields), so changing WIDTH moves their right-aligned buttons and
+stretches their tables but does not reflow them.
 """
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import os
+import sys
+import traceback
+
+from wireframe_kit import profiling
+from wireframe_kit.build import build_outputs, describe, parse_args
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.fonts import HELVETICA, get_font, print_font_cache_info
+from wireframe_kit.layout import column, row, spacer
+from wireframe_kit.registry import collect, generates
+from wireframe_kit.schema import migration_paths
+from wireframe_kit.screens import Frame, load_screen, load_screens, spec_name, spec_paths
+from wireframe_kit.seeds import Volume, load_seeds
+from wireframe_kit.sprites import print_sprite_cache_info, sprite
+from wireframe_kit.viewport import range_label, scrollbar, window
+from wireframe_kit.watch import watch
 
 # Configuration
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATHS = (HELVETICA,)
+SCREENS_DIR = os.path.join(OUTPUT_DIR, 'screens')
+MIGRATIONS_DIR = os.path.normpath(os.path.join(OUTPUT_DIR, '..', '..', 'backend', 'migrations'))
 WIDTH = 1200
 HEIGHT = 800
 MOBILE_WIDTH = 400
 MOBILE_HEIGHT = 800
+SIDEBAR_WIDTH = 220
+HEADER_HEIGHT = 64
+PAGINATION_HEIGHT = 32
 
 # Professional Color Palette
 COLORS = {
@@ -53,7 +82,7 @@ def create_shadow(draw, coords, radius=8, blur=5, color='#00000015'):
     """Create a soft shadow effect"""
     x1, y1, x2, y2 = coords
     shadow_coords = (x1+3, y1+3, x2+3, y2+3)
-    draw.rounded_rectangle(shadow_coords, radius=radius, fill=color)
+    draw.shadow(shadow_coords, radius=radius, blur=blur, color=color)
 
 def draw_card(draw, x, y, width, height, title=None, shadow=True):
     """Draw a professional card with optional shadow"""
@@ -68,15 +97,7 @@ def draw_card(draw, x, y, width, height, title=None, shadow=True):
         draw.line((x, y+40, x+width, y+40), fill=COLORS['border'], width=1)
         draw.text((x+16, y+12), title, fill=COLORS['text'], font=get_font(14, bold=True))
 
-def get_font(size=12, bold=False):
-    """Get system font with fallback"""
-    try:
-        if bold:
-            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-    except:
-        return ImageFont.load_default()
-
+@sprite
 def draw_button(draw, x, y, text, width=100, height=36, primary=False, success=False, danger=False, outline=False):
     """Draw a modern button"""
     if primary:
@@ -126,6 +147,7 @@ def draw_dropdown(draw, x, y, text="Select...", width=150, height=36):
     arrow_y = y + height // 2
     draw.polygon([(arrow_x, arrow_y-3), (arrow_x+8, arrow_y-3), (arrow_x+4, arrow_y+3)], fill=COLORS['text_secondary'])
 
+@sprite
 def draw_badge(draw, x, y, text, color='primary', small=False):
     """Draw a status badge"""
     colors = {
@@ -157,6 +179,7 @@ def draw_icon_placeholder(draw, x, y, size=20, filled=False):
     else:
         draw.ellipse((x, y, x+size, y+size), fill=None, outline=COLORS['text_secondary'], width=2)
 
+@sprite
 def draw_avatar(draw, x, y, size=40, initials="JD"):
     """Draw a user avatar"""
     draw.ellipse((x, y, x+size, y+size), fill=COLORS['primary'])
@@ -168,7 +191,7 @@ def draw_avatar(draw, x, y, size=40, initials="JD"):
 
 def draw_sidebar(draw, width, height, active_item=0):
     """Draw the application sidebar"""
-    sidebar_width = 220
+    sidebar_width = SIDEBAR_WIDTH
 
     # Sidebar background
     draw.rectangle((0, 0, sidebar_width, height), fill=COLORS['sidebar'])
@@ -212,7 +235,7 @@ def draw_sidebar(draw, width, height, active_item=0):
 
     return sidebar_width
 
-def draw_header(draw, x, y, width, height=64):
+def draw_header(draw, x, y, width, height=HEADER_HEIGHT):
     """Draw the top header bar"""
     draw.rectangle((x, y, x+width, y+height), fill=COLORS['white'])
     draw.line((x, y+height, x+width, y+height), fill=COLORS['border'], width=1)
@@ -236,6 +259,33 @@ def draw_header(draw, x, y, width, height=64):
     # User name
     draw.text((right_x + 90, y + 24), "Gawie V", fill=COLORS['text'], font=get_font(13))
 
+# Pre-recorded chrome tiles, keyed by layer and canvas geometry
+_chrome_cache = {}
+
+def get_chrome_layer(key, size, painter):
+    """Return a cached chrome tile, recording it with painter(draw) on first use"""
+    tile = _chrome_cache.get(key)
+    if tile is None:
+        tile = DisplayList(size[0], size[1], COLORS['bg'])
+        painter(tile)
+        _chrome_cache[key] = tile
+    return tile
+
+def draw_chrome(img, active_item=0):
+    """Paste the cached sidebar and header tiles into a desktop canvas"""
+    width, height = img.size
+
+    sidebar = get_chrome_layer(('sidebar', height, active_item), (SIDEBAR_WIDTH + 1, height),
+                               lambda d: draw_sidebar(d, SIDEBAR_WIDTH + 1, height, active_item))
+    img.paste(sidebar, (0, 0))
+
+    header_width = width - SIDEBAR_WIDTH
+    header = get_chrome_layer(('header', header_width), (header_width, HEADER_HEIGHT + 1),
+                              lambda d: draw_header(d, 0, 0, header_width))
+    img.paste(header, (SIDEBAR_WIDTH, 0))
+
+    return SIDEBAR_WIDTH
+
 def draw_page_header(draw, x, y, width, title, subtitle=None, buttons=None):
     """Draw a page header with title and action buttons"""
     font_title = get_font(24, bold=True)
@@ -251,13 +301,23 @@ def draw_page_header(draw, x, y, width, title, subtitle=None, buttons=None):
             btn_x -= btn_width + 12
             draw_button(draw, btn_x, y, btn_text, width=btn_width, height=36, primary=is_primary)
 
-def draw_table(draw, x, y, width, headers, rows, col_widths=None):
-    """Draw a professional data table"""
+def draw_table(draw, x, y, width, headers, rows, col_widths=None, height=None, first=0, total=None,
+               footer=None):
+    """Draw a professional data table with only the rows that fit its viewport
+
+    rows may be any iterable. height bounds the table (default: the canvas
+    bottom); when more rows exist than fit, a scrollbar shows the window, and
+    footer names them for a pagination footer along the bottom.
+    """
     row_height = 48
     header_height = 44
 
     if col_widths is None:
         col_widths = [width // len(headers)] * len(headers)
+    if height is None:
+        height = draw.height - y
+    body_height = height - (PAGINATION_HEIGHT + 16 if footer else 0)
+    view = window(rows, first, max((body_height - header_height) // row_height, 0), total)
 
     # Header
     draw.rounded_rectangle((x, y, x+width, y+header_height), radius=8, fill=COLORS['bg'])
@@ -270,10 +330,10 @@ def draw_table(draw, x, y, width, headers, rows, col_widths=None):
 
     # Rows
     row_y = y + header_height
-    for row_idx, row in enumerate(rows):
-        bg_color = COLORS['white'] if row_idx % 2 == 0 else COLORS['bg']
+    for row_idx, row in enumerate(view.rows):
+        bg_color = COLORS['white'] if (view.first + row_idx) % 2 == 0 else COLORS['bg']
 
-        if row_idx == len(rows) - 1:
+        if row_idx == len(view.rows) - 1:
             # Last row with rounded corners
             draw.rounded_rectangle((x, row_y, x+width, row_y+row_height), radius=8, fill=bg_color)
             draw.rectangle((x, row_y, x+width, row_y+8), fill=bg_color)
@@ -293,11 +353,30 @@ def draw_table(draw, x, y, width, headers, rows, col_widths=None):
         row_y += row_height
 
     # Border
-    total_height = header_height + (row_height * len(rows))
+    total_height = header_height + (row_height * len(view.rows))
     draw.rounded_rectangle((x, y, x+width, y+total_height), radius=8, fill=None, outline=COLORS['border'])
 
+    # Scrollbar
+    track_x = x + width - 10
+    track_y = y + header_height + 4
+    thumb = scrollbar(track_y, total_height - header_height - 8, view.first, len(view.rows), view.total)
+    if thumb:
+        draw.rounded_rectangle((track_x, track_y, track_x+6, y+total_height-4), radius=3, fill=COLORS['border_light'])
+        draw.rounded_rectangle((track_x, thumb[0], track_x+6, thumb[0]+thumb[1]), radius=3, fill=COLORS['text_light'])
+
+    if footer:
+        draw_pagination(draw, x, y + height - PAGINATION_HEIGHT, width, view, footer)
+        return height
     return total_height
 
+def draw_pagination(draw, x, y, width, view, noun):
+    """Draw the row range of a table window with Previous / Next buttons"""
+    draw.text((x, y + 4), range_label(view, noun), fill=COLORS['text_secondary'], font=get_font(12))
+    has_next = view.first + len(view.rows) < view.total
+    draw_button(draw, x + width - 180, y, "Previous", width=80, height=PAGINATION_HEIGHT)
+    draw_button(draw, x + width - 90, y, "Next", width=80, height=PAGINATION_HEIGHT, primary=has_next)
+
+@sprite
 def draw_stat_card(draw, x, y, width, height, label, value, trend=None, trend_up=True):
     """Draw a statistics card"""
     draw_card(draw, x, y, width, height)
@@ -310,14 +389,16 @@ def draw_stat_card(draw, x, y, width, height, label, value, trend=None, trend_up
         arrow = "+" if trend_up else "-"
         draw.text((x+20, y+height-28), f"{arrow}{trend}", fill=trend_color, font=get_font(12, bold=True))
 
-def draw_kanban_column(draw, x, y, width, height, title, count, value, cards):
+@sprite
+def draw_kanban_column(draw, x, y, width, height, title, count, value, cards, unit="deals"):
     """Draw a kanban column with cards"""
     # Column header
     draw.rounded_rectangle((x, y, x+width, y+50), radius=8, fill=COLORS['bg'])
     draw.rectangle((x, y+42, x+width, y+50), fill=COLORS['bg'])
 
     draw.text((x+12, y+8), title, fill=COLORS['text'], font=get_font(13, bold=True))
-    draw.text((x+12, y+28), f"{count} deals - {value}", fill=COLORS['text_secondary'], font=get_font(11))
+    summary = f"{count} {unit} - {value}" if value else f"{count} {unit}"
+    draw.text((x+12, y+28), summary, fill=COLORS['text_secondary'], font=get_font(11))
 
     # Cards
     card_y = y + 60
@@ -331,18 +412,73 @@ def draw_kanban_column(draw, x, y, width, height, title, count, value, cards):
 
         card_y += card_height + 8
 
+def draw_label(draw, x, y, text, color='text', size=12, bold=False):
+    """Draw a line of text in a palette color"""
+    draw.text((x, y), text, fill=COLORS[color], font=get_font(size, bold=bold))
+
+def draw_checkbox(draw, x, y, size=20):
+    """Draw an unticked round checkbox"""
+    draw.ellipse((x, y, x+size, y+size), fill=None, outline=COLORS['border'], width=2)
+
+def draw_tabs(draw, x, y, tabs, active=0):
+    """Draw a row of (label, count) filter pills"""
+    tab_x = x
+    for i, (tab, count) in enumerate(tabs):
+        is_active = i == active
+        bg = COLORS['primary'] if is_active else COLORS['bg']
+        fg = COLORS['white'] if is_active else COLORS['text']
+        text = f"{tab} ({count})"
+        text_width = len(text) * 8 + 24
+        draw.rounded_rectangle((tab_x, y, tab_x + text_width, y + 32), radius=16, fill=bg)
+        draw.text((tab_x + 12, y + 8), text, fill=fg, font=get_font(12))
+        tab_x += text_width + 12
+
+def draw_task_card(draw, x, y, width, title, related, priority, badge_color):
+    """Draw a task with its checkbox, related record and priority badge"""
+    draw_card(draw, x, y, width, 72)
+
+    # Checkbox
+    draw.ellipse((x + 20, y + 24, x + 40, y + 44), fill=None, outline=COLORS['border'], width=2)
+
+    draw.text((x + 56, y + 16), title, fill=COLORS['text'], font=get_font(13, bold=True))
+    draw.text((x + 56, y + 40), related, fill=COLORS['text_secondary'], font=get_font(11))
+
+    draw_badge(draw, x + width - 80, y + 24, priority, badge_color)
+
+def draw_approval_card(draw, x, y, width, title, desc, requester, time, color):
+    """Draw a pending approval with Reject / Approve buttons"""
+    draw_card(draw, x, y, width, 120)
+
+    # Icon placeholder
+    draw.rounded_rectangle((x + 20, y + 20, x + 60, y + 60), radius=8, fill=COLORS[f'{color}_light'])
+    draw.ellipse((x + 30, y + 30, x + 50, y + 50), fill=None, outline=COLORS[color], width=2)
+
+    # Content
+    draw_badge(draw, x + 76, y + 20, title, color, small=True)
+    draw.text((x + width - 100, y + 20), time, fill=COLORS['text_light'], font=get_font(11))
+
+    draw.text((x + 76, y + 46), desc, fill=COLORS['text'], font=get_font(13))
+    draw.text((x + 76, y + 70), f"Requested by: {requester}", fill=COLORS['text_secondary'], font=get_font(12))
+
+    # Action buttons
+    btn_y = y + 76
+    draw_button(draw, x + width - 200, btn_y, "Reject", width=80, height=28, outline=True)
+    draw_button(draw, x + width - 100, btn_y, "Approve", width=80, height=28, success=True)
+
+def new_canvas(width, height):
+    """Create a display list canvas; it also serves as its own draw surface"""
+    canvas = DisplayList(width, height, COLORS['bg'])
+    return canvas, canvas
+
 # ============ Wireframe Generators ============
 
+@generates("01_global_layout.png", "shell", "desktop")
 def create_layout_wireframe():
     """D.1 Global Navigation & Layout"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
     # Sidebar
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=0)
-
-    # Header
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=0)
 
     # Main content area
     content_x = sidebar_width + 32
@@ -361,13 +497,12 @@ def create_layout_wireframe():
 
     return img
 
+@generates("02_client_list.png", "crm", "desktop")
 def create_client_list_wireframe():
     """D.2.1 Client List Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=1)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=1)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -404,13 +539,12 @@ def create_client_list_wireframe():
 
     return img
 
+@generates("03_client_detail.png", "crm", "desktop")
 def create_client_detail_wireframe():
     """D.2.2 Client Detail Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=1)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=1)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -484,13 +618,12 @@ def create_client_detail_wireframe():
 
     return img
 
+@generates("04_pipeline_kanban.png", "crm", "desktop")
 def create_pipeline_kanban_wireframe():
     """D.3.1 Pipeline Kanban Board"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=2)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=2)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -548,13 +681,12 @@ def create_pipeline_kanban_wireframe():
 
     return img
 
+@generates("05_invoice_list.png", "finance", "desktop")
 def create_invoice_list_wireframe():
     """D.5.1 Invoice List Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=5)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=5)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -601,13 +733,12 @@ def create_invoice_list_wireframe():
 
     return img
 
+@generates("06_invoice_create.png", "finance", "desktop")
 def create_invoice_create_wireframe():
     """D.5.2 Invoice Create Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=5)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=5)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -677,26 +808,31 @@ def create_invoice_create_wireframe():
 
     return img
 
+@generates("07_dashboard.png", "dashboard", "desktop")
 def create_dashboard_wireframe():
     """D.7 Dashboard Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=0)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=0)
 
     content_x = sidebar_width + 32
     content_y = 80
     content_width = WIDTH - sidebar_width - 64
 
+    # Layout: header, four stat cards, then two rows of two cards
+    page = column(
+        spacer(0, height=44),
+        row(*[spacer() for _ in range(4)], key='stats', gap=16, height=100),
+        row(spacer(key='tasks'), spacer(key='activities'), gap=16, height=200),
+        row(spacer(key='pipeline'), spacer(key='aging'), gap=16, height=140),
+        gap=20)
+    page.layout(content_x, content_y, content_width)
+
     # Page header
     draw.text((content_x, content_y), "Dashboard", fill=COLORS['text'], font=get_font(24, bold=True))
     draw.text((content_x, content_y + 32), "Welcome back, Gawie!", fill=COLORS['text_secondary'], font=get_font(13))
 
     # Stat cards
-    stat_y = content_y + 64
-    stat_width = (content_width - 48) // 4
-
     stats = [
         ("Active Clients", "42", "+3", True),
         ("Open Leads", "18", "+5", True),
@@ -704,87 +840,81 @@ def create_dashboard_wireframe():
         ("Outstanding", "N13.15M", "-8%", False),
     ]
 
-    stat_x = content_x
-    for label, value, trend, is_up in stats:
-        draw_stat_card(draw, stat_x, stat_y, stat_width, 100, label, value, trend, is_up)
-        stat_x += stat_width + 16
-
-    # Row 2: Tasks and Activities
-    row2_y = stat_y + 120
-    col_width = (content_width - 16) // 2
+    for box, (label, value, trend, is_up) in zip(page.find('stats').children, stats):
+        draw_stat_card(draw, *box.rect, label, value, trend, is_up)
 
     # Tasks card
-    draw_card(draw, content_x, row2_y, col_width, 200, "My Tasks (5 due today)")
+    x, y, width, height = page.find('tasks').rect
+    draw_card(draw, x, y, width, height, "My Tasks (5 due today)")
     task_items = [
         ("Follow up with Acme on proposal", "High", "danger"),
         ("Review service logs for billing", "Medium", "warning"),
         ("Send payment reminder", "High", "danger"),
     ]
-    task_y = row2_y + 56
+    task_y = y + 56
     for task, priority, color in task_items:
-        draw.ellipse((content_x + 20, task_y + 4, content_x + 32, task_y + 16), fill=None, outline=COLORS['border'], width=2)
-        draw.text((content_x + 44, task_y), task, fill=COLORS['text'], font=get_font(12))
-        draw_badge(draw, content_x + col_width - 80, task_y, priority, color, small=True)
+        draw.ellipse((x + 20, task_y + 4, x + 32, task_y + 16), fill=None, outline=COLORS['border'], width=2)
+        draw.text((x + 44, task_y), task, fill=COLORS['text'], font=get_font(12))
+        draw_badge(draw, x + width - 80, task_y, priority, color, small=True)
         task_y += 36
 
-    draw.text((content_x + 20, row2_y + 172), "View All Tasks >", fill=COLORS['primary'], font=get_font(12))
+    draw.text((x + 20, y + 172), "View All Tasks >", fill=COLORS['primary'], font=get_font(12))
 
     # Activities card
-    draw_card(draw, content_x + col_width + 16, row2_y, col_width, 200, "Recent Activities")
+    x, y, width, height = page.find('activities').rect
+    draw_card(draw, x, y, width, height, "Recent Activities")
     activity_items = [
         "John created Invoice INV-2025-0043",
         "Jane updated Client: Acme Corp",
         "Mike logged activity on Beta Ind.",
         "Sarah submitted leave request",
     ]
-    activity_y = row2_y + 56
+    activity_y = y + 56
     for activity in activity_items:
-        draw.ellipse((content_x + col_width + 36, activity_y + 2, content_x + col_width + 48, activity_y + 14), fill=COLORS['primary_light'])
-        draw.text((content_x + col_width + 60, activity_y), activity, fill=COLORS['text'], font=get_font(12))
+        draw.ellipse((x + 20, activity_y + 2, x + 32, activity_y + 14), fill=COLORS['primary_light'])
+        draw.text((x + 44, activity_y), activity, fill=COLORS['text'], font=get_font(12))
         activity_y += 32
 
-    # Row 3: Pipeline and Aging
-    row3_y = row2_y + 220
-
     # Pipeline summary
-    draw_card(draw, content_x, row3_y, col_width, 140, "Pipeline Summary")
+    x, y, width, height = page.find('pipeline').rect
+    draw_card(draw, x, y, width, height, "Pipeline Summary")
     pipeline_data = [
         ("Qualification", 0.12, "N15M"),
         ("Needs Analysis", 0.26, "N32M"),
         ("Proposal Sent", 0.36, "N45M"),
         ("Negotiation", 0.27, "N33.5M"),
     ]
-    bar_y = row3_y + 56
+    bar_y = y + 56
     for stage, pct, value in pipeline_data:
-        draw.text((content_x + 20, bar_y), stage, fill=COLORS['text_secondary'], font=get_font(11))
-        bar_width = int((col_width - 200) * pct)
-        draw.rounded_rectangle((content_x + 140, bar_y, content_x + 140 + bar_width, bar_y + 16), radius=4, fill=COLORS['primary'])
-        draw.text((content_x + col_width - 60, bar_y), value, fill=COLORS['text'], font=get_font(11))
+        draw.text((x + 20, bar_y), stage, fill=COLORS['text_secondary'], font=get_font(11))
+        bar_width = int((width - 200) * pct)
+        draw.rounded_rectangle((x + 140, bar_y, x + 140 + bar_width, bar_y + 16), radius=4, fill=COLORS['primary'])
+        draw.text((x + width - 60, bar_y), value, fill=COLORS['text'], font=get_font(11))
         bar_y += 24
 
     # Receivables aging
-    draw_card(draw, content_x + col_width + 16, row3_y, col_width, 140, "Receivables Aging")
+    x, y, width, height = page.find('aging').rect
+    draw_card(draw, x, y, width, height, "Receivables Aging")
     aging_data = [
         ("Current:", "N5.2M"),
         ("1-30 Days:", "N3.8M"),
         ("31-60 Days:", "N2.1M"),
         ("60+ Days:", "N2.05M"),
     ]
-    aging_y = row3_y + 56
+    aging_y = y + 56
     for label, value in aging_data:
-        draw.text((content_x + col_width + 36, aging_y), label, fill=COLORS['text_secondary'], font=get_font(12))
-        draw.text((content_x + col_width + 180, aging_y), value, fill=COLORS['text'], font=get_font(12, bold=True))
+        draw.text((x + 20, aging_y), label, fill=COLORS['text_secondary'], font=get_font(12))
+        draw.text((x + 164, aging_y), value, fill=COLORS['text'], font=get_font(12, bold=True))
         aging_y += 24
 
     return img
 
+@generates("08_task_list.png", "tasks", "desktop")
 def create_task_list_wireframe():
     """D.6.1 Task List Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=6)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=6)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -797,16 +927,7 @@ def create_task_list_wireframe():
     # Tab filters
     tab_y = content_y + 52
     tabs = [("All", "24"), ("Open", "8"), ("In Progress", "3"), ("Completed", "13")]
-    tab_x = content_x
-    for i, (tab, count) in enumerate(tabs):
-        is_active = i == 1
-        bg = COLORS['primary'] if is_active else COLORS['bg']
-        fg = COLORS['white'] if is_active else COLORS['text']
-        text = f"{tab} ({count})"
-        text_width = len(text) * 8 + 24
-        draw.rounded_rectangle((tab_x, tab_y, tab_x + text_width, tab_y + 32), radius=16, fill=bg)
-        draw.text((tab_x + 12, tab_y + 8), text, fill=fg, font=get_font(12))
-        tab_x += text_width + 12
+    draw_tabs(draw, content_x, tab_y, tabs, active=1)
 
     # Task groups
     group_y = tab_y + 52
@@ -822,17 +943,8 @@ def create_task_list_wireframe():
     ]
 
     for title, related, priority in today_tasks:
-        draw_card(draw, content_x, group_y, content_width, 72)
-
-        # Checkbox
-        draw.ellipse((content_x + 20, group_y + 24, content_x + 40, group_y + 44), fill=None, outline=COLORS['border'], width=2)
-
-        draw.text((content_x + 56, group_y + 16), title, fill=COLORS['text'], font=get_font(13, bold=True))
-        draw.text((content_x + 56, group_y + 40), related, fill=COLORS['text_secondary'], font=get_font(11))
-
         badge_color = "danger" if priority == "High" else "warning"
-        draw_badge(draw, content_x + content_width - 80, group_y + 24, priority, badge_color)
-
+        draw_task_card(draw, content_x, group_y, content_width, title, related, priority, badge_color)
         group_y += 84
 
     # This Week section
@@ -854,13 +966,12 @@ def create_task_list_wireframe():
 
     return img
 
+@generates("09_approval_queue.png", "tasks", "desktop")
 def create_approval_queue_wireframe():
     """D.6.2 Approval Queue Screen"""
-    img = Image.new('RGB', (WIDTH, HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(WIDTH, HEIGHT)
 
-    sidebar_width = draw_sidebar(draw, WIDTH, HEIGHT, active_item=6)
-    draw_header(draw, sidebar_width, 0, WIDTH - sidebar_width)
+    sidebar_width = draw_chrome(img, active_item=6)
 
     content_x = sidebar_width + 32
     content_y = 80
@@ -880,32 +991,15 @@ def create_approval_queue_wireframe():
     ]
 
     for title, desc, requester, time, color in approvals:
-        draw_card(draw, content_x, card_y, content_width, 120)
-
-        # Icon placeholder
-        draw.rounded_rectangle((content_x + 20, card_y + 20, content_x + 60, card_y + 60), radius=8, fill=COLORS[f'{color}_light'])
-        draw.ellipse((content_x + 30, card_y + 30, content_x + 50, card_y + 50), fill=None, outline=COLORS[color], width=2)
-
-        # Content
-        draw_badge(draw, content_x + 76, card_y + 20, title, color, small=True)
-        draw.text((content_x + content_width - 100, card_y + 20), time, fill=COLORS['text_light'], font=get_font(11))
-
-        draw.text((content_x + 76, card_y + 46), desc, fill=COLORS['text'], font=get_font(13))
-        draw.text((content_x + 76, card_y + 70), f"Requested by: {requester}", fill=COLORS['text_secondary'], font=get_font(12))
-
-        # Action buttons
-        btn_y = card_y + 76
-        draw_button(draw, content_x + content_width - 200, btn_y, "Reject", width=80, height=28, outline=True)
-        draw_button(draw, content_x + content_width - 100, btn_y, "Approve", width=80, height=28, success=True)
-
+        draw_approval_card(draw, content_x, card_y, content_width, title, desc, requester, time, color)
         card_y += 136
 
     return img
 
+@generates("10_mobile_view.png", "mobile")
 def create_mobile_wireframe():
     """D.8 Mobile Responsive View"""
-    img = Image.new('RGB', (MOBILE_WIDTH, MOBILE_HEIGHT), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(MOBILE_WIDTH, MOBILE_HEIGHT)
 
     # Mobile header
     draw.rectangle((0, 0, MOBILE_WIDTH, 56), fill=COLORS['sidebar'])
@@ -982,36 +1076,410 @@ def create_mobile_wireframe():
 
     return img
 
+# ============ Seed-filled Screens ============
+
+# The seed rows are repeated up to these counts to render at production-like volumes
+SEED_VOLUMES = {
+    'clients': 1200,
+    'leads': 300,
+    'invoices': 4800,
+    'tasks': 600,
+}
+
+# Badge color of each status and priority value in the seeds
+SEED_BADGES = {
+    'active': 'success',
+    'prospect': 'warning',
+    'inactive': 'light',
+    'paid': 'success',
+    'partial': 'warning',
+    'sent': 'info',
+    'draft': 'light',
+    'overdue': 'danger',
+    'urgent': 'danger',
+    'high': 'danger',
+    'medium': 'warning',
+    'low': 'info',
+}
+
+_seeds = None
+
+def get_seeds():
+    """Seed rows of the backend migrations, parsed once per process"""
+    global _seeds
+    if _seeds is None:
+        _seeds = load_seeds(MIGRATIONS_DIR, cache_dir=OUTPUT_DIR)
+    return _seeds
+
+def seed_inputs():
+    """Migrations the seed-filled screens read"""
+    return migration_paths(MIGRATIONS_DIR)
+
+def seed_volume(table):
+    """The seed rows of table repeated up to its SEED_VOLUMES count"""
+    return Volume(get_seeds().records(table), SEED_VOLUMES[table])
+
+def seed_users(short=False):
+    """Seed user names by id, as 'Sales Manager' or 'Sales M.'"""
+    return {user.id: f"{user.first_name} {user.last_name[:1]}." if short else f"{user.first_name} {user.last_name}"
+            for user in get_seeds().records('users')}
+
+def naira(amount, short=False):
+    """Format an amount as N2,500,000, or as N2.5M when short"""
+    if short:
+        for unit, size in (("B", 1_000_000_000), ("M", 1_000_000)):
+            if amount >= size:
+                return f"N{amount / size:,.1f}".removesuffix(".0") + unit
+    return f"N{amount:,.0f}"
+
+def humanize(value):
+    """'in_progress' as 'In Progress'"""
+    return str(value or "—").replace('_', ' ').title()
+
+def short_date(value):
+    """'2024-09-05 17:00:00' as 'Sep 5'"""
+    months = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+    if not isinstance(value, str) or len(value) < 10:
+        return "—"
+    return f"{months[int(value[5:7]) - 1]} {int(value[8:10])}"
+
+@generates("seed_02_client_list.png", "seed", "crm", "desktop")
+def create_seeded_client_list_wireframe():
+    """D.2.1 Client List Screen filled from the seed migrations"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+
+    sidebar_width = draw_chrome(img, active_item=1)
+
+    content_x = sidebar_width + 32
+    content_y = 80
+    content_width = WIDTH - sidebar_width - 64
+
+    draw_page_header(draw, content_x, content_y, content_width, "Clients",
+                     "Manage your client relationships", [("+ New Client", True), ("Export", False)])
+
+    filter_y = content_y + 56
+    draw_input(draw, content_x, filter_y, "Search clients...", width=280)
+    draw_dropdown(draw, content_x + 300, filter_y, "Type: All", width=140)
+    draw_dropdown(draw, content_x + 460, filter_y, "Tier: All", width=140)
+
+    table_y = filter_y + 56
+    headers = ["Company Name", "Industry", "Status", "Tier", "Account Mgr", ""]
+    col_widths = [220, 160, 100, 120, 160, 60]
+    clients = seed_volume('clients')
+    users = seed_users()
+    rows = ([client.company_name, client.industry,
+             (humanize(client.client_type), SEED_BADGES.get(client.client_type, 'light')),
+             humanize(client.client_tier), users.get(client.created_by, "—"), "..."] for client in clients)
+    draw_table(draw, content_x, table_y, content_width, headers, rows, col_widths,
+               height=HEIGHT - 32 - table_y, total=len(clients), footer="clients")
+
+    return img
+
+create_seeded_client_list_wireframe.inputs = seed_inputs
+
+@generates("seed_04_pipeline_kanban.png", "seed", "crm", "desktop")
+def create_seeded_pipeline_kanban_wireframe():
+    """D.3.1 Pipeline Kanban Board filled from the seed migrations"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+
+    sidebar_width = draw_chrome(img, active_item=2)
+
+    content_x = sidebar_width + 32
+    content_y = 80
+    content_width = WIDTH - sidebar_width - 64
+
+    draw_page_header(draw, content_x, content_y, content_width, "Sales Pipeline",
+                     None, [("+ New Opportunity", True), ("Filter", False)])
+
+    # Count and value of every stage, then its first three distinct leads as cards
+    stages = sorted(get_seeds().records('pipeline_stages'), key=lambda stage: stage.position)
+    columns = {stage.id: [0, 0, []] for stage in stages}
+    owners = seed_users(short=True)
+    weighted = unweighted = 0
+    leads = seed_volume('leads')
+    for lead, times in leads.repeats():
+        value = lead.estimated_value or 0
+        weighted += times * value * (lead.probability or 0) / 100
+        unweighted += times * value
+        if lead.pipeline_stage_id in columns:
+            columns[lead.pipeline_stage_id][0] += times
+            columns[lead.pipeline_stage_id][1] += times * value
+    # Each seed lead is one card; the repeats behind the counts would draw it again
+    for lead in leads.seeds[:len(leads)]:
+        stage_column = columns.get(lead.pipeline_stage_id)
+        if stage_column and len(stage_column[2]) < 3:
+            stage_column[2].append({"title": lead.company_name,
+                                    "value": naira(lead.estimated_value or 0, short=True),
+                                    "owner": owners.get(lead.assigned_to, "—")})
+
+    stat_y = content_y + 48
+    draw_card(draw, content_x, stat_y, content_width, 50)
+
+    stats_text = [
+        ("Total Weighted:", naira(weighted, short=True), COLORS['primary']),
+        ("Unweighted:", naira(unweighted, short=True), COLORS['text']),
+        ("Opportunities:", f"{len(leads):,}", COLORS['text']),
+    ]
+    stat_x = content_x + 24
+    for label, value, color in stats_text:
+        draw.text((stat_x, stat_y + 10), label, fill=COLORS['text_secondary'], font=get_font(12))
+        draw.text((stat_x, stat_y + 28), value, fill=color, font=get_font(14, bold=True))
+        stat_x += 200
+
+    kanban_y = stat_y + 70
+    col_width = (content_width - 48) // max(len(stages), 1)
+    col_height = HEIGHT - kanban_y - 32
+
+    col_x = content_x
+    for stage in stages:
+        count, value, cards = columns[stage.id]
+        # an empty stage shows its count alone
+        draw_kanban_column(draw, col_x, kanban_y, col_width - 8, col_height, stage.name, f"{count:,}",
+                           naira(value, short=True) if count else None, cards)
+        col_x += col_width + 8
+
+    return img
+
+create_seeded_pipeline_kanban_wireframe.inputs = seed_inputs
+
+@generates("seed_05_invoice_list.png", "seed", "finance", "desktop")
+def create_seeded_invoice_list_wireframe():
+    """D.5.1 Invoice List Screen filled from the seed migrations"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+
+    sidebar_width = draw_chrome(img, active_item=5)
+
+    content_x = sidebar_width + 32
+    content_y = 80
+    content_width = WIDTH - sidebar_width - 64
+
+    draw_page_header(draw, content_x, content_y, content_width, "Invoices",
+                     "Manage billing and payments", [("+ New Invoice", True)])
+
+    filter_y = content_y + 56
+    draw_input(draw, content_x, filter_y, "Search invoices...", width=280)
+    draw_dropdown(draw, content_x + 300, filter_y, "Status: All", width=140)
+    draw_dropdown(draw, content_x + 460, filter_y, "Client: All", width=180)
+
+    # Table, leaving room for the summary card below it
+    table_y = filter_y + 56
+    summary_height = 60
+    headers = ["Invoice #", "Client", "Amount", "Status", "Due Date", ""]
+    col_widths = [150, 220, 150, 100, 120, 60]
+    invoices = seed_volume('invoices')
+    clients = get_seeds().by_id('clients')
+    rows = ([invoice.invoice_number,
+             clients[invoice.client_id].company_name if invoice.client_id in clients else "—",
+             naira(invoice.total_amount or 0),
+             (humanize(invoice.status), SEED_BADGES.get(invoice.status, 'light')),
+             short_date(invoice.due_date), "..."] for invoice in invoices)
+    table_height = draw_table(draw, content_x, table_y, content_width, headers, rows, col_widths,
+                              height=HEIGHT - 32 - summary_height - 24 - table_y, total=len(invoices),
+                              footer="invoices")
+
+    total = sum((invoice.total_amount or 0) * times for invoice, times in invoices.repeats())
+    paid = sum((invoice.paid_amount or 0) * times for invoice, times in invoices.repeats())
+
+    summary_y = table_y + table_height + 24
+    draw_card(draw, content_x, summary_y, content_width, summary_height)
+
+    summaries = [
+        ("Total:", naira(total)),
+        ("Paid:", naira(paid)),
+        ("Outstanding:", naira(total - paid)),
+    ]
+    sum_x = content_x + 24
+    for label, value in summaries:
+        draw.text((sum_x, summary_y + 14), label, fill=COLORS['text_secondary'], font=get_font(12))
+        draw.text((sum_x, summary_y + 34), value, fill=COLORS['text'], font=get_font(14, bold=True))
+        sum_x += 200
+
+    return img
+
+create_seeded_invoice_list_wireframe.inputs = seed_inputs
+
+@generates("seed_08_task_list.png", "seed", "tasks", "desktop")
+def create_seeded_task_list_wireframe():
+    """D.6.1 Task List Screen filled from the seed migrations"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+
+    sidebar_width = draw_chrome(img, active_item=6)
+
+    content_x = sidebar_width + 32
+    content_y = 80
+    content_width = WIDTH - sidebar_width - 64
+
+    draw_page_header(draw, content_x, content_y, content_width, "My Tasks",
+                     None, [("+ New Task", True), ("Sort", False), ("Filter", False)])
+
+    tasks = seed_volume('tasks')
+    counts = {}
+    for task, times in tasks.repeats():
+        counts[task.status] = counts.get(task.status, 0) + times
+
+    tab_y = content_y + 52
+    tabs = [("All", f"{len(tasks):,}"), ("Open", f"{counts.get('pending', 0):,}"),
+            ("In Progress", f"{counts.get('in_progress', 0):,}"),
+            ("Completed", f"{counts.get('completed', 0):,}")]
+    draw_tabs(draw, content_x, tab_y, tabs, active=1)
+
+    # Open tasks, only as many as fit
+    group_y = tab_y + 52
+    draw.text((content_x, group_y), f"OPEN ({counts.get('pending', 0):,})", fill=COLORS['text_secondary'],
+              font=get_font(12, bold=True))
+    group_y += 28
+
+    clients = get_seeds().by_id('clients')
+    open_tasks = (task for task in tasks if task.status == 'pending')
+    view = window(open_tasks, 0, (HEIGHT - 32 - group_y + 12) // 84, counts.get('pending', 0))
+    for task in view.rows:
+        client = clients.get(task.client_id)
+        related = f"Client: {client.company_name}" if client else task.description or ""
+        draw_task_card(draw, content_x, group_y, content_width, task.title,
+                       f"{related} - Due {short_date(task.due_date)}", humanize(task.priority),
+                       SEED_BADGES.get(task.priority, 'light'))
+        group_y += 84
+
+    return img
+
+create_seeded_task_list_wireframe.inputs = seed_inputs
+
+@generates("seed_09_approval_queue.png", "seed", "tasks", "desktop")
+def create_seeded_approval_queue_wireframe():
+    """D.6.2 Approval Queue Screen filled from the seed migrations"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+
+    sidebar_width = draw_chrome(img, active_item=6)
+
+    content_x = sidebar_width + 32
+    content_y = 80
+    content_width = WIDTH - sidebar_width - 64
+
+    # Unpaid invoices wait for approval
+    invoices = seed_volume('invoices')
+    pending = sum(times for invoice, times in invoices.repeats() if invoice.status != 'paid')
+
+    draw_page_header(draw, content_x, content_y, content_width, "Pending Approvals",
+                     f"You have {pending:,} pending approvals", [("Refresh", False)])
+
+    card_y = content_y + 64
+    clients = get_seeds().by_id('clients')
+    users = seed_users()
+    approvals = (invoice for invoice in invoices if invoice.status != 'paid')
+    view = window(approvals, 0, (HEIGHT - 32 - card_y + 16) // 136, pending)
+    for invoice in view.rows:
+        client = clients.get(invoice.client_id)
+        desc = f"Invoice {invoice.invoice_number} for {client.company_name if client else '—'} - " \
+               f"{naira(invoice.total_amount or 0)}"
+        draw_approval_card(draw, content_x, card_y, content_width, "INVOICE APPROVAL", desc,
+                           users.get(invoice.created_by, "—"), short_date(invoice.invoice_date), "info")
+        card_y += 136
+
+    return img
+
+create_seeded_approval_queue_wireframe.inputs = seed_inputs
+
+# ============ Spec-driven Screens ============
+
+# Helpers that replay the widgets of a compiled screen spec
+SCREEN_WIDGETS = {
+    'page_header': draw_page_header,
+    'input': draw_input,
+    'dropdown': draw_dropdown,
+    'button': draw_button,
+    'badge': draw_badge,
+    'label': draw_label,
+    'checkbox': draw_checkbox,
+    'card': draw_card,
+    'stat_card': draw_stat_card,
+    'table': draw_table,
+    'kanban_column': draw_kanban_column,
+}
+
+SCREEN_FRAME = Frame(SIDEBAR_WIDTH + 32, 80, WIDTH - SIDEBAR_WIDTH - 64, HEIGHT - 32)
+
+def render_screen(screen):
+    """Draw a compiled screen spec inside the application chrome"""
+    img, draw = new_canvas(WIDTH, HEIGHT)
+    draw_chrome(img, active_item=screen.nav)
+    for kind, args in screen.widgets:
+        SCREEN_WIDGETS[kind](draw, **args)
+    return img
+
+class SpecScreen:
+    """Generator for a screen declared in a spec file under screens/"""
+
+    def __init__(self, path):
+        self.path = path
+        self.__name__ = f"create_{spec_name(path).split('_', 1)[-1]}_wireframe"
+
+    def inputs(self):
+        return [self.path]
+
+    def __call__(self):
+        return render_screen(load_screen(self.path, SCREEN_FRAME))
+
+def spec_generators():
+    """(filename, generator) entries for every spec in SCREENS_DIR"""
+    if not os.path.isdir(SCREENS_DIR):
+        return []
+    specs = [generates(f"{spec_name(path)}.png", "spec", "desktop")(SpecScreen(path))
+             for path in spec_paths(SCREENS_DIR)]
+    return [(spec.output.filename, spec) for spec in specs]
+
+GENERATORS = collect(globals()) + spec_generators()
+
 def main():
     """Generate all professional wireframes"""
+    args = parse_args(__doc__)
+    if args.profile:
+        profiling.instrument(globals())
+
     print("Generating Professional TeamACE CRM-ERP Phase 1 Wireframes...")
     print("=" * 60)
 
-    wireframes = [
-        ("01_global_layout.png", create_layout_wireframe),
-        ("02_client_list.png", create_client_list_wireframe),
-        ("03_client_detail.png", create_client_detail_wireframe),
-        ("04_pipeline_kanban.png", create_pipeline_kanban_wireframe),
-        ("05_invoice_list.png", create_invoice_list_wireframe),
-        ("06_invoice_create.png", create_invoice_create_wireframe),
-        ("07_dashboard.png", create_dashboard_wireframe),
-        ("08_task_list.png", create_task_list_wireframe),
-        ("09_approval_queue.png", create_approval_queue_wireframe),
-        ("10_mobile_view.png", create_mobile_wireframe),
-    ]
-
-    for filename, generator in wireframes:
-        try:
-            img = generator()
-            filepath = os.path.join(OUTPUT_DIR, filename)
-            img.save(filepath, 'PNG', quality=95)
-            print(f"  Generated: {filename}")
-        except Exception as e:
-            print(f"  ERROR: {filename} - {e}")
+    # Validate every spec up front (unchanged ones come from the cache); a
+    # spec that does not validate is reported and skipped, not the others
+    invalid = {}
+    load_screens([spec.path for _, spec in spec_generators()], SCREEN_FRAME, OUTPUT_DIR, invalid)
+    for error in invalid.values():
+        print(f"  ERROR: {error}")
+        print(''.join(traceback.format_exception(error)), end='', file=sys.stderr)
+    generators = [(filename, generator) for filename, generator in GENERATORS
+                  if getattr(generator, 'path', None) not in invalid]
+
+    failed = len(invalid)
+    for result in build_outputs(generators, OUTPUT_DIR, jobs=args.jobs,
+                                force=args.force, font_paths=FONT_PATHS,
+                                formats=args.formats, quality=args.quality):
+        if result.error:
+            failed += 1
+            print(f"  ERROR: {result.filename} - {result.error}")
+            print(result.traceback, end='', file=sys.stderr)
+            continue
+        if result.skipped:
+            print(f"  Unchanged: {result.filename}")
+            continue
+        details = describe(result)
+        print(f"  Generated: {result.filename}" + (f" ({details})" if details else ""))
 
     print("=" * 60)
-    print(f"All {len(wireframes)} professional wireframes generated!")
+    if failed:
+        print(f"{len(GENERATORS) - failed} of {len(GENERATORS)} professional wireframes generated, "
+              f"{failed} failed")
+    else:
+        print(f"All {len(GENERATORS)} professional wireframes generated!")
     print(f"Output directory: {OUTPUT_DIR}")
+    if args.jobs == 1:
+        print_font_cache_info()
+        print_sprite_cache_info()
+    if args.profile:
+        profiling.print_report()
+    if args.watch:
+        watch(__file__, OUTPUT_DIR, font_paths=FONT_PATHS, formats=args.formats,
+              quality=args.quality, dirs=(SCREENS_DIR,), keep={'_chrome_cache': 'draw_chrome'})
+    elif failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -4,8 +4,16 @@ TeamACE CRM-ERP Phase 1 Wireframe Generator
 Generates professional PNG wireframe images for the SRS document.
 """
 
-from PIL import Image, ImageDraw, ImageFont
 import os
+import sys
+
+from wireframe_kit import profiling
+from wireframe_kit.build import build_outputs, describe, parse_args
+from wireframe_kit.fonts import load_font, print_font_cache_info, text_length
+from wireframe_kit.registry import collect, generates
+from wireframe_kit.watch import watch
+
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Colors - Professional wireframe palette
 COLORS = {
@@ -27,26 +35,15 @@ COLORS = {
     'card_bg': '#FAFAFA',
 }
 
+FONT_PATHS = (
+    '/System/Library/Fonts/Helvetica.ttc',
+    '/System/Library/Fonts/SFNSText.ttf',
+    '/Library/Fonts/Arial.ttf',
+)
+
 # Try to load a decent font, fallback to default
 def get_font(size, bold=False):
-    font_paths = [
-        '/System/Library/Fonts/Helvetica.ttc',
-        '/System/Library/Fonts/SFNSText.ttf',
-        '/Library/Fonts/Arial.ttf',
-    ]
-    for path in font_paths:
-        try:
-            return ImageFont.truetype(path, size)
-        except:
-            continue
-    return ImageFont.load_default()
-
-# Font instances
-FONT_TITLE = get_font(24, bold=True)
-FONT_HEADING = get_font(18, bold=True)
-FONT_BODY = get_font(14)
-FONT_SMALL = get_font(12)
-FONT_TINY = get_font(10)
+    return load_font(FONT_PATHS, size, bold)
 
 
 def draw_rounded_rect(draw, coords, radius, fill=None, outline=None, width=1):
@@ -75,20 +72,20 @@ def draw_button(draw, x, y, text, width=100, height=32, primary=False):
     text_color = COLORS['bg'] if primary else COLORS['text']
     outline = COLORS['primary'] if primary else COLORS['border_dark']
     draw_rounded_rect(draw, [x, y, x + width, y + height], 4, fill=fill, outline=outline)
-    tw = draw.textlength(text, font=FONT_SMALL)
-    draw.text((x + (width - tw) / 2, y + 8), text, fill=text_color, font=FONT_SMALL)
+    tw = text_length(text, get_font(12))
+    draw.text((x + (width - tw) / 2, y + 8), text, fill=text_color, font=get_font(12))
 
 
 def draw_input(draw, x, y, placeholder="", width=200, height=32):
     """Draw an input field"""
     draw.rectangle([x, y, x + width, y + height], fill=COLORS['bg'], outline=COLORS['border_dark'])
-    draw.text((x + 8, y + 8), placeholder, fill=COLORS['text_muted'], font=FONT_SMALL)
+    draw.text((x + 8, y + 8), placeholder, fill=COLORS['text_muted'], font=get_font(12))
 
 
 def draw_dropdown(draw, x, y, text="Select", width=150, height=32):
     """Draw a dropdown"""
     draw.rectangle([x, y, x + width, y + height], fill=COLORS['bg'], outline=COLORS['border_dark'])
-    draw.text((x + 8, y + 8), text, fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((x + 8, y + 8), text, fill=COLORS['text'], font=get_font(12))
     # Draw chevron
     draw.polygon([(x + width - 20, y + 12), (x + width - 10, y + 12), (x + width - 15, y + 20)], fill=COLORS['text_light'])
 
@@ -98,7 +95,7 @@ def draw_table_header(draw, x, y, columns, col_widths, height=36):
     draw.rectangle([x, y, x + sum(col_widths), y + height], fill=COLORS['bg_gray'], outline=COLORS['border'])
     current_x = x
     for i, col in enumerate(columns):
-        draw.text((current_x + 10, y + 10), col, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((current_x + 10, y + 10), col, fill=COLORS['text'], font=get_font(12))
         current_x += col_widths[i]
         if i < len(columns) - 1:
             draw.line([current_x, y, current_x, y + height], fill=COLORS['border'])
@@ -109,7 +106,7 @@ def draw_table_row(draw, x, y, values, col_widths, height=40):
     draw.rectangle([x, y, x + sum(col_widths), y + height], fill=COLORS['bg'], outline=COLORS['border'])
     current_x = x
     for i, val in enumerate(values):
-        draw.text((current_x + 10, y + 12), str(val), fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((current_x + 10, y + 12), str(val), fill=COLORS['text'], font=get_font(12))
         current_x += col_widths[i]
         if i < len(values) - 1:
             draw.line([current_x, y, current_x, y + height], fill=COLORS['border'])
@@ -120,7 +117,7 @@ def draw_card(draw, x, y, width, height, title=None):
     draw.rectangle([x, y, x + width, y + height], fill=COLORS['card_bg'], outline=COLORS['border'])
     if title:
         draw.rectangle([x, y, x + width, y + 30], fill=COLORS['bg_gray'], outline=COLORS['border'])
-        draw.text((x + 10, y + 7), title, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((x + 10, y + 7), title, fill=COLORS['text'], font=get_font(12))
 
 
 def draw_sidebar(draw, width, height, active_item=0):
@@ -130,7 +127,7 @@ def draw_sidebar(draw, width, height, active_item=0):
 
     # Logo area
     draw.rectangle([0, 0, sidebar_width, 60], fill=COLORS['header'])
-    draw.text((15, 20), "TeamACE CRM-ERP", fill=COLORS['sidebar_text'], font=FONT_BODY)
+    draw.text((15, 20), "TeamACE CRM-ERP", fill=COLORS['sidebar_text'], font=get_font(14))
 
     # Menu items
     menu_items = [
@@ -144,7 +141,7 @@ def draw_sidebar(draw, width, height, active_item=0):
         if i == active_item:
             draw.rectangle([0, y, sidebar_width, y + 36], fill=COLORS['primary'])
         indent = 30 if item.startswith("  ") else 15
-        draw.text((indent, y + 10), item.strip(), fill=COLORS['sidebar_text'], font=FONT_SMALL)
+        draw.text((indent, y + 10), item.strip(), fill=COLORS['sidebar_text'], font=get_font(12))
         y += 36
 
     return sidebar_width
@@ -153,9 +150,9 @@ def draw_sidebar(draw, width, height, active_item=0):
 def draw_header(draw, x, y, width, title, subtitle=None, buttons=None):
     """Draw page header"""
     draw.rectangle([x, y, x + width, y + 70], fill=COLORS['bg'], outline=COLORS['border'])
-    draw.text((x + 20, y + 15), title, fill=COLORS['text'], font=FONT_HEADING)
+    draw.text((x + 20, y + 15), title, fill=COLORS['text'], font=get_font(18, bold=True))
     if subtitle:
-        draw.text((x + 20, y + 42), subtitle, fill=COLORS['text_light'], font=FONT_SMALL)
+        draw.text((x + 20, y + 42), subtitle, fill=COLORS['text_light'], font=get_font(12))
     if buttons:
         btn_x = x + width - 20
         for btn_text, is_primary in reversed(buttons):
@@ -175,32 +172,40 @@ def draw_status_badge(draw, x, y, text, color='success'):
     badge_color = colors_map.get(color, COLORS['text_light'])
     width = len(text) * 7 + 16
     draw_rounded_rect(draw, [x, y, x + width, y + 22], 11, fill=badge_color)
-    draw.text((x + 8, y + 4), text, fill=COLORS['bg'], font=FONT_TINY)
+    draw.text((x + 8, y + 4), text, fill=COLORS['bg'], font=get_font(10))
+
+
+def new_canvas(width, height):
+    """Blank image and its draw surface; Pillow is only imported to render"""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (width, height), COLORS['bg'])
+    return img, ImageDraw.Draw(img)
 
 
 # =============================================================================
 # WIREFRAME GENERATORS
 # =============================================================================
 
+@generates("basic_01_global_layout.png", "shell", "desktop")
 def create_layout_wireframe():
     """D.1 Global Navigation & Layout"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     # Sidebar
     sidebar_w = draw_sidebar(draw, width, height, active_item=1)
 
     # Top header bar
     draw.rectangle([sidebar_w, 0, width, 50], fill=COLORS['header'])
-    draw.text((sidebar_w + 20, 15), "Search...", fill=COLORS['text_muted'], font=FONT_SMALL)
+    draw.text((sidebar_w + 20, 15), "Search...", fill=COLORS['text_muted'], font=get_font(12))
     draw.rectangle([sidebar_w + 10, 12, sidebar_w + 250, 38], fill=COLORS['bg'], outline=COLORS['border'])
-    draw.text((sidebar_w + 20, 17), "Search...", fill=COLORS['text_muted'], font=FONT_SMALL)
+    draw.text((sidebar_w + 20, 17), "Search...", fill=COLORS['text_muted'], font=get_font(12))
 
     # Notification bell and user
     draw.ellipse([width - 100, 12, width - 75, 37], outline=COLORS['sidebar_text'])
-    draw.text((width - 93, 17), "3", fill=COLORS['danger'], font=FONT_TINY)
-    draw.text((width - 70, 15), "John Doe", fill=COLORS['sidebar_text'], font=FONT_SMALL)
+    draw.text((width - 93, 17), "3", fill=COLORS['danger'], font=get_font(10))
+    draw.text((width - 70, 15), "John Doe", fill=COLORS['sidebar_text'], font=get_font(12))
 
     # Main content area label
     content_x = sidebar_w + 30
@@ -208,28 +213,28 @@ def create_layout_wireframe():
     draw.rectangle([sidebar_w, 50, width, height], fill=COLORS['bg_gray'])
 
     # Breadcrumb
-    draw.text((content_x, content_y), "Dashboard > Clients > Acme Corporation", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x, content_y), "Dashboard > Clients > Acme Corporation", fill=COLORS['text_light'], font=get_font(12))
 
     # Page header
-    draw.text((content_x, content_y + 30), "Page Title", fill=COLORS['text'], font=FONT_TITLE)
+    draw.text((content_x, content_y + 30), "Page Title", fill=COLORS['text'], font=get_font(24, bold=True))
     draw_button(draw, width - 150, content_y + 25, "+ Add New", 120, 35, primary=True)
 
     # Content card placeholder
     draw_card(draw, content_x, content_y + 90, width - sidebar_w - 60, height - content_y - 150, "Content Area")
-    draw.text((content_x + 20, content_y + 150), "Main page content goes here", fill=COLORS['text_muted'], font=FONT_BODY)
+    draw.text((content_x + 20, content_y + 150), "Main page content goes here", fill=COLORS['text_muted'], font=get_font(14))
 
     # Footer
     draw.rectangle([sidebar_w, height - 40, width, height], fill=COLORS['bg'], outline=COLORS['border'])
-    draw.text((content_x, height - 28), "© 2025 TeamACE | Help | v1.0", fill=COLORS['text_muted'], font=FONT_TINY)
+    draw.text((content_x, height - 28), "© 2025 TeamACE | Help | v1.0", fill=COLORS['text_muted'], font=get_font(10))
 
     return img
 
 
+@generates("basic_02_client_list.png", "crm", "desktop")
 def create_client_list_wireframe():
     """D.2.1 Client List Screen"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=1)
 
@@ -269,19 +274,19 @@ def create_client_list_wireframe():
 
     # Pagination
     pag_y = table_y + 36 + len(data) * 40 + 20
-    draw.text((content_x, pag_y), "Showing 1-20 of 156 clients", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x, pag_y), "Showing 1-20 of 156 clients", fill=COLORS['text_light'], font=get_font(12))
     draw_button(draw, width - 250, pag_y - 5, "< Prev", 70)
-    draw.text((width - 170, pag_y), "1  2  3  ...  8", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((width - 170, pag_y), "1  2  3  ...  8", fill=COLORS['text'], font=get_font(12))
     draw_button(draw, width - 100, pag_y - 5, "Next >", 70)
 
     return img
 
 
+@generates("basic_03_client_detail.png", "crm", "desktop")
 def create_client_detail_wireframe():
     """D.2.2 Client Detail Screen"""
     width, height = 1200, 850
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=1)
     content_x = sidebar_w + 30
@@ -289,7 +294,7 @@ def create_client_detail_wireframe():
     draw.rectangle([sidebar_w, 0, width, 50], fill=COLORS['header'])
 
     # Back button
-    draw.text((content_x, 65), "< Back to Clients", fill=COLORS['primary'], font=FONT_SMALL)
+    draw.text((content_x, 65), "< Back to Clients", fill=COLORS['primary'], font=get_font(12))
 
     # Client header card
     header_y = 90
@@ -297,14 +302,14 @@ def create_client_detail_wireframe():
 
     # Logo placeholder
     draw.rectangle([content_x + 20, header_y + 20, content_x + 80, header_y + 80], fill=COLORS['bg_gray'], outline=COLORS['border'])
-    draw.text((content_x + 35, header_y + 45), "Logo", fill=COLORS['text_muted'], font=FONT_TINY)
+    draw.text((content_x + 35, header_y + 45), "Logo", fill=COLORS['text_muted'], font=get_font(10))
 
     # Client name and info
-    draw.text((content_x + 100, header_y + 20), "Acme Corporation", fill=COLORS['text'], font=FONT_TITLE)
+    draw.text((content_x + 100, header_y + 20), "Acme Corporation", fill=COLORS['text'], font=get_font(24, bold=True))
     draw_status_badge(draw, content_x + 100, header_y + 55, "Active", 'success')
     draw_status_badge(draw, content_x + 165, header_y + 55, "Premium", 'primary')
-    draw.text((content_x + 250, header_y + 58), "Technology", fill=COLORS['text_light'], font=FONT_SMALL)
-    draw.text((content_x + 100, header_y + 78), "Account Manager: John Doe  |  Since: Jan 2024", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x + 250, header_y + 58), "Technology", fill=COLORS['text_light'], font=get_font(12))
+    draw.text((content_x + 100, header_y + 78), "Account Manager: John Doe  |  Since: Jan 2024", fill=COLORS['text_light'], font=get_font(12))
 
     # Action buttons
     draw_button(draw, width - 180, header_y + 30, "Edit", 70)
@@ -318,10 +323,10 @@ def create_client_detail_wireframe():
         tab_width = len(tab) * 10 + 20
         if i == 0:  # Active tab
             draw.rectangle([tab_x, tabs_y, tab_x + tab_width, tabs_y + 35], fill=COLORS['primary'])
-            draw.text((tab_x + 10, tabs_y + 10), tab, fill=COLORS['bg'], font=FONT_SMALL)
+            draw.text((tab_x + 10, tabs_y + 10), tab, fill=COLORS['bg'], font=get_font(12))
         else:
             draw.rectangle([tab_x, tabs_y, tab_x + tab_width, tabs_y + 35], fill=COLORS['bg'], outline=COLORS['border'])
-            draw.text((tab_x + 10, tabs_y + 10), tab, fill=COLORS['text'], font=FONT_SMALL)
+            draw.text((tab_x + 10, tabs_y + 10), tab, fill=COLORS['text'], font=get_font(12))
         tab_x += tab_width + 5
 
     # Content area
@@ -338,8 +343,8 @@ def create_client_detail_wireframe():
     ]
     y = content_y + 45
     for label, value in info_items:
-        draw.text((content_x + 15, y), label, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((content_x + 100, y), value, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((content_x + 15, y), label, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((content_x + 100, y), value, fill=COLORS['text'], font=get_font(12))
         y += 25
 
     # Middle column - Quick Stats
@@ -353,26 +358,26 @@ def create_client_detail_wireframe():
     ]
     y = content_y + 45
     for label, value in stats:
-        draw.text((stats_x + 15, y), label, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((stats_x + 150, y), value, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((stats_x + 15, y), label, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((stats_x + 150, y), value, fill=COLORS['text'], font=get_font(12))
         y += 30
 
     # Right column - Primary Contact
     contact_x = stats_x + 300
     draw_card(draw, contact_x, content_y, 280, 180, "Primary Contact")
-    draw.text((contact_x + 15, content_y + 50), "Jane Doe", fill=COLORS['text'], font=FONT_BODY)
-    draw.text((contact_x + 15, content_y + 75), "HR Director", fill=COLORS['text_light'], font=FONT_SMALL)
-    draw.text((contact_x + 15, content_y + 100), "jane@acme.com", fill=COLORS['primary'], font=FONT_SMALL)
-    draw.text((contact_x + 15, content_y + 125), "+234 802 345 6789", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((contact_x + 15, content_y + 50), "Jane Doe", fill=COLORS['text'], font=get_font(14))
+    draw.text((contact_x + 15, content_y + 75), "HR Director", fill=COLORS['text_light'], font=get_font(12))
+    draw.text((contact_x + 15, content_y + 100), "jane@acme.com", fill=COLORS['primary'], font=get_font(12))
+    draw.text((contact_x + 15, content_y + 125), "+234 802 345 6789", fill=COLORS['text'], font=get_font(12))
 
     return img
 
 
+@generates("basic_04_pipeline_kanban.png", "crm", "desktop")
 def create_pipeline_kanban_wireframe():
     """D.3.1 Pipeline Kanban Board"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=4)  # Pipeline
     content_x = sidebar_w + 20
@@ -387,7 +392,7 @@ def create_pipeline_kanban_wireframe():
     stats_y = 130
     draw.rectangle([sidebar_w, 120, width, 160], fill=COLORS['bg_gray'])
     stats_text = "Total: ₦125.5M weighted  |  ₦250M unweighted  |  42 opportunities"
-    draw.text((content_x, stats_y), stats_text, fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x, stats_y), stats_text, fill=COLORS['text'], font=get_font(12))
 
     # Kanban columns
     kanban_y = 180
@@ -404,8 +409,8 @@ def create_pipeline_kanban_wireframe():
     for col_name, value, color in columns:
         # Column header
         draw.rectangle([col_x, kanban_y, col_x + col_width, kanban_y + 50], fill=color, outline=COLORS['border'])
-        draw.text((col_x + 10, kanban_y + 10), col_name, fill=COLORS['text'], font=FONT_SMALL)
-        draw.text((col_x + 10, kanban_y + 28), value, fill=COLORS['text_light'], font=FONT_TINY)
+        draw.text((col_x + 10, kanban_y + 10), col_name, fill=COLORS['text'], font=get_font(12))
+        draw.text((col_x + 10, kanban_y + 28), value, fill=COLORS['text_light'], font=get_font(10))
 
         # Column body
         draw.rectangle([col_x, kanban_y + 50, col_x + col_width, height - 50], fill=COLORS['bg_gray'], outline=COLORS['border'])
@@ -414,10 +419,10 @@ def create_pipeline_kanban_wireframe():
         card_y = kanban_y + 60
         for i in range(2 if col_x < width - 400 else 1):
             draw.rectangle([col_x + 8, card_y, col_x + col_width - 8, card_y + 80], fill=COLORS['bg'], outline=COLORS['border'])
-            draw.text((col_x + 15, card_y + 10), f"Deal {i+1}", fill=COLORS['text'], font=FONT_SMALL)
-            draw.text((col_x + 15, card_y + 30), "₦2M - ₦8M", fill=COLORS['success'], font=FONT_SMALL)
-            draw.text((col_x + 15, card_y + 50), "John Doe", fill=COLORS['text_light'], font=FONT_TINY)
-            draw.text((col_x + 15, card_y + 65), "5 days ago", fill=COLORS['text_muted'], font=FONT_TINY)
+            draw.text((col_x + 15, card_y + 10), f"Deal {i+1}", fill=COLORS['text'], font=get_font(12))
+            draw.text((col_x + 15, card_y + 30), "₦2M - ₦8M", fill=COLORS['success'], font=get_font(12))
+            draw.text((col_x + 15, card_y + 50), "John Doe", fill=COLORS['text_light'], font=get_font(10))
+            draw.text((col_x + 15, card_y + 65), "5 days ago", fill=COLORS['text_muted'], font=get_font(10))
             card_y += 95
 
         col_x += col_width + 10
@@ -425,11 +430,11 @@ def create_pipeline_kanban_wireframe():
     return img
 
 
+@generates("basic_05_invoice_list.png", "finance", "desktop")
 def create_invoice_list_wireframe():
     """D.5.1 Invoice List Screen"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=10)  # Invoices
     content_x = sidebar_w + 30
@@ -477,16 +482,16 @@ def create_invoice_list_wireframe():
     summary_y = table_y + 36 + len(data) * 40 + 20
     draw.rectangle([content_x, summary_y, width - 30, summary_y + 50], fill=COLORS['bg_gray'], outline=COLORS['border'])
     draw.text((content_x + 20, summary_y + 15), "Total: ₦10,950,000  |  Paid: ₦2.5M  |  Outstanding: ₦8.45M",
-              fill=COLORS['text'], font=FONT_BODY)
+              fill=COLORS['text'], font=get_font(14))
 
     return img
 
 
+@generates("basic_06_invoice_create.png", "finance", "desktop")
 def create_invoice_create_wireframe():
     """D.5.2 Invoice Create/Edit Screen"""
     width, height = 1200, 900
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=10)
     content_x = sidebar_w + 30
@@ -499,34 +504,34 @@ def create_invoice_create_wireframe():
 
     # Form fields row 1
     form_y = 140
-    draw.text((content_x, form_y), "Client *", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x, form_y), "Client *", fill=COLORS['text'], font=get_font(12))
     draw_dropdown(draw, content_x, form_y + 20, "Acme Corporation", 280)
 
-    draw.text((content_x + 300, form_y), "Engagement", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x + 300, form_y), "Engagement", fill=COLORS['text'], font=get_font(12))
     draw_dropdown(draw, content_x + 300, form_y + 20, "HR Outsourcing - 2024", 280)
 
     # Form fields row 2
     form_y += 75
-    draw.text((content_x, form_y), "Invoice Date *", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x, form_y), "Invoice Date *", fill=COLORS['text'], font=get_font(12))
     draw_input(draw, content_x, form_y + 20, "Nov 30, 2025", 180)
 
-    draw.text((content_x + 200, form_y), "Due Date *", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x + 200, form_y), "Due Date *", fill=COLORS['text'], font=get_font(12))
     draw_input(draw, content_x + 200, form_y + 20, "Dec 30, 2025", 180)
 
-    draw.text((content_x + 400, form_y), "Payment Terms", fill=COLORS['text'], font=FONT_SMALL)
+    draw.text((content_x + 400, form_y), "Payment Terms", fill=COLORS['text'], font=get_font(12))
     draw_dropdown(draw, content_x + 400, form_y + 20, "30 days", 150)
 
     # Billing period
     form_y += 75
-    draw.text((content_x, form_y), "Billing Period:", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x, form_y), "Billing Period:", fill=COLORS['text_light'], font=get_font(12))
     draw_input(draw, content_x + 100, form_y - 5, "Nov 1, 2025", 130)
-    draw.text((content_x + 240, form_y), "to", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x + 240, form_y), "to", fill=COLORS['text_light'], font=get_font(12))
     draw_input(draw, content_x + 260, form_y - 5, "Nov 30, 2025", 130)
 
     # Line items section
     items_y = form_y + 50
     draw.rectangle([content_x, items_y, width - 30, items_y + 40], fill=COLORS['bg_gray'], outline=COLORS['border'])
-    draw.text((content_x + 15, items_y + 12), "LINE ITEMS", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((content_x + 15, items_y + 12), "LINE ITEMS", fill=COLORS['text'], font=get_font(14))
     draw_button(draw, width - 150, items_y + 5, "+ Add Line Item", 110, 28)
 
     # Line items table
@@ -555,24 +560,24 @@ def create_invoice_create_wireframe():
     ]
 
     for label, value in totals:
-        draw.text((totals_x, totals_y), label, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((totals_x + 100, totals_y), value, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((totals_x, totals_y), label, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((totals_x + 100, totals_y), value, fill=COLORS['text'], font=get_font(12))
         totals_y += 25
 
     # Total line
     draw.line([totals_x, totals_y, totals_x + 200, totals_y], fill=COLORS['border_dark'])
     totals_y += 10
-    draw.text((totals_x, totals_y), "TOTAL:", fill=COLORS['text'], font=FONT_BODY)
-    draw.text((totals_x + 100, totals_y), "₦789,250.00", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((totals_x, totals_y), "TOTAL:", fill=COLORS['text'], font=get_font(14))
+    draw.text((totals_x + 100, totals_y), "₦789,250.00", fill=COLORS['text'], font=get_font(14))
 
     return img
 
 
+@generates("basic_07_dashboard.png", "dashboard", "desktop")
 def create_dashboard_wireframe():
     """D.7 Dashboard Screen"""
     width, height = 1200, 850
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=0)  # Dashboard
     content_x = sidebar_w + 30
@@ -581,8 +586,8 @@ def create_dashboard_wireframe():
 
     # Header
     draw.rectangle([sidebar_w, 50, width, 100], fill=COLORS['bg'])
-    draw.text((content_x, 65), "Dashboard", fill=COLORS['text'], font=FONT_TITLE)
-    draw.text((width - 200, 70), "Welcome, John Doe", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x, 65), "Dashboard", fill=COLORS['text'], font=get_font(24, bold=True))
+    draw.text((width - 200, 70), "Welcome, John Doe", fill=COLORS['text_light'], font=get_font(12))
 
     # Stats cards row
     stats_y = 120
@@ -598,8 +603,8 @@ def create_dashboard_wireframe():
     for label, value, color in stats:
         draw.rectangle([stat_x, stats_y, stat_x + stat_width, stats_y + 80], fill=COLORS['card_bg'], outline=COLORS['border'])
         draw.rectangle([stat_x, stats_y, stat_x + 5, stats_y + 80], fill=color)
-        draw.text((stat_x + 20, stats_y + 15), label, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((stat_x + 20, stats_y + 40), value, fill=COLORS['text'], font=FONT_HEADING)
+        draw.text((stat_x + 20, stats_y + 15), label, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((stat_x + 20, stats_y + 40), value, fill=COLORS['text'], font=get_font(18, bold=True))
         stat_x += stat_width + 15
 
     # Second row - Tasks and Activities
@@ -616,9 +621,9 @@ def create_dashboard_wireframe():
     for task, priority in tasks:
         color = COLORS['danger'] if priority == "High" else COLORS['warning']
         draw.rectangle([content_x + 15, task_y, content_x + 20, task_y + 15], fill=color)
-        draw.text((content_x + 30, task_y), task, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((content_x + 30, task_y), task, fill=COLORS['text'], font=get_font(12))
         task_y += 35
-    draw.text((content_x + 15, task_y + 10), "+ View All Tasks", fill=COLORS['primary'], font=FONT_SMALL)
+    draw.text((content_x + 15, task_y + 10), "+ View All Tasks", fill=COLORS['primary'], font=get_font(12))
 
     # Recent Activities card
     activities_x = content_x + 470
@@ -632,9 +637,9 @@ def create_dashboard_wireframe():
     act_y = row2_y + 45
     for activity in activities:
         draw.ellipse([activities_x + 15, act_y + 3, activities_x + 25, act_y + 13], fill=COLORS['primary'])
-        draw.text((activities_x + 35, act_y), activity, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((activities_x + 35, act_y), activity, fill=COLORS['text'], font=get_font(12))
         act_y += 30
-    draw.text((activities_x + 15, act_y + 15), "View All Activities", fill=COLORS['primary'], font=FONT_SMALL)
+    draw.text((activities_x + 15, act_y + 15), "View All Activities", fill=COLORS['primary'], font=get_font(12))
 
     # Third row - Pipeline Summary
     row3_y = row2_y + 240
@@ -648,10 +653,10 @@ def create_dashboard_wireframe():
     ]
     bar_y = row3_y + 55
     for stage, value, percent in pipeline:
-        draw.text((content_x + 20, bar_y), stage, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((content_x + 20, bar_y), stage, fill=COLORS['text'], font=get_font(12))
         bar_width = int(percent * 3)
         draw.rectangle([content_x + 150, bar_y, content_x + 150 + bar_width, bar_y + 18], fill=COLORS['primary'])
-        draw.text((content_x + 160 + bar_width, bar_y), f"₦{value}M ({percent}%)", fill=COLORS['text_light'], font=FONT_SMALL)
+        draw.text((content_x + 160 + bar_width, bar_y), f"₦{value}M ({percent}%)", fill=COLORS['text_light'], font=get_font(12))
         bar_y += 30
 
     # Receivables aging mini card
@@ -665,18 +670,18 @@ def create_dashboard_wireframe():
     ]
     age_y = row3_y + 55
     for label, value in aging:
-        draw.text((recv_x + 20, age_y), label, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((recv_x + 120, age_y), value, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((recv_x + 20, age_y), label, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((recv_x + 120, age_y), value, fill=COLORS['text'], font=get_font(12))
         age_y += 28
 
     return img
 
 
+@generates("basic_08_task_list.png", "tasks", "desktop")
 def create_task_list_wireframe():
     """D.6.1 Task List Screen"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=12)  # Tasks
     content_x = sidebar_w + 30
@@ -695,15 +700,15 @@ def create_task_list_wireframe():
         tab_width = len(tab_name) * 8 + 30
         if is_active:
             draw.rectangle([tab_x, tabs_y, tab_x + tab_width, tabs_y + 32], fill=COLORS['primary'])
-            draw.text((tab_x + 15, tabs_y + 8), tab_name, fill=COLORS['bg'], font=FONT_SMALL)
+            draw.text((tab_x + 15, tabs_y + 8), tab_name, fill=COLORS['bg'], font=get_font(12))
         else:
             draw.rectangle([tab_x, tabs_y, tab_x + tab_width, tabs_y + 32], fill=COLORS['bg'], outline=COLORS['border'])
-            draw.text((tab_x + 15, tabs_y + 8), tab_name, fill=COLORS['text'], font=FONT_SMALL)
+            draw.text((tab_x + 15, tabs_y + 8), tab_name, fill=COLORS['text'], font=get_font(12))
         tab_x += tab_width + 5
 
     # Today section
     section_y = tabs_y + 60
-    draw.text((content_x, section_y), "TODAY (3)", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((content_x, section_y), "TODAY (3)", fill=COLORS['text'], font=get_font(14))
 
     tasks_today = [
         ("[!] Follow up with Acme on proposal response", "Due: Today", "High", "Proposal PRP-2025-0023"),
@@ -720,16 +725,16 @@ def create_task_list_wireframe():
         color = COLORS['danger'] if priority == "High" else COLORS['warning']
         draw.rectangle([content_x, task_y, content_x + 4, task_y + 60], fill=color)
 
-        draw.text((content_x + 20, task_y + 10), task, fill=COLORS['text'], font=FONT_SMALL)
-        draw.text((content_x + 20, task_y + 35), f"Related: {related}", fill=COLORS['text_light'], font=FONT_TINY)
-        draw.text((width - 200, task_y + 10), due, fill=COLORS['text_light'], font=FONT_SMALL)
-        draw.text((width - 200, task_y + 30), f"Priority: {priority}", fill=color, font=FONT_TINY)
+        draw.text((content_x + 20, task_y + 10), task, fill=COLORS['text'], font=get_font(12))
+        draw.text((content_x + 20, task_y + 35), f"Related: {related}", fill=COLORS['text_light'], font=get_font(10))
+        draw.text((width - 200, task_y + 10), due, fill=COLORS['text_light'], font=get_font(12))
+        draw.text((width - 200, task_y + 30), f"Priority: {priority}", fill=color, font=get_font(10))
 
         task_y += 75
 
     # This Week section
     section_y = task_y + 20
-    draw.text((content_x, section_y), "THIS WEEK (5)", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((content_x, section_y), "THIS WEEK (5)", fill=COLORS['text'], font=get_font(14))
 
     tasks_week = [
         ("[ ] Prepare monthly outsourcing report", "Due: Dec 3"),
@@ -740,18 +745,18 @@ def create_task_list_wireframe():
     task_y = section_y + 30
     for task, due in tasks_week:
         draw.rectangle([content_x, task_y, width - 50, task_y + 40], fill=COLORS['card_bg'], outline=COLORS['border'])
-        draw.text((content_x + 20, task_y + 12), task, fill=COLORS['text'], font=FONT_SMALL)
-        draw.text((width - 150, task_y + 12), due, fill=COLORS['text_light'], font=FONT_SMALL)
+        draw.text((content_x + 20, task_y + 12), task, fill=COLORS['text'], font=get_font(12))
+        draw.text((width - 150, task_y + 12), due, fill=COLORS['text_light'], font=get_font(12))
         task_y += 50
 
     return img
 
 
+@generates("basic_09_approval_queue.png", "tasks", "desktop")
 def create_approval_queue_wireframe():
     """D.6.2 Approval Queue Screen"""
     width, height = 1200, 800
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     sidebar_w = draw_sidebar(draw, width, height, active_item=0)
     content_x = sidebar_w + 30
@@ -763,7 +768,7 @@ def create_approval_queue_wireframe():
                 buttons=[("Refresh", False)])
 
     # Summary
-    draw.text((content_x, 135), "You have 5 pending approvals", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((content_x, 135), "You have 5 pending approvals", fill=COLORS['text_light'], font=get_font(12))
 
     # Approval cards
     approvals = [
@@ -780,14 +785,14 @@ def create_approval_queue_wireframe():
         # Type badge
         draw.rectangle([content_x + 15, card_y + 15, content_x + 15 + len(title) * 7 + 16, card_y + 35],
                       fill=COLORS['primary_light'])
-        draw.text((content_x + 23, card_y + 18), title, fill=COLORS['primary'], font=FONT_TINY)
+        draw.text((content_x + 23, card_y + 18), title, fill=COLORS['primary'], font=get_font(10))
 
         # Time
-        draw.text((width - 150, card_y + 18), time_ago, fill=COLORS['text_muted'], font=FONT_TINY)
+        draw.text((width - 150, card_y + 18), time_ago, fill=COLORS['text_muted'], font=get_font(10))
 
         # Description
-        draw.text((content_x + 20, card_y + 50), description, fill=COLORS['text'], font=FONT_SMALL)
-        draw.text((content_x + 20, card_y + 75), f"Requested by: {requester}", fill=COLORS['text_light'], font=FONT_SMALL)
+        draw.text((content_x + 20, card_y + 50), description, fill=COLORS['text'], font=get_font(12))
+        draw.text((content_x + 20, card_y + 75), f"Requested by: {requester}", fill=COLORS['text_light'], font=get_font(12))
 
         # Buttons
         draw_button(draw, width - 250, card_y + 75, "View Details", 90, 28)
@@ -799,36 +804,36 @@ def create_approval_queue_wireframe():
     return img
 
 
+@generates("basic_10_mobile_view.png", "mobile")
 def create_mobile_wireframe():
     """D.8 Mobile Views"""
     width, height = 375, 812  # iPhone size
-    img = Image.new('RGB', (width, height), COLORS['bg'])
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height)
 
     # Status bar
     draw.rectangle([0, 0, width, 44], fill=COLORS['header'])
-    draw.text((20, 15), "9:41", fill=COLORS['bg'], font=FONT_SMALL)
+    draw.text((20, 15), "9:41", fill=COLORS['bg'], font=get_font(12))
 
     # Header
     draw.rectangle([0, 44, width, 100], fill=COLORS['primary'])
-    draw.text((20, 60), "≡", fill=COLORS['bg'], font=FONT_TITLE)
-    draw.text((60, 65), "TeamACE", fill=COLORS['bg'], font=FONT_BODY)
+    draw.text((20, 60), "≡", fill=COLORS['bg'], font=get_font(24, bold=True))
+    draw.text((60, 65), "TeamACE", fill=COLORS['bg'], font=get_font(14))
     draw.ellipse([width - 50, 60, width - 25, 85], outline=COLORS['bg'])
-    draw.text((width - 43, 67), "3", fill=COLORS['bg'], font=FONT_TINY)
+    draw.text((width - 43, 67), "3", fill=COLORS['bg'], font=get_font(10))
 
     # Client card
     card_y = 120
     draw.rectangle([15, card_y, width - 15, card_y + 180], fill=COLORS['card_bg'], outline=COLORS['border'])
 
-    draw.text((30, card_y + 20), "Acme Corporation", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((30, card_y + 20), "Acme Corporation", fill=COLORS['text'], font=get_font(14))
     draw_status_badge(draw, 30, card_y + 50, "Active", 'success')
-    draw.text((100, card_y + 52), "Technology", fill=COLORS['text_light'], font=FONT_SMALL)
+    draw.text((100, card_y + 52), "Technology", fill=COLORS['text_light'], font=get_font(12))
 
     draw.line([30, card_y + 80, width - 30, card_y + 80], fill=COLORS['border'])
 
-    draw.text((30, card_y + 90), "Primary Contact:", fill=COLORS['text_light'], font=FONT_SMALL)
-    draw.text((30, card_y + 110), "Jane Doe", fill=COLORS['text'], font=FONT_SMALL)
-    draw.text((30, card_y + 130), "+234 802 345 6789", fill=COLORS['primary'], font=FONT_SMALL)
+    draw.text((30, card_y + 90), "Primary Contact:", fill=COLORS['text_light'], font=get_font(12))
+    draw.text((30, card_y + 110), "Jane Doe", fill=COLORS['text'], font=get_font(12))
+    draw.text((30, card_y + 130), "+234 802 345 6789", fill=COLORS['primary'], font=get_font(12))
 
     # Action buttons
     btn_y = card_y + 155
@@ -839,7 +844,7 @@ def create_mobile_wireframe():
 
     # Stats section
     stats_y = card_y + 210
-    draw.text((20, stats_y), "Quick Stats", fill=COLORS['text'], font=FONT_BODY)
+    draw.text((20, stats_y), "Quick Stats", fill=COLORS['text'], font=get_font(14))
 
     stats = [
         ("Engagements", "3"),
@@ -852,8 +857,8 @@ def create_mobile_wireframe():
         stat_width = (width - 50) // 3
         draw.rectangle([stat_x, stats_y + 30, stat_x + stat_width - 10, stats_y + 90],
                       fill=COLORS['bg_gray'], outline=COLORS['border'])
-        draw.text((stat_x + 10, stats_y + 40), label, fill=COLORS['text_light'], font=FONT_TINY)
-        draw.text((stat_x + 10, stats_y + 60), value, fill=COLORS['text'], font=FONT_SMALL)
+        draw.text((stat_x + 10, stats_y + 40), label, fill=COLORS['text_light'], font=get_font(10))
+        draw.text((stat_x + 10, stats_y + 60), value, fill=COLORS['text'], font=get_font(12))
         stat_x += stat_width
 
     # Bottom navigation
@@ -868,7 +873,7 @@ def create_mobile_wireframe():
         # Icon placeholder
         draw.ellipse([nav_x + nav_width//2 - 12, nav_y + 15, nav_x + nav_width//2 + 12, nav_y + 39],
                     outline=color)
-        draw.text((nav_x + nav_width//2 - len(item)*3, nav_y + 48), item, fill=color, font=FONT_TINY)
+        draw.text((nav_x + nav_width//2 - len(item)*3, nav_y + 48), item, fill=color, font=get_font(10))
         nav_x += nav_width
 
     return img
@@ -878,34 +883,47 @@ def create_mobile_wireframe():
 # MAIN EXECUTION
 # =============================================================================
 
+GENERATORS = collect(globals())
+
+
 def main():
-    output_dir = os.path.dirname(os.path.abspath(__file__))
-
-    wireframes = [
-        ("01_global_layout.png", create_layout_wireframe),
-        ("02_client_list.png", create_client_list_wireframe),
-        ("03_client_detail.png", create_client_detail_wireframe),
-        ("04_pipeline_kanban.png", create_pipeline_kanban_wireframe),
-        ("05_invoice_list.png", create_invoice_list_wireframe),
-        ("06_invoice_create.png", create_invoice_create_wireframe),
-        ("07_dashboard.png", create_dashboard_wireframe),
-        ("08_task_list.png", create_task_list_wireframe),
-        ("09_approval_queue.png", create_approval_queue_wireframe),
-        ("10_mobile_view.png", create_mobile_wireframe),
-    ]
+    args = parse_args(__doc__, scalable=False)
+    if args.profile:
+        profiling.instrument(globals())
 
     print("Generating TeamACE CRM-ERP Phase 1 Wireframes...")
     print("=" * 50)
 
-    for filename, generator_func in wireframes:
-        filepath = os.path.join(output_dir, filename)
-        img = generator_func()
-        img.save(filepath, "PNG", quality=95)
-        print(f"✓ Generated: {filename}")
+    failed = 0
+    for result in build_outputs(GENERATORS, OUTPUT_DIR, jobs=args.jobs,
+                                force=args.force, font_paths=FONT_PATHS,
+                                formats=args.formats, quality=args.quality):
+        if result.error:
+            failed += 1
+            print(f"✗ Failed: {result.filename} - {result.error}")
+            print(result.traceback, end='', file=sys.stderr)
+            continue
+        if result.skipped:
+            print(f"· Unchanged: {result.filename}")
+            continue
+        details = describe(result)
+        print(f"✓ Generated: {result.filename}" + (f" ({details})" if details else ""))
 
     print("=" * 50)
-    print(f"All {len(wireframes)} wireframes generated successfully!")
-    print(f"Output directory: {output_dir}")
+    if failed:
+        print(f"{len(GENERATORS) - failed} of {len(GENERATORS)} wireframes generated, {failed} failed")
+    else:
+        print(f"All {len(GENERATORS)} wireframes generated successfully!")
+    print(f"Output directory: {OUTPUT_DIR}")
+    if args.jobs == 1:
+        print_font_cache_info()
+    if args.profile:
+        profiling.print_report()
+    if args.watch:
+        watch(__file__, OUTPUT_DIR, font_paths=FONT_PATHS, formats=args.formats,
+              quality=args.quality)
+    elif failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The generator scripts and wireframe_kit live next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
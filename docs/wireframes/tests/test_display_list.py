@@ -0,0 +1,52 @@
+from PIL import Image
+
+from wireframe_kit.display_list import DisplayList, OP_LAYER
+from wireframe_kit.svg import encode_svg
+from wireframe_kit.tiles import encode_png_tiled
+
+
+def _canvas_with_image():
+    canvas = DisplayList(40, 30, '#FFFFFF')
+    canvas.paste(Image.new('RGB', (10, 8), '#FF0000'), (5, 6))
+    canvas.rectangle((20, 20, 30, 25), fill='#0000FF')
+    return canvas
+
+
+def test_paste_image_records_a_layer():
+    canvas = _canvas_with_image()
+    opcode, points, attrs = canvas.op(0)
+    assert opcode == OP_LAYER
+    assert points == [(5, 6)]
+    assert isinstance(attrs[0], Image.Image)
+
+
+def test_paste_image_rasterizes():
+    img = _canvas_with_image().rasterize()
+    assert img.getpixel((5, 6)) == (255, 0, 0)
+    assert img.getpixel((14, 13)) == (255, 0, 0)
+    assert img.getpixel((15, 14)) == (255, 255, 255)
+    assert img.getpixel((25, 22)) == (0, 0, 255)
+
+
+def test_paste_image_exports():
+    canvas = _canvas_with_image()
+    assert b'<image' in encode_svg(canvas)
+    assert encode_png_tiled(canvas).startswith(b'\x89PNG')
+
+
+def test_paste_display_list_rasterizes():
+    layer = DisplayList(10, 10, '#00FF00')
+    canvas = DisplayList(20, 20, '#FFFFFF')
+    canvas.paste(layer, (0, 0))
+    canvas.paste(layer, (10, 10))
+    img = canvas.rasterize()
+    assert img.getpixel((2, 2)) == (0, 255, 0)
+    assert img.getpixel((15, 15)) == (0, 255, 0)
+    assert img.getpixel((15, 2)) == (255, 255, 255)
+
+
+def test_ops_keep_more_than_65535_coordinates():
+    points = [(x % 40, x % 30) for x in range(40000)]
+    canvas = DisplayList(40, 30, '#FFFFFF')
+    canvas.line(points, fill='#000000')
+    assert canvas.op(0)[1] == points
@@ -0,0 +1,43 @@
+import io
+
+from PIL import Image
+
+from wireframe_kit import tiles
+from wireframe_kit.build import _render_task, parse_args
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.export import output_names
+
+
+def _scene():
+    canvas = DisplayList(80, 40, '#FFFFFF')
+    canvas.rounded_rectangle((10, 10, 70, 30), radius=6, fill='#1976D2')
+    return canvas
+
+
+def test_only_requested_formats_and_extra_scales_are_written():
+    assert parse_args('x', ['--format', 'svg']).formats == ('svg',)
+    assert parse_args('x', ['--format', 'svg'], scalable=False).formats == ('svg',)
+    assert parse_args('x', ['--format', 'svg', '--scales', '1,2']).formats == ('svg', 'png@2x')
+    assert parse_args('x', ['--scales', '1,3', '--thumbnail']).formats == ('png', 'png@3x', 'thumb320')
+
+
+def test_output_names():
+    assert output_names('02_list.png', ('png', 'png@2x', 'svg', 'thumb320')) == {
+        'png': '02_list.png', 'png@2x': '02_list@2x.png', 'svg': '02_list.svg',
+        'thumb320': '02_list_thumb.png'}
+
+
+def test_scales_of_one_scene_share_its_tile_index(monkeypatch):
+    built = []
+
+    class CountingIndex(tiles.TileIndex):
+        def __init__(self, canvas, *args):
+            built.append(canvas)
+            super().__init__(canvas, *args)
+
+    monkeypatch.setattr(tiles, 'TileIndex', CountingIndex)
+    outputs, error, *_ = _render_task(_scene, ('png', 'png@2x', 'png@3x', 'thumb40'))
+    assert error is None
+    assert len(built) == 1
+    sizes = {fmt: Image.open(io.BytesIO(data)).size for fmt, data in outputs.items()}
+    assert sizes == {'png': (80, 40), 'png@2x': (160, 80), 'png@3x': (240, 120), 'thumb40': (40, 20)}
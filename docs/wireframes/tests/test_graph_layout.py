@@ -0,0 +1,31 @@
+from wireframe_kit.graph_layout import Layout, layered_layout
+
+
+def test_empty_graph_is_an_empty_drawing():
+    assert layered_layout([], [], {}) == Layout({}, 0, 0, 0)
+
+
+def test_single_box_sits_at_the_origin():
+    layout = layered_layout(['a'], [], {'a': (10, 20)})
+    assert layout.boxes == {'a': (0, 0, 10, 20)}
+    assert (layout.width, layout.height) == (10, 20)
+
+
+def test_parent_sits_above_child():
+    layout = layered_layout(['a', 'b'], [('a', 'b')], {'a': (40, 20), 'b': (40, 20)})
+    assert layout.boxes['a'][3] < layout.boxes['b'][1]
+    assert layout.crossings == 0
+
+
+def test_unconnected_boxes_flow_in_rows():
+    nodes = list(range(5))
+    layout = layered_layout(nodes, [], dict.fromkeys(nodes, (40, 20)), max_columns=3, gap_x=10, gap_y=10)
+    assert [layout.boxes[n][:2] for n in nodes] == [(0, 0), (50, 0), (100, 0), (0, 30), (50, 30)]
+    assert (layout.width, layout.height) == (140, 50)
+
+
+def test_unconnected_boxes_wrap_at_the_connected_drawing():
+    sizes = dict.fromkeys('abcde', (40, 20))
+    layout = layered_layout('abcde', [('a', 'b'), ('a', 'c')], sizes, gap_x=10, gap_y=10)
+    assert layout.width == 90
+    assert layout.boxes['d'][1] == layout.boxes['e'][1] > layout.boxes['b'][1]
@@ -0,0 +1,53 @@
+import sys
+
+from wireframe_kit.build import build_outputs
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.manifest import fingerprint
+
+ACCENT = '#1976D2'
+
+
+def _badge(canvas):
+    canvas.rounded_rectangle((10, 10, 70, 30), radius=6, fill=ACCENT)
+
+
+def badge_screen():
+    canvas = DisplayList(80, 40, '#FFFFFF')
+    _badge(canvas)
+    return canvas
+
+
+def _build(tmp_path, **kwargs):
+    results = build_outputs([('badge.png', badge_screen)], str(tmp_path), **kwargs)
+    return [result.skipped for result in results]
+
+
+def test_unchanged_outputs_are_skipped(tmp_path):
+    assert _build(tmp_path) == [False]
+    assert _build(tmp_path) == [True]
+    assert _build(tmp_path, force=True) == [False]
+    (tmp_path / 'badge.png').unlink()
+    assert _build(tmp_path) == [False]
+    assert _build(tmp_path, formats=('png', 'svg')) == [False]
+    assert (tmp_path / 'badge.svg').exists()
+
+
+def test_fingerprint_follows_helpers_and_constants(monkeypatch):
+    before = fingerprint(badge_screen)
+    monkeypatch.setattr(sys.modules[__name__], 'ACCENT', '#0D47A1')
+    assert fingerprint(badge_screen) != before
+    monkeypatch.undo()
+    assert fingerprint(badge_screen) == before
+
+
+def test_fingerprint_follows_declared_inputs(tmp_path):
+    data = tmp_path / 'screen.yaml'
+    data.write_text('title: Clients\n')
+
+    def screen():
+        return badge_screen()
+
+    screen.inputs = lambda: [str(data)]
+    before = fingerprint(screen)
+    data.write_text('title: Leads\n')
+    assert fingerprint(screen) != before
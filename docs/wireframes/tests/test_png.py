@@ -0,0 +1,51 @@
+import io
+
+from PIL import Image
+
+from wireframe_kit.build import Quality, encode_png
+from wireframe_kit.display_list import DisplayList, as_image
+from wireframe_kit.fonts import get_font
+from wireframe_kit.png import encode
+from wireframe_kit.tiles import encode_png_tiled
+
+
+def _cards():
+    """Text and soft shadows, whose anti-aliasing a lossy palette bands"""
+    canvas = DisplayList(300, 700, '#F8FAFC')
+    font = get_font(12)
+    for i in range(10):
+        y = 10 + 60 * i
+        canvas.shadow((10, y, 200, y + 40), radius=8, blur=3, color='#00000015')
+        canvas.rounded_rectangle((10, y, 200, y + 40), radius=8, fill='#E3F2FD', outline='#1565C0', width=2)
+        canvas.text((20, y + 10), f"Row {i}", fill='#212121', font=font)
+    return canvas
+
+
+def _decode(data):
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img
+
+
+def test_default_encode_round_trips_pixels():
+    img = as_image(_cards())
+    assert _decode(encode(img)).convert('RGB').tobytes() == img.tobytes()
+    assert _decode(encode_png(img, Quality())).convert('RGB').tobytes() == img.tobytes()
+
+
+def test_tiled_encode_round_trips_pixels():
+    canvas = _cards()
+    img = as_image(canvas)
+    for palette in ('off', 'exact'):
+        data = encode_png_tiled(canvas, band=64, palette=palette)
+        assert _decode(data).convert('RGB').tobytes() == img.tobytes()
+
+
+def test_tiled_encode_follows_the_palette_mode():
+    canvas = _cards()
+    assert _decode(encode_png_tiled(canvas, band=64)).mode == 'RGB'
+    assert _decode(encode_png_tiled(canvas, band=64, palette='exact')).mode == 'P'
+    assert _decode(encode_png_tiled(canvas, band=64, palette='exact', colors=16)).mode == 'RGB'
+    adaptive = _decode(encode_png_tiled(canvas, band=64, palette='adaptive', colors=16))
+    assert adaptive.mode == 'P'
+    assert len(adaptive.convert('RGB').getcolors()) <= 16
@@ -0,0 +1,108 @@
+import sys
+
+import pytest
+
+from wireframe_kit import cli, registry
+from wireframe_kit.registry import Entry, Index, discover, select
+
+SCRIPT = """
+from wireframe_kit.registry import collect, generates
+
+OUTPUT_DIR = {output_dir!r}
+
+
+@generates({first!r}, 'crm')
+def create_list():
+    pass
+
+
+def helper():
+    pass
+
+
+@generates('{prefix}_board.png', 'crm', 'mobile')
+def create_board():
+    pass
+
+
+GENERATORS = collect(globals())
+"""
+
+
+@pytest.fixture
+def scripts(tmp_path, monkeypatch):
+    """Write generator scripts into tmp_path and make them importable"""
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(name, prefix, first=None):
+        path = tmp_path / f'{name}.py'
+        path.write_text(SCRIPT.format(output_dir=str(tmp_path), prefix=prefix,
+                                      first=first or f'{prefix}_list.png'))
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        return path
+
+    return write
+
+
+def test_select_matches_globs_against_every_name_and_requires_all_tags():
+    entries = [Entry('01_list.png', 'create_list', 'crm_script', ('crm',)),
+               Entry('02_board.png', 'create_board', 'crm_script', ('crm', 'mobile')),
+               Entry('erd.png', 'create_erd', 'diagram_script', ('diagram',))]
+    assert select(entries) == entries
+    assert select(entries, ['0[2-3]_*']) == entries[1:2]
+    assert select(entries, ['create_erd', '01_list']) == [entries[0], entries[2]]
+    assert select(entries, ['diagram_script:*']) == entries[2:]
+    assert select(entries, tags=['crm', 'mobile']) == entries[1:2]
+    assert select(entries, ['erd.png'], ['crm']) == []
+
+
+def test_discover_lists_registered_generators_and_refuses_shared_filenames(scripts):
+    scripts('fake_crm', 'crm')
+    scripts('fake_board', 'board', first='crm_list.png')
+    assert discover(['fake_crm']) == [
+        Entry('crm_list.png', 'create_list', 'fake_crm', ('crm',)),
+        Entry('crm_board.png', 'create_board', 'fake_crm', ('crm', 'mobile'))]
+    with pytest.raises(ValueError, match='crm_list.png is generated by both fake_crm and fake_board'):
+        discover(['fake_crm', 'fake_board'])
+
+
+def test_index_reimports_only_changed_scripts(scripts, tmp_path, monkeypatch):
+    scripts('fake_crm', 'crm')
+    board = scripts('fake_board', 'board')
+    described = []
+    describe = registry._describe
+    monkeypatch.setattr(registry, '_describe', lambda script: described.append(script) or describe(script))
+    index = Index(str(tmp_path), ['fake_crm', 'fake_board'])
+    entries = index.entries()
+    index.save()
+    assert Index(str(tmp_path), ['fake_crm', 'fake_board']).entries() == entries
+    assert described == ['fake_crm', 'fake_board']
+    board.write_text(board.read_text() + '\n')
+    Index(str(tmp_path), ['fake_crm', 'fake_board']).entries()
+    assert described == ['fake_crm', 'fake_board', 'fake_board']
+
+
+def test_outputs_stay_current_until_rewritten(scripts, tmp_path):
+    scripts('fake_crm', 'crm')
+    index = Index(str(tmp_path), ['fake_crm'])
+    entries = index.entries()
+    for entry in entries:
+        (tmp_path / entry.filename).write_bytes(b'png')
+    assert not index.up_to_date(entries, ('png',), '')
+    index.mark_current(entries, ('png',), '')
+    assert index.up_to_date(entries, ('png',), '')
+    assert not index.up_to_date(entries, ('png', 'svg'), '')
+    (tmp_path / 'crm_board.png').write_bytes(b'other png')
+    assert index.up_to_date(entries[:1], ('png',), '')
+    assert not index.up_to_date(entries, ('png',), '')
+
+
+def test_cli_lists_the_selection(scripts, tmp_path, monkeypatch, capsys):
+    scripts('fake_crm', 'crm')
+    monkeypatch.setattr(cli, 'Index', lambda cache_dir: Index(str(tmp_path), ['fake_crm']))
+    cli.main(['--list', '-t', 'mobile'])
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines[2:-1]] == ['crm_board.png']
+    assert lines[-1] == '(1 generators)'
+    with pytest.raises(SystemExit, match='No generator matches'):
+        cli.main(['--list', 'missing_*'])
@@ -0,0 +1,60 @@
+import random
+import time
+
+from wireframe_kit.graph_layout import layered_layout
+from wireframe_kit.routing import MAX_WIDENINGS, Router, route_edges
+
+# Four walls around (100, 100), so nothing inside can get out
+RING = {'top': (50, 50, 150, 90), 'bottom': (50, 110, 150, 150),
+        'left': (50, 50, 90, 150), 'right': (110, 50, 150, 150)}
+
+
+def _counting(router):
+    calls = []
+    search = router._search
+
+    def counted(a, b, pad):
+        calls.append(pad)
+        return search(a, b, pad)
+
+    router._search = counted
+    return calls
+
+
+def test_closed_off_search_widens_a_bounded_number_of_times():
+    router = Router(RING, clearance=1)
+    calls = _counting(router)
+    assert router._grid_route((100, 100), (400, 100)) is None
+    assert len(calls) == MAX_WIDENINGS + 1
+
+
+def test_search_out_of_steps_does_not_widen():
+    boxes = {i: (100 + 30 * i, 0, 120 + 30 * i, 400) for i in range(20)}
+    router = Router(boxes, clearance=1, max_steps=1)
+    calls = _counting(router)
+    assert router._grid_route((50, 200), (800, 200)) is None
+    assert len(calls) == 1
+
+
+def _layered_graph(count, seed=1):
+    """count boxes whose edges each reach back a few nodes"""
+    rnd = random.Random(seed)
+    nodes = list(range(count))
+    edges = sorted({(rnd.randrange(max(0, i - 12), i), i) for i in nodes[1:] for _ in range(2)})
+    sizes = {n: (rnd.randrange(120, 220), rnd.randrange(60, 200)) for n in nodes}
+    return layered_layout(nodes, edges, sizes).boxes, edges
+
+
+def _seconds_per_edge(count):
+    boxes, edges = _layered_graph(count)
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        route_edges(boxes, edges)
+        best = min(best, time.perf_counter() - start)
+    return best / len(edges)
+
+
+def test_routing_time_per_edge_does_not_grow_with_edges():
+    small, large = _seconds_per_edge(50), _seconds_per_edge(200)
+    assert large < 3 * small
@@ -0,0 +1,45 @@
+from wireframe_kit.schema import iter_statements, load_schema
+
+
+def _statements(sql):
+    return list(iter_statements(sql.splitlines(keepends=True)))
+
+
+def test_strings_and_comments_do_not_split_statements():
+    sql = """
+    INSERT INTO notes VALUES ('a; b', 'it''s');  -- trailing; comment
+    /* block; comment /* nested; */ still; comment */ SELECT 1;
+    """
+    assert _statements(sql) == ["INSERT INTO notes VALUES ('a; b', 'it''s')", 'SELECT 1']
+
+
+def test_function_bodies_are_skipped():
+    sql = """
+    CREATE FUNCTION touch() RETURNS TRIGGER AS $body$
+    BEGIN
+        INSERT INTO audit VALUES (NEW.id); -- not a migration statement
+        RETURN NEW;
+    END;
+    $body$ LANGUAGE plpgsql;
+    SELECT 2;
+    """
+    assert _statements(sql) == [
+        'CREATE FUNCTION touch() RETURNS TRIGGER AS $body$$body$ LANGUAGE plpgsql', 'SELECT 2']
+
+
+def test_do_blocks_contribute_their_statements(tmp_path):
+    (tmp_path / '001_schema.sql').write_text("""
+    CREATE TABLE clients (id UUID PRIMARY KEY);
+    CREATE TABLE leads (id UUID PRIMARY KEY);
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'leads' AND column_name = 'client_id') THEN
+            ALTER TABLE leads ADD COLUMN client_id UUID REFERENCES clients(id);
+        END IF;
+    END $$;
+    """)
+    schema = load_schema(str(tmp_path))
+    assert [column.name for column in schema.tables['leads'].columns] == ['id', 'client_id']
+    assert [(edge.table, edge.column, edge.ref_table) for edge in schema.edges()] == [
+        ('leads', 'client_id', 'clients')]
@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from wireframe_kit.screens import Frame, SpecError, load_screens
+
+FRAME = Frame(252, 80, 916, 768)
+
+
+def _specs(tmp_path):
+    good = tmp_path / '01_good.json'
+    good.write_text(json.dumps({'title': 'Good', 'sections': [{'filters': [{'search': 'Find...'}]}]}))
+    bad = tmp_path / '02_bad.json'
+    bad.write_text(json.dumps({'sections': []}))
+    return str(good), str(bad)
+
+
+def test_invalid_spec_raises_by_default(tmp_path):
+    with pytest.raises(SpecError, match="missing 'title'"):
+        load_screens(_specs(tmp_path), FRAME)
+
+
+def test_invalid_spec_is_skipped_when_collecting_errors(tmp_path):
+    good, bad = _specs(tmp_path)
+    errors = {}
+    screens = load_screens([good, bad], FRAME, str(tmp_path), errors)
+    assert [screen.title for screen in screens] == ['Good']
+    assert list(errors) == [bad]
+    cache = json.loads((tmp_path / '.screen-cache.json').read_text())
+    assert list(cache['files']) == ['01_good']
@@ -0,0 +1,45 @@
+from wireframe_kit import seeds
+from wireframe_kit.seeds import Expression, Volume, load_seeds
+
+SEED = """
+INSERT INTO public.clients (id, company_name, active, tags, created_at) VALUES
+    (1, 'O''Brien & Co', TRUE, ARRAY['a', 'b'], NOW()),
+    (2, 'Zenith', NULL, ARRAY[]::text[], '2024-01-05'::date);
+INSERT INTO clients (id, revenue) VALUES (3, 2.5e6);
+INSERT INTO archive SELECT * FROM clients;
+"""
+
+
+def _migrations(tmp_path):
+    tmp_path.mkdir(exist_ok=True)
+    (tmp_path / '001_schema.sql').write_text("CREATE TABLE clients (id INT PRIMARY KEY);\n")
+    (tmp_path / '002_seed.sql').write_text(SEED)
+    return tmp_path
+
+
+def test_inserts_become_typed_records(tmp_path):
+    rows = list(load_seeds(str(_migrations(tmp_path))).records('clients'))
+    assert rows[0] == (1, "O'Brien & Co", True, ['a', 'b'], Expression('NOW()'), None)
+    assert rows[1].active is None and rows[1].tags == [] and rows[1].created_at == '2024-01-05'
+    assert (rows[2].id, rows[2].company_name, rows[2].revenue) == (3, None, 2.5e6)
+
+
+def test_only_changed_migrations_are_parsed_again(tmp_path, monkeypatch):
+    migrations = _migrations(tmp_path / 'migrations')
+    parsed = []
+    parse_seeds = seeds.parse_seeds
+    monkeypatch.setattr(seeds, 'parse_seeds', lambda path: parsed.append(path) or parse_seeds(path))
+    load_seeds(str(migrations), str(tmp_path))
+    assert len(parsed) == 2
+    (migrations / '002_seed.sql').write_text(SEED.replace('Zenith', 'Zenith Bank'))
+    rows = list(load_seeds(str(migrations), str(tmp_path)).records('clients'))
+    assert parsed[2:] == [str(migrations / '002_seed.sql')]
+    assert rows[1].company_name == 'Zenith Bank'
+
+
+def test_volume_repeats_seeds_without_copying():
+    volume = Volume('abc', 7)
+    assert len(volume) == 7
+    assert volume[5] == 'c' and volume[-1] == 'a'
+    assert volume[2:5] == ['c', 'a', 'b']
+    assert volume.repeats() == [('a', 3), ('b', 2), ('c', 2)]
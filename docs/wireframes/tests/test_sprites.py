@@ -0,0 +1,64 @@
+from collections import OrderedDict
+
+import pytest
+from PIL import ImageFont
+
+from wireframe_kit import sprites
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.sprites import sprite
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sprites, 'SPRITE_DIR', str(tmp_path))
+    monkeypatch.setattr(sprites, '_memory', OrderedDict())
+    monkeypatch.setattr(sprites, '_memory_bytes', 0)
+    monkeypatch.setattr(sprites, '_disk', None)
+    monkeypatch.setattr(sprites, '_stats', dict.fromkeys(sprites._stats, 0))
+    return tmp_path
+
+
+@sprite
+def draw_chip(draw, x, y, text):
+    draw.shadow((x + 2, y + 2, x + 62, y + 22), radius=6, blur=2, color='#00000030')
+    draw.rounded_rectangle((x, y, x + 60, y + 20), radius=6, fill='#1976D2')
+    draw.text((x + 6, y + 4), text, fill='#FFFFFF', font=ImageFont.load_default())
+    draw.text((x + 64, y + 4), text, fill='#212121', font=ImageFont.load_default())
+
+
+def _scene(background):
+    canvas = DisplayList(120, 80, background)
+    canvas.rectangle((0, 30, 119, 79), fill='#FFEBEE')
+    draw_chip(canvas, 10, 5, "Open")
+    draw_chip(canvas, 10, 35, "Open")
+    return canvas
+
+
+def _painted(canvas):
+    """The canvas drawn op by op, without the sprite cache"""
+    canvas.sprites.clear()
+    return canvas.rasterize()
+
+
+def test_default_font_group_replays():
+    canvas = _scene('#FFFFFF')
+    assert canvas.sprites
+    assert canvas.rasterize().tobytes() == _painted(_scene('#FFFFFF')).tobytes()
+    assert sprites.sprite_cache_info()['misses'] == 1
+
+
+def test_hit_over_other_pixels_matches_a_redraw(cache):
+    _scene('#FFFFFF').rasterize()
+    assert len(list(cache.iterdir())) == 1
+    img = _scene('#ECEFF1').rasterize()
+    info = sprites.sprite_cache_info()
+    assert (info['misses'], info['hits']) == (1, 3)
+    assert img.tobytes() == _painted(_scene('#ECEFF1')).tobytes()
+
+
+def test_sprites_are_read_back_from_disk(monkeypatch):
+    _scene('#FFFFFF').rasterize()
+    monkeypatch.setattr(sprites, '_memory', OrderedDict())
+    img = _scene('#FFFFFF').rasterize()
+    assert sprites.sprite_cache_info()['disk_hits'] == 1
+    assert img.tobytes() == _painted(_scene('#FFFFFF')).tobytes()
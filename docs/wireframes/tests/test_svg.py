@@ -0,0 +1,51 @@
+import xml.etree.ElementTree as ET
+
+from PIL import ImageFont
+
+from wireframe_kit.display_list import DisplayList
+from wireframe_kit.svg import encode_svg
+
+NS = '{http://www.w3.org/2000/svg}'
+
+
+def _elements(canvas, tag):
+    root = ET.fromstring(encode_svg(canvas))
+    return [element.attrib for element in root.iter(NS + tag)]
+
+
+def test_shapes_follow_pillow_pixel_model():
+    canvas = DisplayList(40, 30, '#FAFAFA')
+    canvas.rectangle((10, 10, 19, 19), fill='#1976D2')
+    canvas.rectangle((0, 0, 9, 9), outline='#000000', width=2)
+    canvas.line([(0, 20), (39, 20)], fill='#00000080', width=1)
+    background, filled, outlined = _elements(canvas, 'rect')
+    assert background['fill'] == '#FAFAFA'
+    assert (filled['x'], filled['width'], filled['fill']) == ('10', '10', '#1976D2')
+    assert (outlined['x'], outlined['width'], outlined['fill']) == ('1', '8', 'none')
+    line, = _elements(canvas, 'polyline')
+    assert line['points'] == '0.5,20.5 39.5,20.5'
+    assert (line['stroke'], line['stroke-opacity']) == ('#000000', '0.5')
+
+
+def test_text_is_escaped_and_sits_on_its_baseline():
+    font = ImageFont.load_default(size=12)
+    canvas = DisplayList(80, 30)
+    canvas.text((4, 6), 'Q&A <draft>', fill='#333333', font=font)
+    root = ET.fromstring(encode_svg(canvas))
+    text = root.find(NS + 'text')
+    assert text.text == 'Q&A <draft>'
+    assert float(text.attrib['y']) == 6 + font.getmetrics()[0]
+
+
+def test_shadows_share_filters_and_layers_nest():
+    card = DisplayList(20, 10, '#FFFFFF')
+    card.ellipse((0, 0, 9, 9), fill='#FF0000')
+    canvas = DisplayList(60, 40)
+    canvas.shadow((2, 2, 22, 12), blur=4)
+    canvas.shadow((30, 2, 50, 12), blur=4)
+    canvas.shadow((2, 20, 22, 30), blur=6)
+    canvas.paste(card, (30, 20))
+    assert [f['id'] for f in _elements(canvas, 'filter')] == ['shadow-4', 'shadow-6']
+    nested = _elements(canvas, 'svg')[1:]
+    assert [(n['x'], n['y'], n['width']) for n in nested] == [('30', '20', '20')]
+    assert _elements(canvas, 'ellipse')[0]['rx'] == '5'
@@ -0,0 +1,46 @@
+import os
+
+from PIL import Image
+
+from wireframe_kit import tiles
+from wireframe_kit.build import Quality, Streamed, build_outputs
+from wireframe_kit.display_list import DisplayList, as_image
+from wireframe_kit.tiles import TileIndex, encode_png_tiled
+
+
+def _poster():
+    canvas = DisplayList(200, 900, '#FFFFFF')
+    for i in range(30):
+        canvas.rounded_rectangle((10, 30 * i, 190, 30 * i + 20), radius=6, fill='#E3F2FD', outline='#1565C0')
+    return canvas
+
+
+def test_index_culls_ops_outside_a_band():
+    index = TileIndex(_poster(), band=64)
+    assert index.ops_between(0, 64) == [0, 1, 2]
+    # only ops in the buckets of rows 256-383
+    assert {9, 10} <= set(index.ops_between(300, 330)) <= set(range(8, 13))
+
+
+def test_palette_output_renders_each_band_once(monkeypatch):
+    rendered = []
+    render_region = tiles.render_region
+
+    def counted(canvas, img, left, top, *args):
+        rendered.append(top)
+        return render_region(canvas, img, left, top, *args)
+
+    monkeypatch.setattr(tiles, 'render_region', counted)
+    encode_png_tiled(_poster(), band=100, palette='exact')
+    assert rendered == list(range(0, 900, 100))
+
+
+def test_huge_canvas_is_streamed_to_its_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiles, 'TILED_PIXELS', 1000)
+    result, = build_outputs([('poster.png', _poster)], str(tmp_path), quality=Quality(palette='exact'))
+    assert result.error is None
+    assert isinstance(result.outputs['png'], Streamed)
+    assert sorted(os.listdir(tmp_path)) == ['.build-manifest.json', 'poster.png']
+    with Image.open(tmp_path / 'poster.png') as img:
+        assert img.mode == 'P'
+        assert img.convert('RGB').tobytes() == as_image(_poster()).tobytes()
@@ -0,0 +1,3 @@
+"""
+Shared rendering helpers for the TeamACE wireframe and diagram generators
+"""
@@ -0,0 +1,7 @@
+"""
+Entry point for python3 -m wireframe_kit (see wireframe_kit.cli)
+"""
+
+from wireframe_kit.cli import main
+
+main()
@@ -0,0 +1,180 @@
+"""
+Render benchmark for every generator
+
+Each generator runs N times in its own worker process so peak RSS and cache
+warm-up belong to that generator alone. Every iteration is split into three
+phases: draw (calling the create_* function), rasterize (turning a display
+list into pixels; zero for generators that paint directly) and encode (PNG
+compression). Results are printed as a table and can be written as JSON for
+tracking regressions across commits.
+
+Usage, from docs/wireframes:
+    python3 -m wireframe_kit.bench -n 10 --json bench.json
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from wireframe_kit import registry
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _iterations(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return value
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(values):
+    """min/median/p95 of a list of milliseconds"""
+    return {
+        'min': round(min(values), 3),
+        'median': round(statistics.median(values), 3),
+        'p95': round(percentile(values, 95), 3),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MiB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _run_generator(script, filename, iterations):
+    """Worker: time one generator and return its raw measurements"""
+    from wireframe_kit.build import encode_png
+    from wireframe_kit.display_list import DisplayList
+
+    module = importlib.import_module(script)
+    generator = dict(module.GENERATORS)[filename]
+
+    draw_ms, raster_ms, encode_ms = [], [], []
+    png_bytes = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        canvas = generator()
+        drawn = time.perf_counter()
+        img = canvas.rasterize() if isinstance(canvas, DisplayList) else canvas
+        rastered = time.perf_counter()
+        png_bytes = len(encode_png(img))
+        encoded = time.perf_counter()
+
+        draw_ms.append((drawn - start) * 1000)
+        raster_ms.append((rastered - drawn) * 1000)
+        encode_ms.append((encoded - rastered) * 1000)
+
+    return {
+        'script': script,
+        'filename': filename,
+        'generator': generator.__name__,
+        'iterations': iterations,
+        'cold_ms': round(draw_ms[0] + raster_ms[0] + encode_ms[0], 3),
+        'draw_ms': summarize(draw_ms),
+        'rasterize_ms': summarize(raster_ms),
+        'encode_ms': summarize(encode_ms),
+        'total_ms': summarize([d + r + e for d, r, e in zip(draw_ms, raster_ms, encode_ms)]),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'png_bytes': png_bytes,
+    }
+
+
+def discover(patterns=None):
+    """List (script, filename, generator name) for every registered generator"""
+    return [(entry.script, entry.filename, entry.name)
+            for entry in registry.select(registry.discover(), patterns or ())]
+
+
+def run(targets, iterations):
+    """Benchmark each target in a fresh single-worker process"""
+    # spawn, not fork, so workers do not inherit fonts loaded by discover()
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for script, filename, _ in targets:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(_run_generator, script, filename, iterations).result())
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=SOURCE_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(iterations):
+    """Environment details stored alongside the results"""
+    import PIL
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'pillow': PIL.__version__,
+        'platform': platform.platform(),
+        'iterations': iterations,
+    }
+
+
+def print_table(results):
+    """Print a human-readable summary"""
+    print(f"{'generator':<50} {'draw':>8} {'raster':>8} {'encode':>8} {'total':>8} "
+          f"{'p95':>8} {'rss MB':>7}")
+    print("-" * 103)
+    for r in results:
+        print(f"{r['script'][9:] + ':' + r['generator'][7:]:<50} "
+              f"{r['draw_ms']['median']:8.1f} {r['rasterize_ms']['median']:8.1f} "
+              f"{r['encode_ms']['median']:8.1f} {r['total_ms']['median']:8.1f} "
+              f"{r['total_ms']['p95']:8.1f} {r['peak_rss_mb']:7.1f}")
+    print("(median milliseconds unless noted)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every wireframe and diagram generator")
+    parser.add_argument('-n', '--iterations', type=_iterations, default=5, metavar='N',
+                        help="renders per generator (default: 5)")
+    parser.add_argument('--json', metavar='PATH', help="write machine-readable results to PATH")
+    parser.add_argument('patterns', nargs='*',
+                        help="only run generators whose filename or function matches a glob")
+    args = parser.parse_args(argv)
+
+    if SOURCE_ROOT not in sys.path:
+        sys.path.insert(0, SOURCE_ROOT)
+
+    results = run(discover(args.patterns), args.iterations)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'meta': metadata(args.iterations), 'results': results}, f, indent=2)
+            f.write('\n')
+        print(f"Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+"""
+Build driver shared by the generator scripts
+
+Renders a list of (filename, generator) entries either in-process or fanned
+out across a process pool. Workers return encoded PNG and/or SVG bytes so the
+parent does all the file writing and reporting, except for canvases too large
+to rasterize at once: their bands are streamed into a temporary file next to
+the output, which the parent renames into place. Entries whose fingerprint
+matches the build manifest are skipped without rendering.
+
+Only what parsing the command line needs is imported up front; the
+rasterizers, encoders, manifest and process pool are imported by the
+functions that use them, so --help and the wireframe_kit CLI's listing do
+not load Pillow.
+"""
+
+import argparse
+import os
+import time
+import traceback
+from collections import namedtuple
+from itertools import repeat
+
+from wireframe_kit import png, profiling
+from wireframe_kit.export import (
+    HIDPI_SCALES, THUMBNAIL_WIDTH, key_scale, key_thumbnail, output_keys, output_names, render_scale,
+    thumbnail,
+)
+
+FORMATS = {
+    'png': ('png',),
+    'svg': ('svg',),
+    'both': ('png', 'svg'),
+}
+
+# Supersampling factors for the quality mode (1 = off)
+SCALES = (1, 2, 3)
+
+RenderResult = namedtuple('RenderResult', 'filename outputs error traceback cost timings skipped',
+                          defaults=(None, None, False))
+
+# An output a worker already wrote to the temporary file path
+Streamed = namedtuple('Streamed', 'path size')
+
+# How PNGs come out: supersampling scale and whether to limit it to the
+# regions that alias, then the encoder settings (see wireframe_kit.png)
+Quality = namedtuple('Quality', 'scale regions compress_level optimize palette colors zopfli',
+                     defaults=(1, False, 9, False, 'off', 256, False))
+
+
+def _scales(text):
+    scales = tuple(sorted({int(part) for part in text.split(',')}))
+    if not set(scales) <= set(HIDPI_SCALES):
+        raise argparse.ArgumentTypeError(f"scales must be among {HIDPI_SCALES}")
+    return scales
+
+
+def build_parser(description, scalable=True, watchable=True):
+    """Argument parser with the command line options common to all generators
+
+    scalable=False hides --scales for scripts whose generators return raw
+    Pillow images, which cannot be re-rendered at another scale;
+    watchable=False hides --watch where there is no single script to watch.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="render in N worker processes (0 = one per CPU)")
+    parser.add_argument('-f', '--force', action='store_true',
+                        help="re-render every image even if its inputs are unchanged")
+    parser.add_argument('--format', choices=sorted(FORMATS), default='png',
+                        help="output PNG, SVG or both (default: png)")
+    if watchable:
+        parser.add_argument('--watch', action='store_true',
+                            help="after building, keep running and re-render the images whose "
+                                 "source, specs or data files change")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every draw helper and primitive and print the hot paths "
+                             "(renders every image serially)")
+    parser.add_argument('--supersample', type=int, choices=SCALES, default=1, metavar='N',
+                        help="quality mode: render display-list images at N times the size "
+                             "(2 or 3) and downsample them, reporting the added cost")
+    parser.add_argument('--aa-regions', action='store_true',
+                        help="with --supersample, only supersample rounded corners, curves, "
+                             "polygons and diagonal lines")
+    parser.add_argument('--compress-level', type=int, choices=range(10), default=9, metavar='0-9',
+                        help="zlib compression level for PNGs (default: 9)")
+    parser.add_argument('--optimize', action='store_true',
+                        help="let the PNG encoder search for a smaller encoding")
+    parser.add_argument('--palette', choices=png.PALETTES, default='off',
+                        help="write palette PNGs: 'off' keeps RGB (default), 'exact' only "
+                             "when lossless, 'adaptive' quantizes by median cut (lossy)")
+    parser.add_argument('--colors', type=int, choices=range(2, 257), default=256, metavar='2-256',
+                        help="palette size for --palette (default: 256)")
+    parser.add_argument('--zopfli', action='store_true',
+                        help="recompress each PNG with zopfli if installed, else with every "
+                             "zlib strategy, keeping the smallest")
+    if scalable:
+        parser.add_argument('--scales', type=_scales, default=(1,), metavar='1,2,3',
+                            help="also export name@2x.png / name@3x.png replayed from the same "
+                                 "scene (default: 1)")
+    parser.add_argument('--thumbnail', type=int, nargs='?', const=THUMBNAIL_WIDTH, default=0,
+                        metavar='WIDTH',
+                        help=f"also export name_thumb.png (default width {THUMBNAIL_WIDTH})")
+    return parser
+
+
+def finish_args(args):
+    """Derive formats and quality from parsed options"""
+    args.formats = output_keys(FORMATS[args.format], getattr(args, 'scales', (1,)), args.thumbnail)
+    args.quality = Quality(args.supersample, args.aa_regions, args.compress_level, args.optimize,
+                           args.palette, args.colors, args.zopfli)
+    if args.profile:
+        # counters live in this process, so workers would report nothing, and
+        # skipped images would leave nothing to time
+        args.jobs = 1
+        args.force = True
+    return args
+
+
+def parse_args(description, argv=None, scalable=True):
+    """Parse the command line options common to all generators"""
+    return finish_args(build_parser(description, scalable).parse_args(argv))
+
+
+def encode_png(img, quality=Quality()):
+    """Encode an image as PNG bytes with the quality's encoder settings"""
+    return png.encode(img, quality.compress_level, quality.optimize, quality.palette,
+                      quality.colors, quality.zopfli)
+
+
+def quality_tag(quality):
+    """Manifest variant describing how PNGs are rendered and encoded"""
+    tag = (f"level={quality.compress_level},optimize={quality.optimize},"
+           f"palette={quality.palette}/{quality.colors},zopfli={quality.zopfli}")
+    if quality.scale > 1:
+        tag += f",supersample={quality.scale}" + (",regions" if quality.regions else "")
+    return tag
+
+
+def _png_source(canvas, fmt, quality, rasters, indexes):
+    """(image, band-renderer kwargs, SupersampleCost) to encode for a PNG output key
+
+    The image is None when the canvas is too large to rasterize at once and
+    has to be streamed through the band renderer with the kwargs instead.
+    rasters collects HiDPI renders so the thumbnail can reuse the largest,
+    and indexes the TileIndex of the scene, built once for all its outputs.
+    """
+    from wireframe_kit.display_list import DisplayList, as_image
+    from wireframe_kit.supersample import supersample
+    from wireframe_kit.tiles import needs_tiling
+
+    width = key_thumbnail(fmt)
+    if width:
+        return thumbnail(canvas, width, rasters, indexes), None, None
+    scale = key_scale(fmt)
+    if scale == 1:
+        if quality.scale > 1 and isinstance(canvas, DisplayList):
+            if needs_tiling(canvas, quality.scale):
+                # Bands are always supersampled whole; the cost is not measured
+                return None, {'scale': quality.scale}, None
+            img, cost = supersample(canvas, quality.scale, quality.regions, indexes)
+            return img, None, cost
+        if needs_tiling(canvas):
+            return None, {}, None
+        return as_image(canvas), None, None
+    if not isinstance(canvas, DisplayList):
+        raise TypeError(f"cannot export at {scale}x: the generator returned a raster image")
+    if needs_tiling(canvas, scale):
+        return None, {'scale': scale, 'hidpi': True}, None
+    rasters[scale] = render_scale(canvas, scale, indexes)
+    return rasters[scale], None, None
+
+
+def _stream_png(canvas, path, tiled, quality, indexes):
+    """Stream a banded PNG into a temporary file next to path, or into bytes without a path"""
+    from wireframe_kit.tiles import encode_png_tiled, write_png_tiled
+
+    options = dict(tiled, compress_level=quality.compress_level, palette=quality.palette,
+                   colors=quality.colors, indexes=indexes)
+    if path is None:
+        return encode_png_tiled(canvas, **options)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            write_png_tiled(canvas, f, **options)
+    except BaseException:
+        _remove(tmp_path)
+        raise
+    return Streamed(tmp_path, os.path.getsize(tmp_path))
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _discard(outputs):
+    """Remove the temporary files of streamed outputs"""
+    for data in outputs.values():
+        if isinstance(data, Streamed):
+            _remove(data.path)
+
+
+def _render_task(generator, formats=('png',), quality=Quality(), paths=None):
+    """Run one generator and return ({format: bytes}, error, traceback, cost, {format: ms})
+
+    paths maps formats to the files they go to; banded PNGs are then
+    streamed next to them and returned as Streamed instead of bytes. The
+    times are spent encoding each output (streamed band rendering included
+    for huge canvases).
+    """
+    from wireframe_kit.svg import encode_svg
+
+    outputs = {}
+    try:
+        with profiling.screen(generator.__name__):
+            canvas = generator()
+            timings, cost = {}, None
+            rasters, indexes = {}, {}
+            for fmt in formats:
+                if fmt == 'svg':
+                    start = time.perf_counter()
+                    outputs[fmt] = encode_svg(canvas)
+                else:
+                    img, tiled, fmt_cost = _png_source(canvas, fmt, quality, rasters, indexes)
+                    cost = cost or fmt_cost
+                    start = time.perf_counter()
+                    if img is None:
+                        outputs[fmt] = _stream_png(canvas, (paths or {}).get(fmt), tiled, quality,
+                                                   indexes)
+                    else:
+                        outputs[fmt] = encode_png(img, quality)
+                timings[fmt] = (time.perf_counter() - start) * 1000
+            return outputs, None, None, cost, timings
+    except Exception as e:
+        _discard(outputs)
+        return None, str(e), traceback.format_exc(), None, None
+
+
+def _size(data):
+    return data.size if isinstance(data, Streamed) else len(data)
+
+
+def describe(result):
+    """Sizes and encode times of a result's outputs, plus any supersampling cost"""
+    if not result.outputs:
+        return ""
+    parts = [f"{png.format_size(_size(data))} in {result.timings[fmt]:.0f} ms" for fmt, data in result.outputs.items()]
+    if len(parts) > 1:
+        parts = [f"{fmt} {part}" for fmt, part in zip(result.outputs, parts)]
+    if result.cost:
+        from wireframe_kit.supersample import format_cost
+
+        parts.append(format_cost(result.cost))
+    return ", ".join(parts)
+
+
+def render_all(entries, jobs=1, formats=('png',), quality=Quality(), output_dir=None):
+    """Render (filename, generator) entries, yielding RenderResults in order
+
+    With output_dir, banded PNGs are streamed to temporary files there
+    (see Streamed) instead of being returned as bytes.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(entries))
+
+    filenames = [filename for filename, _ in entries]
+    generators = [generator for _, generator in entries]
+    paths = [None if output_dir is None else
+             {fmt: os.path.join(output_dir, name) for fmt, name in output_names(filename, formats).items()}
+             for filename in filenames]
+    if jobs <= 1:
+        for filename, generator, path in zip(filenames, generators, paths):
+            yield RenderResult(filename, *_render_task(generator, formats, quality, path))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_render_task, generators, repeat(formats), repeat(quality), paths)
+        for filename, result in zip(filenames, results):
+            yield RenderResult(filename, *result)
+
+
+def write_output(output_dir, filename, data):
+    """Write encoded image bytes, or move a Streamed file, into the output directory"""
+    filepath = os.path.join(output_dir, filename)
+    if isinstance(data, Streamed):
+        os.replace(data.path, filepath)
+        return filepath
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    return filepath
+
+
+def build_outputs(entries, output_dir, jobs=1, force=False, font_paths=(), formats=('png',),
+                  quality=Quality()):
+    """Render and write the entries whose inputs changed, yielding RenderResults in order
+
+    Unchanged entries are yielded with skipped=True. The manifest is updated
+    after every successful write so an interrupted build keeps its progress.
+    """
+    from wireframe_kit.manifest import (
+        load_manifest, output_digest, save_manifest, stale_entries,
+    )
+
+    manifest = load_manifest(output_dir)
+    variant = quality_tag(quality)
+    stale, _ = stale_entries(entries, output_dir, manifest, font_paths, force, formats, variant)
+    digests = {filename: digest for filename, _, digest in stale}
+
+    rendered = render_all([(filename, generator) for filename, generator, _ in stale], jobs, formats,
+                          quality, output_dir)
+    for filename, _ in entries:
+        if filename not in digests:
+            yield RenderResult(filename, None, None, None, skipped=True)
+            continue
+        result = next(rendered)
+        if not result.error:
+            for fmt, name in output_names(filename, formats).items():
+                write_output(output_dir, name, result.outputs[fmt])
+                manifest[name] = output_digest(digests[filename], fmt, variant)
+            save_manifest(output_dir, manifest)
+        yield result
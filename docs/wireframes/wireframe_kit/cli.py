@@ -0,0 +1,125 @@
+"""
+Render any subset of the wireframes and diagrams in one process
+
+Every generator of the three scripts is listed in one registry, so the
+images can be picked by glob and tag instead of running each script in
+full. Everything selected renders in this process (or its pool with -j),
+so Python, Pillow and the font, text metric and shadow caches start up
+once however many scripts the selection spans.
+
+Listing, --help and a run with nothing to do are answered from the
+registry index without importing the scripts or Pillow's drawing code.
+This module rather than __main__ holds the command so that its bytecode is
+cached; python -m compiles __main__ afresh on every run.
+
+Usage, from docs/wireframes:
+    python3 -m wireframe_kit --list
+    python3 -m wireframe_kit -t crm -t desktop
+    python3 -m wireframe_kit '0[5-6]_*' erd_diagram.png
+"""
+
+import importlib
+import itertools
+import os
+import sys
+
+from wireframe_kit import profiling
+from wireframe_kit.build import build_outputs, build_parser, describe, finish_args, quality_tag
+from wireframe_kit.registry import Index, select
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def print_entries(entries):
+    """Print one line per generator: filename, script and tags"""
+    print(f"{'filename':<34} {'script':<34} tags")
+    print("-" * 90)
+    for entry in entries:
+        print(f"{entry.filename:<34} {entry.script:<34} {', '.join(entry.tags)}")
+    print(f"({len(entries)} generators)")
+
+
+def render(entries, index, args):
+    """Build the entries script by script, returning how many failed"""
+    variant = quality_tag(args.quality)
+    failed = 0
+    for script, group in itertools.groupby(entries, key=lambda entry: entry.script):
+        group = list(group)
+        module = importlib.import_module(script)
+        generators = dict(module.GENERATORS)
+        current = []
+        for entry, result in zip(group, build_outputs(
+                [(entry.filename, generators[entry.filename]) for entry in group], module.OUTPUT_DIR,
+                jobs=args.jobs, force=args.force, font_paths=module.FONT_PATHS, formats=args.formats,
+                quality=args.quality)):
+            if result.error:
+                failed += 1
+                print(f"  ERROR: {result.filename} - {result.error}")
+                print(result.traceback, end='', file=sys.stderr)
+                continue
+            current.append(entry)
+            if result.skipped:
+                print(f"  Unchanged: {result.filename}")
+                continue
+            details = describe(result)
+            print(f"  Generated: {result.filename}" + (f" ({details})" if details else ""))
+        index.mark_current(current, args.formats, variant)
+        index.save()
+    return failed
+
+
+def main(argv=None):
+    parser = build_parser("Render the selected wireframes and diagrams", watchable=False)
+    parser.add_argument('-l', '--list', action='store_true',
+                        help="list the selected generators instead of rendering them")
+    parser.add_argument('-t', '--tag', action='append', default=[],
+                        help="only generators tagged TAG (repeat to require several)")
+    parser.add_argument('patterns', nargs='*',
+                        help="only generators whose filename, function or script:filename "
+                             "matches a glob")
+    args = finish_args(parser.parse_args(argv))
+
+    if SOURCE_ROOT not in sys.path:
+        sys.path.insert(0, SOURCE_ROOT)
+    index = Index(SOURCE_ROOT)
+    try:
+        entries = select(index.entries(), args.patterns, args.tag)
+    except ValueError as e:
+        sys.exit(f"ERROR: {e}")
+    index.save()
+    if not entries:
+        sys.exit("No generator matches the given patterns and tags")
+
+    if args.list:
+        print_entries(entries)
+        return
+
+    print(f"Rendering {len(entries)} wireframes and diagrams...")
+    print("=" * 60)
+    if not args.force and index.up_to_date(entries, args.formats, quality_tag(args.quality)):
+        for entry in entries:
+            print(f"  Unchanged: {entry.filename}")
+        print("=" * 60)
+        print(f"{len(entries)} of {len(entries)} images up to date")
+        return
+
+    if args.profile:
+        for script in {entry.script for entry in entries}:
+            profiling.instrument(vars(importlib.import_module(script)))
+    failed = render(entries, index, args)
+    print("=" * 60)
+    print(f"{len(entries) - failed} of {len(entries)} images up to date")
+    if args.jobs == 1:
+        from wireframe_kit.fonts import print_font_cache_info
+        from wireframe_kit.sprites import print_sprite_cache_info
+
+        print_font_cache_info()
+        print_sprite_cache_info()
+    if args.profile:
+        profiling.print_report()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
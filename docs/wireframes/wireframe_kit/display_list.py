@@ -0,0 +1,225 @@
+"""
+Retained display list for the drawing helpers
+
+A DisplayList exposes the subset of the ImageDraw API the generators use
+(rectangle, rounded_rectangle, ellipse, polygon, line, text, pieslice, arc,
+textbbox, textlength) plus Image.paste and a shadow() op for soft drop
+shadows, so every draw_* helper can record into it unchanged. Ops are stored
+in flat arrays: an opcode, a slice of a shared coordinate array and an index
+into an interned attribute table. Pasted layers (DisplayLists or Pillow
+images, which are not hashable) live in a side table instead, and the
+attributes of a layer op hold their index. rasterize() replays the list onto
+a Pillow image in one pass; recording needs no Pillow, which is only
+imported to rasterize.
+"""
+
+from array import array
+from contextlib import contextmanager
+
+from wireframe_kit.fonts import text_bbox, text_length
+from wireframe_kit.shadows import composite_shadow
+
+OP_RECT = 0
+OP_ROUNDED_RECT = 1
+OP_ELLIPSE = 2
+OP_POLYGON = 3
+OP_LINE = 4
+OP_TEXT = 5
+OP_PIESLICE = 6
+OP_ARC = 7
+OP_LAYER = 8
+OP_SHADOW = 9
+
+OP_NAMES = ('rect', 'rounded_rect', 'ellipse', 'polygon', 'line', 'text',
+            'pieslice', 'arc', 'layer', 'shadow')
+
+def _flatten(xy):
+    """Flatten any ImageDraw coordinate form into a list of numbers"""
+    flat = []
+    for item in xy:
+        if isinstance(item, (tuple, list)):
+            flat.extend(item)
+        else:
+            flat.append(item)
+    return flat
+
+
+def _number(value):
+    """Turn a stored float back into an int when it was one"""
+    return int(value) if value.is_integer() else value
+
+
+class DisplayList:
+    """Recorded drawing ops for one canvas"""
+
+    mode = 'RGB'
+
+    def __init__(self, width, height, background='#FFFFFF'):
+        self.size = (width, height)
+        self.width = width
+        self.height = height
+        self.background = background
+
+        self.opcodes = array('B')
+        self.offsets = array('I')
+        self.counts = array('I')
+        self.coords = array('d')
+        self.attr_ids = array('I')
+        self.attrs = []
+        self._attr_index = {}
+        self.layers = []
+        self._raster = None
+        # first op of each component group -> (end, key, origin); see sprites
+        self.sprites = {}
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def _emit(self, opcode, xy, attrs):
+        """Append one op"""
+        flat = _flatten(xy)
+        attr_id = self._attr_index.get(attrs)
+        if attr_id is None:
+            attr_id = len(self.attrs)
+            self.attrs.append(attrs)
+            self._attr_index[attrs] = attr_id
+
+        self.opcodes.append(opcode)
+        self.offsets.append(len(self.coords))
+        self.counts.append(len(flat))
+        self.coords.extend(flat)
+        self.attr_ids.append(attr_id)
+        self._raster = None
+
+    def points(self, index):
+        """Return op index's coordinates as a list of (x, y) tuples"""
+        start = self.offsets[index]
+        values = [_number(v) for v in self.coords[start:start + self.counts[index]]]
+        return list(zip(values[0::2], values[1::2]))
+
+    def attributes(self, index):
+        """Attributes of op index, with a layer op's index resolved to the layer"""
+        attrs = self.attrs[self.attr_ids[index]]
+        if self.opcodes[index] == OP_LAYER:
+            return (self.layers[attrs[0]],)
+        return attrs
+
+    def op(self, index):
+        """(opcode, points, attrs) of op index"""
+        return self.opcodes[index], self.points(index), self.attributes(index)
+
+    def ops(self, start, stop):
+        """Yield (opcode, points, attrs) for ops [start, stop)"""
+        for index in range(start, stop):
+            yield self.op(index)
+
+    def __iter__(self):
+        """Yield (opcode, points, attrs) for every op in paint order"""
+        for index, opcode in enumerate(self.opcodes):
+            yield opcode, self.points(index), self.attributes(index)
+
+    @contextmanager
+    def sprite(self, key, origin):
+        """Mark the ops recorded inside the block as one cacheable component
+
+        key identifies what the ops draw relative to origin, the component's
+        position; rasterize() pastes a cached bitmap for it when it can.
+        """
+        start = len(self.opcodes)
+        yield
+        if len(self.opcodes) > start:
+            self.sprites[start] = (len(self.opcodes), key, origin)
+
+    # ImageDraw-compatible recording API
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self._emit(OP_RECT, xy, (fill, outline, width))
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        self._emit(OP_ROUNDED_RECT, xy, (fill, outline, width, radius))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self._emit(OP_ELLIPSE, xy, (fill, outline, width))
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        self._emit(OP_POLYGON, xy, (fill, outline, width))
+
+    def line(self, xy, fill=None, width=1):
+        self._emit(OP_LINE, xy, (fill, width))
+
+    def text(self, xy, text, fill=None, font=None):
+        self._emit(OP_TEXT, xy, (text, fill, font))
+
+    def pieslice(self, xy, start, end, fill=None, outline=None, width=1):
+        self._emit(OP_PIESLICE, xy, (fill, outline, width, start, end))
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        self._emit(OP_ARC, xy, (fill, width, start, end))
+
+    def paste(self, layer, xy):
+        """Composite a DisplayList or Image at xy"""
+        self.layers.append(layer)
+        self._emit(OP_LAYER, xy, (len(self.layers) - 1,))
+
+    def shadow(self, xy, radius=8, blur=5, color='#00000015'):
+        """Soft shadow under the rounded rectangle xy"""
+        self._emit(OP_SHADOW, xy, (radius, blur, color))
+
+    def textbbox(self, xy, text, font=None):
+        return text_bbox(text, font, xy)
+
+    def textlength(self, text, font=None):
+        return text_length(text, font)
+
+    # Rasterization
+
+    def rasterize(self, img=None):
+        """Replay the ops onto img, or onto a new background-filled image"""
+        from PIL import Image, ImageDraw
+
+        if img is None:
+            img = Image.new(self.mode, self.size, self.background)
+        draw = ImageDraw.Draw(img)
+        if self.sprites:
+            from wireframe_kit.sprites import replay
+
+            return replay(self, img, draw)
+        for opcode, points, attrs in self:
+            _PAINTERS[opcode](img, draw, points, attrs)
+        return img
+
+    def to_image(self):
+        """Rasterize once and reuse the result until the list changes"""
+        if self._raster is None:
+            self._raster = self.rasterize()
+        return self._raster
+
+
+def _paint_layer(img, draw, points, attrs):
+    layer = attrs[0]
+    if isinstance(layer, DisplayList):
+        layer = layer.to_image()
+    img.paste(layer, points[0])
+
+
+_PAINTERS = {
+    OP_RECT: lambda img, draw, xy, a: draw.rectangle(xy, fill=a[0], outline=a[1], width=a[2]),
+    OP_ROUNDED_RECT: lambda img, draw, xy, a: draw.rounded_rectangle(
+        xy, radius=a[3], fill=a[0], outline=a[1], width=a[2]),
+    OP_ELLIPSE: lambda img, draw, xy, a: draw.ellipse(xy, fill=a[0], outline=a[1], width=a[2]),
+    OP_POLYGON: lambda img, draw, xy, a: draw.polygon(xy, fill=a[0], outline=a[1], width=a[2]),
+    OP_LINE: lambda img, draw, xy, a: draw.line(xy, fill=a[0], width=a[1]),
+    OP_TEXT: lambda img, draw, xy, a: draw.text(xy[0], a[0], fill=a[1], font=a[2]),
+    OP_PIESLICE: lambda img, draw, xy, a: draw.pieslice(
+        xy, a[3], a[4], fill=a[0], outline=a[1], width=a[2]),
+    OP_ARC: lambda img, draw, xy, a: draw.arc(xy, a[2], a[3], fill=a[0], width=a[1]),
+    OP_LAYER: _paint_layer,
+    OP_SHADOW: lambda img, draw, xy, a: composite_shadow(img, _flatten(xy), *a),
+}
+
+
+def as_image(canvas):
+    """Return a Pillow image for a generator result (Image or DisplayList)"""
+    if isinstance(canvas, DisplayList):
+        return canvas.to_image()
+    return canvas
@@ -0,0 +1,122 @@
+"""
+Multi-scale export from one scene
+
+A generator builds its scene once, as a DisplayList in 1x units. The 2x and
+3x images replay that same list at the higher scale (fonts loaded at the
+scaled size, shadows blurred at the scaled radius), so no create_* function
+runs again per scale, and every scale and banded encode of one scene shares
+the TileIndex that buckets its ops. The thumbnail comes from the largest
+raster already rendered: it is halved with Image.reduce() until it is within twice the
+target width and finished with one Lanczos resize.
+
+Raw Pillow images have no scene to replay, so they only get the 1x image
+and the thumbnail.
+"""
+
+import math
+import os
+
+HIDPI_SCALES = (1, 2, 3)
+THUMBNAIL_WIDTH = 320
+
+
+def scale_key(scale):
+    """Output key of the PNG exported at scale"""
+    return 'png' if scale == 1 else f'png@{scale}x'
+
+
+def thumbnail_key(width):
+    """Output key of a thumbnail width pixels wide"""
+    return f'thumb{width}'
+
+
+def key_scale(key):
+    """Scale of a scale_key, or None for other keys"""
+    if key == 'png':
+        return 1
+    if key.startswith('png@') and key.endswith('x'):
+        return int(key[4:-1])
+    return None
+
+
+def key_thumbnail(key):
+    """Width of a thumbnail_key, or None for other keys"""
+    return int(key[5:]) if key.startswith('thumb') else None
+
+
+def output_keys(formats, scales=(1,), thumbnail=0):
+    """Output keys for the formats plus PNGs at the scales above 1 and a thumbnail"""
+    keys = list(formats)
+    keys += [scale_key(scale) for scale in scales if scale > 1]
+    if thumbnail:
+        keys.append(thumbnail_key(thumbnail))
+    return tuple(keys)
+
+
+def output_names(filename, formats=('png',)):
+    """Map each output format to the file written for an entry
+
+    Extra scales go to name@2x.png and name@3x.png and a thumbnail to
+    name_thumb.png.
+    """
+    stem = os.path.splitext(filename)[0]
+    names = {}
+    for fmt in formats:
+        if fmt.startswith('thumb'):
+            names[fmt] = f"{stem}_thumb.png"
+        elif '@' in fmt:
+            ext, scale = fmt.split('@')
+            names[fmt] = f"{stem}@{scale}.{ext}"
+        else:
+            names[fmt] = f"{stem}.{fmt}"
+    return names
+
+
+def render_scale(canvas, scale, indexes=None):
+    """Rasterize a DisplayList at scale times its size
+
+    indexes is the {id(DisplayList): TileIndex} cache of the scene, filled
+    on first use and shared by its other scales and encodes.
+    """
+    from PIL import Image
+
+    from wireframe_kit.display_list import as_image
+    from wireframe_kit.tiles import render_region
+
+    if scale == 1:
+        return as_image(canvas)
+    img = Image.new(canvas.mode, (canvas.width * scale, canvas.height * scale), canvas.background)
+    render_region(canvas, img, 0, 0, {} if indexes is None else indexes, scale, hidpi=True)
+    return img
+
+
+def downscale(img, width):
+    """Cascaded downscale of img to width pixels, keeping the aspect ratio"""
+    from PIL import Image
+
+    while img.width >= 2 * width:
+        img = img.reduce(2)
+    height = max(round(img.height * width / img.width), 1)
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def thumbnail(canvas, width, rasters=None, indexes=None):
+    """Thumbnail of a canvas from the largest raster in rasters, {scale: Image}
+
+    Display lists too large to rasterize whole are shrunk band by band.
+    """
+    from PIL import Image
+
+    from wireframe_kit.display_list import as_image
+    from wireframe_kit.tiles import BAND_HEIGHT, iter_bands, needs_tiling
+
+    if rasters:
+        return downscale(rasters[max(rasters)], width)
+    if not needs_tiling(canvas):
+        return downscale(as_image(canvas), width)
+    factor = max(canvas.width // (2 * width), 1)
+    band = max(BAND_HEIGHT // factor, 1) * factor
+    small = Image.new(canvas.mode, (math.ceil(canvas.width / factor), math.ceil(canvas.height / factor)))
+    for top, img in iter_bands(canvas, band, indexes=indexes):
+        small.paste(img.reduce(factor), (0, top // factor))
+    return downscale(small, width)
@@ -0,0 +1,90 @@
+"""
+Per-file caches of parsed inputs
+
+The migration parsers and the screen compiler turn each input file into
+JSON-friendly data. A FileCache keeps that data for every file in one JSON
+file, stored under the file's SHA-256 and a key naming everything else the
+data depends on (the parser's source, the content frame). A cache written
+under another key is discarded whole, and an entry is reused only while
+its file hashes the same, so only changed files are parsed again.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_digest(*modules):
+    """SHA-256 of the source of modules, to key caches of what they parse"""
+    source = ''.join(inspect.getsource(module) for module in modules)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class FileCache:
+    """Values parsed from files, read from and written to cache_dir/name
+
+    Without a cache_dir nothing is read or written and every file is parsed.
+    """
+
+    def __init__(self, cache_dir, name, key):
+        self.path = os.path.join(cache_dir, name) if cache_dir else None
+        self.key = key
+        stored = {}
+        if self.path:
+            try:
+                with open(self.path) as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                pass
+        self.stored = stored.get('files', {}) if stored.get('key') == key else {}
+        self.current = {}
+        self.changed = False
+
+    def get(self, name, digest):
+        """Value stored for name if it was parsed from a file with this digest, else None"""
+        entry = self.stored.get(name)
+        if entry and entry['sha256'] == digest:
+            return entry['value']
+        return None
+
+    def put(self, name, digest, value):
+        """Keep the value of name for the next save()"""
+        entry = self.stored.get(name)
+        if not entry or entry['sha256'] != digest:
+            self.changed = True
+        self.current[name] = {'sha256': digest, 'value': value}
+
+    def save(self):
+        """Atomically write the values put, if any differ from those read"""
+        if not self.path or not (self.changed or self.current.keys() != self.stored.keys()):
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': self.key, 'files': self.current}, f)
+        os.replace(tmp_path, self.path)
+
+
+def parse_files(paths, parse, cache_dir, name, key):
+    """parse(path) for each path, cached per file name in cache_dir/name under key"""
+    cache = FileCache(cache_dir, name, key)
+    values = []
+    for path in paths:
+        base = os.path.basename(path)
+        digest = file_digest(path)
+        value = cache.get(base, digest)
+        if value is None:
+            value = parse(path)
+        cache.put(base, digest, value)
+        values.append(value)
+    cache.save()
+    return values
@@ -0,0 +1,158 @@
+"""
+Process-level font registry shared by all generator scripts
+
+ImageFont.truetype() re-opens and re-parses the font file on every call, and
+the generators ask for a font on every text draw. The registry keeps loaded
+fonts keyed by (path, size, weight, index) in a bounded LRU, remembers paths
+that failed to load, and counts hits and misses.
+
+Text measurement goes through a second LRU keyed by (font identity, text), so
+centring the same "View" or "Active" label in every image costs one FreeType
+layout pass per run instead of one per call.
+
+Pillow is imported by the first font load or measurement, not by importing
+this module, so scripts that only parse their options never load it.
+"""
+
+from collections import OrderedDict
+
+HELVETICA = "/System/Library/Fonts/Helvetica.ttc"
+
+MAX_FONTS = 128
+MAX_TEXT_METRICS = 4096
+
+_fonts = OrderedDict()
+_missing = set()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+_metrics = OrderedDict()
+_metric_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+# Scratch surface so cached measurements match ImageDraw.textbbox exactly,
+# created on the first measurement
+_measure = None
+
+
+def _remember(key, font):
+    """Store a font in the registry, evicting the least recently used"""
+    _fonts[key] = font
+    if len(_fonts) > MAX_FONTS:
+        _fonts.popitem(last=False)
+        _stats['evictions'] += 1
+    return font
+
+
+def load_font(paths, size=12, bold=False, index=0):
+    """Return the first loadable font from paths, falling back to Pillow's default"""
+    if isinstance(paths, str):
+        paths = (paths,)
+    from PIL import ImageFont
+
+    weight = 'bold' if bold else 'regular'
+    for path in paths:
+        key = (path, size, weight, index)
+        font = _fonts.get(key)
+        if font is not None:
+            _fonts.move_to_end(key)
+            _stats['hits'] += 1
+            return font
+        if key in _missing:
+            continue
+        _stats['misses'] += 1
+        try:
+            return _remember(key, ImageFont.truetype(path, size, index=index))
+        except OSError:
+            _missing.add(key)
+
+    key = (None, size, weight, index)
+    font = _fonts.get(key)
+    if font is not None:
+        _fonts.move_to_end(key)
+        _stats['hits'] += 1
+        return font
+    _stats['misses'] += 1
+    return _remember(key, ImageFont.load_default())
+
+
+def get_font(size=12, bold=False):
+    """Get the Helvetica system font with fallback"""
+    return load_font(HELVETICA, size, bold)
+
+
+def _font_identity(font):
+    """Key that is equal for fonts with identical metrics"""
+    path = getattr(font, 'path', None)
+    if path is not None:
+        return (path, font.size, font.index, font.layout_engine)
+    # Bitmap fonts have no path; keep the object itself so its id cannot be reused
+    return font
+
+
+def _cached_metric(kind, text, font, compute):
+    """Look up or compute one text measurement"""
+    key = (kind, _font_identity(font), text)
+    value = _metrics.get(key)
+    if value is not None:
+        _metrics.move_to_end(key)
+        _metric_stats['hits'] += 1
+        return value
+    _metric_stats['misses'] += 1
+    value = compute()
+    _metrics[key] = value
+    if len(_metrics) > MAX_TEXT_METRICS:
+        _metrics.popitem(last=False)
+        _metric_stats['evictions'] += 1
+    return value
+
+
+def _scratch():
+    global _measure
+    if _measure is None:
+        from PIL import Image, ImageDraw
+
+        _measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+    return _measure
+
+
+def text_bbox(text, font, xy=(0, 0)):
+    """Cached equivalent of draw.textbbox(xy, text, font=font)"""
+    bbox = _cached_metric('bbox', text, font, lambda: _scratch().textbbox((0, 0), text, font=font))
+    x, y = xy
+    if x == 0 and y == 0:
+        return bbox
+    return (bbox[0] + x, bbox[1] + y, bbox[2] + x, bbox[3] + y)
+
+
+def text_length(text, font):
+    """Cached equivalent of draw.textlength(text, font=font)"""
+    return _cached_metric('length', text, font, lambda: _scratch().textlength(text, font=font))
+
+
+def text_cache_info():
+    """Return text metrics cache statistics as a dict"""
+    return dict(_metric_stats, size=len(_metrics), maxsize=MAX_TEXT_METRICS)
+
+
+def font_cache_info():
+    """Return registry statistics as a dict"""
+    return dict(_stats, size=len(_fonts), missing=len(_missing), maxsize=MAX_FONTS)
+
+
+def clear_font_cache():
+    """Drop all cached fonts and text metrics and reset the counters"""
+    _fonts.clear()
+    _missing.clear()
+    _metrics.clear()
+    for stats in (_stats, _metric_stats):
+        for key in stats:
+            stats[key] = 0
+
+
+def print_font_cache_info():
+    """Print a summary of font registry and text metrics cache usage"""
+    info = font_cache_info()
+    print(f"Font cache: {info['hits']} hits, {info['misses']} misses, "
+          f"{info['size']} fonts loaded")
+    info = text_cache_info()
+    print(f"Text metrics cache: {info['hits']} hits, {info['misses']} misses, "
+          f"{info['size']} entries")
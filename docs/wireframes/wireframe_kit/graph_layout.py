@@ -0,0 +1,261 @@
+"""
+Layered layout for directed graphs of boxes
+
+A Sugiyama-style pipeline sized for schema diagrams:
+
+1. cycles are broken by reversing DFS back edges;
+2. nodes are assigned to layers by longest path from the sources, so a
+   referenced table always sits above the tables that reference it;
+3. the order inside each layer is improved by alternating barycenter sweeps,
+   keeping the ordering with the fewest crossings (counted per layer pair
+   with a Fenwick tree in O(E log V));
+4. coordinates are assigned row by row: each box aims for the mean centre of
+   its placed neighbours, crowded boxes are spread around their common
+   centre in sweep order, and each box is pushed down past anything it
+   would overlap, found through a SpatialIndex. Layers wider
+   than max_columns wrap, and unconnected boxes flow in rows as wide as
+   the connected drawing, or of max_columns boxes when nothing is
+   connected.
+
+Everything is linear or near-linear per sweep, so 100+ tables lay out in a
+few tens of milliseconds.
+"""
+
+from collections import defaultdict, deque, namedtuple
+
+from wireframe_kit.spatial import SpatialIndex
+
+Layout = namedtuple('Layout', 'boxes width height crossings')
+
+
+def _acyclic(nodes, edges):
+    """Return edges with self-loops dropped and DFS back edges reversed"""
+    children = defaultdict(list)
+    for parent, child in edges:
+        if parent != child:
+            children[parent].append(child)
+
+    state = {}
+    back = set()
+    for root in nodes:
+        if root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(children[root]))]
+        while stack:
+            node, it = stack[-1]
+            for child in it:
+                if state.get(child) == 1:
+                    back.add((node, child))
+                elif child not in state:
+                    state[child] = 1
+                    stack.append((child, iter(children[child])))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
+
+    order = {node: i for i, node in enumerate(nodes)}
+    result = set()
+    for parent, child in edges:
+        if parent == child:
+            continue
+        result.add((child, parent) if (parent, child) in back else (parent, child))
+    return sorted(result, key=lambda e: (order[e[0]], order[e[1]]))
+
+
+def _layers(nodes, edges):
+    """Longest-path layering in topological order"""
+    children = defaultdict(list)
+    indegree = dict.fromkeys(nodes, 0)
+    for parent, child in edges:
+        children[parent].append(child)
+        indegree[child] += 1
+
+    layer = dict.fromkeys(nodes, 0)
+    ready = deque(n for n in nodes if indegree[n] == 0)
+    while ready:
+        node = ready.popleft()
+        for child in children[node]:
+            layer[child] = max(layer[child], layer[node] + 1)
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+
+    layers = defaultdict(list)
+    for node in nodes:
+        layers[layer[node]].append(node)
+    return [layers[i] for i in sorted(layers)]
+
+
+def _inversions(sequence):
+    """Number of pairs i < j with sequence[i] > sequence[j]"""
+    size = max(sequence, default=0) + 1
+    tree = [0] * (size + 1)
+    count = 0
+    for seen, value in enumerate(sequence):
+        i = value + 1
+        below = 0
+        while i > 0:
+            below += tree[i]
+            i -= i & -i
+        count += seen - below
+        i = value + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return count
+
+
+def count_crossings(layers, edges):
+    """Crossings between edges joining adjacent layers"""
+    index, depth = {}, {}
+    for d, layer in enumerate(layers):
+        for i, node in enumerate(layer):
+            index[node], depth[node] = i, d
+
+    pairs = defaultdict(list)
+    for a, b in edges:
+        if depth[a] > depth[b]:
+            a, b = b, a
+        if depth[b] - depth[a] == 1:
+            pairs[depth[a]].append((index[a], index[b]))
+    return sum(_inversions([b for _, b in sorted(p)]) for p in pairs.values())
+
+
+def order_layers(layers, edges, sweeps=24):
+    """Reorder nodes within layers by barycenter sweeps to reduce crossings"""
+    up, down = defaultdict(list), defaultdict(list)
+    for parent, child in edges:
+        down[parent].append(child)
+        up[child].append(parent)
+
+    layers = [list(layer) for layer in layers]
+    pos = {}
+
+    def reindex(layer):
+        for i, node in enumerate(layer):
+            pos[node] = (i + 0.5) / len(layer)
+
+    for layer in layers:
+        reindex(layer)
+
+    best = [list(layer) for layer in layers]
+    best_crossings = count_crossings(layers, edges)
+    for sweep in range(sweeps):
+        if best_crossings == 0:
+            break
+        if sweep % 2 == 0:
+            order, neighbours = layers[1:], up
+        else:
+            order, neighbours = layers[-2::-1], down
+        for layer in order:
+            def barycenter(node):
+                linked = neighbours[node]
+                return sum(pos[n] for n in linked) / len(linked) if linked else pos[node]
+            layer.sort(key=barycenter)
+            reindex(layer)
+        crossings = count_crossings(layers, edges)
+        if crossings < best_crossings:
+            best, best_crossings = [list(layer) for layer in layers], crossings
+    return best, best_crossings
+
+
+def _spread(row, desired, sizes, gap):
+    """Closest x positions to desired that keep row order without overlaps
+
+    Overlapping neighbours are merged into clusters placed at the mean of
+    their members' wishes, so a crowded row stays centred under its parents
+    instead of drifting right.
+    """
+    clusters = []  # [x, width, nodes, sum of desired minus offset, count]
+    for node in row:
+        clusters.append([desired[node], sizes[node][0], [node], desired[node], 1])
+        while len(clusters) > 1 and clusters[-2][0] + clusters[-2][1] + gap > clusters[-1][0]:
+            last = clusters.pop()
+            merged = clusters[-1]
+            offset = merged[1] + gap
+            merged[1] += gap + last[1]
+            merged[2] += last[2]
+            merged[3] += last[3] - offset * last[4]
+            merged[4] += last[4]
+            merged[0] = merged[3] / merged[4]
+
+    positions = {}
+    for x, _, nodes, _, _ in clusters:
+        for node in nodes:
+            positions[node] = int(x)
+            x += sizes[node][0] + gap
+    return positions
+
+
+def layered_layout(nodes, edges, sizes, max_columns=12, gap_x=40, gap_y=60, sweeps=24):
+    """Lay out boxes of the given sizes for (parent, child) edges
+
+    Returns a Layout whose boxes map each node to (x1, y1, x2, y2) with the
+    top-left of the whole drawing at (0, 0).
+    """
+    nodes = list(nodes)
+    edges = _acyclic(nodes, edges)
+    linked = {n for edge in edges for n in edge}
+    connected = [n for n in nodes if n in linked]
+    isolated = [n for n in nodes if n not in linked]
+
+    layers, crossings = order_layers(_layers(connected, edges), edges, sweeps)
+
+    neighbours, children = defaultdict(list), defaultdict(list)
+    for parent, child in edges:
+        neighbours[parent].append(child)
+        neighbours[child].append(parent)
+        children[parent].append(child)
+
+    index = SpatialIndex(cell=max(max(w, h) for w, h in sizes.values()) if sizes else 128)
+    boxes = {}
+    # children start below the lowest of their parents
+    parent_bottom = defaultdict(int)
+
+    def place(node, x, y):
+        w, h = sizes[node]
+        while True:
+            hits = index.query((x - gap_x // 2, y - gap_y // 2, x + w + gap_x // 2, y + h + gap_y // 2))
+            if not hits:
+                break
+            y = max(index.boxes[k][3] for k in hits) + gap_y
+        boxes[node] = (x, y, x + w, y + h)
+        index.insert(node, boxes[node])
+        for child in children[node]:
+            parent_bottom[child] = max(parent_bottom[child], y + h + gap_y)
+
+    for layer in layers:
+        for start in range(0, len(layer), max_columns):
+            row = layer[start:start + max_columns]
+            desired, cursor = {}, 0
+            for node in row:
+                placed = [boxes[n] for n in neighbours[node] if n in boxes]
+                if placed:
+                    cursor = sum((b[0] + b[2]) / 2 for b in placed) / len(placed) - sizes[node][0] / 2
+                desired[node] = cursor
+                cursor += sizes[node][0] + gap_x
+            for node, x in _spread(row, desired, sizes, gap_x).items():
+                place(node, x, parent_bottom[node])
+
+    # Unconnected boxes drop into the first free slot, left to right
+    left = min((b[0] for b in boxes.values()), default=0)
+    right = max((b[2] for b in boxes.values()), default=None)
+    cursor, count = left, 0
+    for node in isolated:
+        w, _ = sizes[node]
+        full = cursor + w > right if right is not None else count == max_columns
+        if full and cursor > left:
+            cursor, count = left, 0
+        place(node, cursor, 0)
+        cursor += w + gap_x
+        count += 1
+
+    # an empty graph is an empty 0 x 0 drawing
+    min_x = min((b[0] for b in boxes.values()), default=0)
+    min_y = min((b[1] for b in boxes.values()), default=0)
+    boxes = {n: (x1 - min_x, y1 - min_y, x2 - min_x, y2 - min_y) for n, (x1, y1, x2, y2) in boxes.items()}
+    width = max((b[2] for b in boxes.values()), default=0)
+    height = max((b[3] for b in boxes.values()), default=0)
+    return Layout(boxes, width, height, crossings)
@@ -0,0 +1,217 @@
+"""
+Box layout for screens
+
+A screen is a tree of boxes. A row places its children left to right and a
+column top to bottom, with padding inside the box and a gap between
+children. Along that main axis a child takes its fixed size, else its
+intrinsic size (a text box measures its string through the cached font
+metrics), and children with a grow weight share whatever is left. The
+shares are floored, as the hand-placed screens did with //, so leftover
+pixels stay at the end. Across the axis a child stretches to fill the
+box unless it has a fixed size or the box aligns its children.
+
+Layout is two passes over the tree, each linear in the number of boxes:
+intrinsic sizes bottom-up, then rectangles top-down. Both are remembered.
+Box.set() forgets the intrinsic size of the box and its ancestors, and
+arranging skips any subtree whose box is unchanged and whose rectangle did
+not move, so editing one label, or laying the same tree out at another
+width, only revisits the boxes it affects.
+
+The spec compiler (wireframe_kit.screens) and the dashboard generator build
+their screens as box trees; the other hand-drawn generators still place
+widgets at fixed offsets and do not use this module.
+"""
+
+from collections import namedtuple
+
+from wireframe_kit.fonts import text_bbox
+
+Rect = namedtuple('Rect', 'x y width height')
+
+ALIGNS = ('stretch', 'start', 'center', 'end')
+
+_stats = {'measured': 0, 'arranged': 0}
+
+
+def _edges(padding):
+    """(top, right, bottom, left) from an int, (vertical, horizontal) or four values"""
+    if isinstance(padding, int):
+        return (padding,) * 4
+    if len(padding) == 2:
+        return (padding[0], padding[1], padding[0], padding[1])
+    return tuple(padding)
+
+
+class Box:
+    """A node of the layout tree; see row(), column(), text() and spacer()"""
+
+    def __init__(self, direction=None, children=(), width=None, height=None, grow=0, gap=0,
+                 padding=0, align='stretch', measure=None, key=None, **data):
+        if align not in ALIGNS:
+            raise ValueError(f"align must be one of {', '.join(ALIGNS)}")
+        self.direction = direction
+        self.children = list(children)
+        self.width = width
+        self.height = height
+        self.grow = grow
+        self.gap = gap
+        self.padding = _edges(padding)
+        self.align = align
+        self.measure = measure
+        self.key = key
+        # anything else travels with the box for whoever paints it
+        self.data = data
+        self.parent = None
+        for child in self.children:
+            child.parent = self
+        self.rect = None
+        self._size = None
+        self._dirty = True
+
+    def __repr__(self):
+        kind = self.direction or 'leaf'
+        return f"<Box {kind} {self.key or ''} {tuple(self.rect) if self.rect else ''}>"
+
+    def _invalidate(self):
+        box = self
+        while box is not None:
+            box._size = None
+            box._dirty = True
+            box = box.parent
+
+    def set(self, **props):
+        """Change layout properties or data and mark the box for relayout"""
+        for name, value in props.items():
+            if name == 'padding':
+                value = _edges(value)
+            if hasattr(self, name) and name != 'data':
+                setattr(self, name, value)
+            else:
+                self.data[name] = value
+        self._invalidate()
+
+    def append(self, child):
+        """Add a child at the end"""
+        child.parent = self
+        self.children.append(child)
+        self._invalidate()
+        return child
+
+    def find(self, key):
+        """The first box in this subtree with the given key, or None"""
+        for box in self.walk():
+            if box.key == key:
+                return box
+        return None
+
+    def walk(self):
+        """This box and its descendants in paint order (parents first)"""
+        stack = [self]
+        while stack:
+            box = stack.pop()
+            yield box
+            stack.extend(reversed(box.children))
+
+    # ============ Pass 1: intrinsic sizes ============
+
+    def size(self):
+        """Intrinsic (width, height), from fixed sizes, measure() or the children"""
+        if self._size is not None:
+            return self._size
+        _stats['measured'] += 1
+        top, right, bottom, left = self.padding
+        if self.direction is None:
+            width, height = self.measure(self) if self.measure else (0, 0)
+        else:
+            sizes = [child.size() for child in self.children]
+            gaps = self.gap * max(len(sizes) - 1, 0)
+            main = 0 if self.direction == 'row' else 1
+            along = sum(s[main] for s, c in zip(sizes, self.children) if not c.grow) + gaps
+            across = max((s[1 - main] for s in sizes), default=0)
+            width, height = (along, across) if main == 0 else (across, along)
+        width = self.width if self.width is not None else width + left + right
+        height = self.height if self.height is not None else height + top + bottom
+        self._size = (width, height)
+        return self._size
+
+    # ============ Pass 2: rectangles ============
+
+    def arrange(self, rect):
+        """Place this box at rect and its children inside it"""
+        rect = Rect(*rect)
+        if not self._dirty and rect == self.rect:
+            return
+        _stats['arranged'] += 1
+        self.rect = rect
+        self._dirty = False
+        if not self.children:
+            return
+
+        top, right, bottom, left = self.padding
+        x, y = rect.x + left, rect.y + top
+        inner_w = rect.width - left - right
+        inner_h = rect.height - top - bottom
+        row = self.direction == 'row'
+        inner_main, inner_cross = (inner_w, inner_h) if row else (inner_h, inner_w)
+
+        sizes = [child.size() for child in self.children]
+        fixed = sum(s[0 if row else 1] for s, c in zip(sizes, self.children) if not c.grow)
+        free = max(inner_main - fixed - self.gap * (len(sizes) - 1), 0)
+        weights = sum(c.grow for c in self.children)
+
+        cursor = x if row else y
+        for child, (w, h) in zip(self.children, sizes):
+            main = free * child.grow // weights if child.grow else (w if row else h)
+            cross_fixed = child.height if row else child.width
+            cross = h if row else w
+            if self.align == 'stretch' and cross_fixed is None:
+                cross, offset = inner_cross, 0
+            else:
+                offset = {'start': 0, 'stretch': 0, 'center': (inner_cross - cross) // 2,
+                          'end': inner_cross - cross}[self.align]
+            if row:
+                child.arrange((cursor, y + offset, main, cross))
+            else:
+                child.arrange((x + offset, cursor, cross, main))
+            cursor += main + self.gap
+
+    def layout(self, x, y, width=None, height=None):
+        """Lay the tree out at (x, y), at its intrinsic size unless given one"""
+        w, h = self.size()
+        self.arrange((x, y, w if width is None else width, h if height is None else height))
+        return self.rect
+
+
+def row(*children, **props):
+    """Box placing its children left to right"""
+    return Box('row', children, **props)
+
+
+def column(*children, **props):
+    """Box placing its children top to bottom"""
+    return Box('column', children, **props)
+
+
+def spacer(grow=1, **props):
+    """Empty box that takes a share of the free space"""
+    return Box(grow=grow, **props)
+
+
+def _measure_text(box):
+    bbox = text_bbox(box.data['text'], box.data['font'])
+    return bbox[2], bbox[3]
+
+
+def text(string, font, **props):
+    """Leaf sized to the ink extent of string drawn at its top-left"""
+    return Box(measure=_measure_text, text=string, font=font, **props)
+
+
+def layout_stats():
+    """How many boxes were measured and arranged, as a dict"""
+    return dict(_stats)
+
+
+def reset_layout_stats():
+    for key in _stats:
+        _stats[key] = 0
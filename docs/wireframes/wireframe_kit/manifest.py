@@ -0,0 +1,219 @@
+"""
+Content-addressed build manifest
+
+Each generator is fingerprinted from everything that affects its pixels: its
+own source, the source of every helper it reaches, the upper-case constants
+those functions read (palette, canvas size, font paths), the font files on
+disk, any data files the generator declares and the Pillow version. The
+manifest maps output filenames to the last fingerprint written, so unchanged
+images are neither rendered nor rewritten.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import types
+
+from wireframe_kit.export import output_names
+
+KIT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_ROOT = os.path.dirname(KIT_DIR)
+MANIFEST_NAME = '.build-manifest.json'
+
+
+def _is_local(obj):
+    """True if obj was defined in one of the generator source files"""
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return path is not None and os.path.abspath(path).startswith(SOURCE_ROOT)
+
+
+def _code_names(code):
+    """Collect global names referenced by a code object and its nested code"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _constant_repr(value):
+    """Stable text form of a module-level constant"""
+    if hasattr(value, 'getbbox') and hasattr(value, 'size'):
+        # FreeTypeFont instances repr with their memory address
+        return repr(('font', getattr(value, 'path', None), value.size, getattr(value, 'index', 0)))
+    # tables of functions repr with memory addresses too
+    return re.sub(r' at 0x[0-9a-f]+', '', repr(value))
+
+
+# Source of each function and class, with the mtime of the file it was read from
+_sources = {}
+
+
+def _source(obj):
+    """inspect.getsource(obj), remembered until its file changes
+
+    Finding a class re-parses its whole module, and every generator reaches
+    the same helpers, so watch mode and manifest checks would otherwise
+    spend most of their time here.
+    """
+    path = inspect.getsourcefile(obj)
+    try:
+        stamp = os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        stamp = None
+    cached = _sources.get(obj)
+    if cached is None or cached[0] != stamp:
+        try:
+            cached = (stamp, inspect.getsource(obj))
+        except OSError as e:
+            # remembered too: failing to find a class parses the module as well
+            cached = (stamp, e)
+        _sources[obj] = cached
+    if isinstance(cached[1], OSError):
+        raise cached[1]
+    return cached[1]
+
+
+def _collect(obj, seen, parts):
+    """Append the source of obj and everything it reaches to parts"""
+    # see through profiling wrappers to the helper they time
+    obj = inspect.unwrap(obj)
+    if not isinstance(obj, (types.FunctionType, type)):
+        # callable instances (spec-driven screens) render through their class
+        parts.append(_constant_repr(vars(obj)))
+        obj = type(obj)
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    try:
+        parts.append(_source(obj))
+    except (OSError, TypeError):
+        # namedtuple classes are generated and have no source of their own
+        parts.append(f"{obj.__qualname__}{getattr(obj, '_fields', ())}")
+        return
+
+    if isinstance(obj, type):
+        functions = [inspect.unwrap(v) for v in vars(obj).values()
+                     if isinstance(v, types.FunctionType)]
+    else:
+        functions = [obj]
+
+    for function in functions:
+        for name in sorted(_code_names(function.__code__)):
+            if name not in function.__globals__:
+                continue
+            value = function.__globals__[name]
+            if isinstance(value, (types.FunctionType, type)):
+                if _is_local(value):
+                    _collect(value, seen, parts)
+            elif name.isupper():
+                parts.append(f"{name}={_constant_repr(value)}")
+                # tables of helpers (widget kinds to draw_* functions)
+                if isinstance(value, dict):
+                    for helper in value.values():
+                        if isinstance(helper, types.FunctionType) and _is_local(helper):
+                            _collect(helper, seen, parts)
+
+
+def font_fingerprint(paths):
+    """Identify font files by path, size and modification time"""
+    entries = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            entries.append(f"{path}:missing")
+            continue
+        entries.append(f"{path}:{st.st_size}:{int(st.st_mtime)}")
+    return ';'.join(entries)
+
+
+def inputs_fingerprint(paths):
+    """Hash the contents of a generator's data files"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.encode('utf-8') + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b'missing')
+    return digest.hexdigest()
+
+
+def fingerprint(generator, font_paths=()):
+    """Hash all inputs that determine the output of generator"""
+    import PIL
+
+    parts = [f"pillow={PIL.__version__}", f"fonts={font_fingerprint(font_paths)}"]
+    # generators that read data files list them through an inputs() attribute
+    inputs = getattr(generator, 'inputs', None)
+    if inputs:
+        parts.append(f"inputs={inputs_fingerprint(inputs())}")
+    _collect(generator, set(), parts)
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def load_manifest(output_dir):
+    """Read the manifest for output_dir, or an empty one"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    """Atomically write the manifest for output_dir"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def output_digest(digest, fmt, variant=''):
+    """Fold the source of the format's encoder into a generator fingerprint
+
+    PNG outputs (extra scales and thumbnails included) also fold in variant,
+    which describes the render and encoder settings, and the source of the
+    modules those settings select.
+    """
+    if fmt == 'svg':
+        from wireframe_kit import svg
+
+        return hashlib.sha256((digest + inspect.getsource(svg)).encode('utf-8')).hexdigest()
+    from wireframe_kit import export, png, supersample, tiles
+
+    source = ''.join(inspect.getsource(module) for module in (png, supersample, tiles, export))
+    return hashlib.sha256((digest + fmt + variant + source).encode('utf-8')).hexdigest()
+
+
+def stale_entries(entries, output_dir, manifest, font_paths=(), force=False, formats=('png',),
+                  variant=''):
+    """Split (filename, generator) entries into (stale, unchanged) with fingerprints
+
+    An entry is unchanged only if every output file exists and was written
+    from the current fingerprint. Stale entries are returned as
+    (filename, generator, fingerprint) triples.
+    """
+    stale, unchanged = [], []
+    for filename, generator in entries:
+        digest = fingerprint(generator, font_paths)
+        current = all(
+            manifest.get(name) == output_digest(digest, fmt, variant)
+            and os.path.exists(os.path.join(output_dir, name))
+            for fmt, name in output_names(filename, formats).items()
+        )
+        if current and not force:
+            unchanged.append(filename)
+        else:
+            stale.append((filename, generator, digest))
+    return stale, unchanged
@@ -0,0 +1,100 @@
+"""
+PNG encoding stage
+
+The wireframes are flat-colour images: a few dozen COLORS entries plus the
+anti-aliasing ramps between them. Written as palette PNGs they shrink to
+about a third of their RGB size. Palette modes:
+
+- 'off', the default, keeps RGB;
+- 'exact' writes a palette only when the image has at most `colors`
+  colours, which is lossless;
+- 'adaptive' always quantizes to `colors` by median cut, without dithering.
+  Median cut gives the large flat areas their exact colours and spends the
+  rest of the palette on the ramps, but it is lossy: text edges and soft
+  shadows band. It is deterministic, so outputs and manifest digests are
+  stable across machines. Opt in with --palette adaptive.
+
+Images too large to rasterize at once are written band by band by
+wireframe_kit.tiles, which takes its palette from band_palette(): the
+colour histogram of every band gives the same exact palette, or a median
+cut over a weighted sample of the histogram.
+
+compress_level and optimize go to zlib through Pillow. The zopfli pass
+recompresses with the zopfli package when it is installed. Otherwise it
+tries every zlib strategy at level 9 and keeps the smallest result.
+"""
+
+import io
+
+PALETTES = ('off', 'exact', 'adaptive')
+# zlib strategies: default, filtered, huffman only, RLE, fixed
+ZLIB_STRATEGIES = (0, 1, 2, 3, 4)
+
+
+# Pixels in the image that stands in for a histogram when choosing an
+# adaptive palette for a banded image
+SAMPLE_PIXELS = 1 << 20
+
+
+def to_palette(img, palette='off', colors=256):
+    """Convert an RGB image to a palette image according to the palette mode"""
+    if palette == 'off' or img.mode != 'RGB':
+        return img
+    if palette == 'exact' and img.getcolors(colors) is None:
+        return img
+    from PIL import Image
+
+    return img.quantize(colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def band_palette(histogram, palette='off', colors=256):
+    """Palette image for an image with the given {(r, g, b): pixels} histogram, or None for RGB
+
+    Up to colors colours get an exact palette in every mode but 'off'.
+    Beyond that 'exact' keeps RGB and 'adaptive' runs the median cut of
+    to_palette() over an image holding each colour in proportion to its
+    pixels.
+    """
+    if palette == 'off' or not histogram or (palette == 'exact' and len(histogram) > colors):
+        return None
+    from PIL import Image
+
+    if len(histogram) <= colors:
+        sample = Image.new('P', (1, 1))
+        sample.putpalette([channel for color in sorted(histogram) for channel in color])
+        return sample
+    total = sum(histogram.values())
+    data = b''.join(bytes(color) * max(1, histogram[color] * SAMPLE_PIXELS // total)
+                    for color in sorted(histogram))
+    sample = Image.frombytes('RGB', (len(data) // 3, 1), data)
+    return to_palette(sample, 'adaptive', colors)
+
+
+def _save(img, **params):
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', **params)
+    return buf.getvalue()
+
+
+def _zopfli(img, data):
+    """Smallest recompression of already encoded data"""
+    try:
+        from zopfli.png import optimize
+    except ImportError:
+        trials = [_save(img, compress_level=9, compress_type=strategy) for strategy in ZLIB_STRATEGIES]
+        return min(trials + [data], key=len)
+    return min(optimize(data), data, key=len)
+
+
+def encode(img, compress_level=9, optimize=False, palette='off', colors=256, zopfli=False):
+    """Encode an image as PNG bytes"""
+    img = to_palette(img, palette, colors)
+    data = _save(img, compress_level=compress_level, optimize=optimize)
+    if zopfli:
+        data = _zopfli(img, data)
+    return data
+
+
+def format_size(size):
+    """Human-readable byte count"""
+    return f"{size / 1024:.1f} KB" if size < 1 << 20 else f"{size / (1 << 20):.1f} MB"
@@ -0,0 +1,124 @@
+"""
+Opt-in per-primitive profiling for the generators
+
+instrument() wraps the draw_* helpers in a generator module's namespace, the
+ImageDraw primitives they end up calling, display list rasterization, shadow
+compositing and PNG encoding. Each wrapper counts calls and accumulates
+inclusive and self time, both overall and per screen. print_report() prints
+the hot-path tables. Nothing is wrapped unless instrument() is called.
+"""
+
+import functools
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+IMAGEDRAW_METHODS = ('rectangle', 'rounded_rectangle', 'ellipse', 'polygon', 'line',
+                     'text', 'pieslice', 'arc', 'textbbox', 'textlength')
+
+# name -> [calls, inclusive seconds, self seconds]
+_totals = defaultdict(lambda: [0, 0.0, 0.0])
+_by_screen = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0]))
+_screen_time = defaultdict(float)
+_child_time = []
+_current = {'screen': None}
+_patched = set()
+
+
+def _record(name, elapsed, self_time):
+    for table in (_totals, _by_screen[_current['screen']]):
+        entry = table[name]
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += self_time
+
+
+def timed(name, func):
+    """Wrap func so every call is counted and timed under name"""
+    if getattr(func, '_profiled', False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = _child_time.pop()
+            if _child_time:
+                _child_time[-1] += elapsed
+            _record(name, elapsed, elapsed - children)
+
+    wrapper._profiled = True
+    return wrapper
+
+
+def _patch(owner, attr, name):
+    """Replace owner.attr with a timed wrapper once"""
+    key = (id(owner), attr)
+    if key in _patched:
+        return
+    setattr(owner, attr, timed(name, getattr(owner, attr)))
+    _patched.add(key)
+
+
+def instrument(namespace):
+    """Wrap the draw_* helpers in a module namespace and the shared primitives"""
+    from PIL import ImageDraw
+
+    from wireframe_kit import build, display_list
+
+    for name, value in list(namespace.items()):
+        if callable(value) and (name.startswith('draw_') or name == 'create_shadow'):
+            namespace[name] = timed(name, value)
+
+    for method in IMAGEDRAW_METHODS:
+        _patch(ImageDraw.ImageDraw, method, f"ImageDraw.{method}")
+    _patch(display_list.DisplayList, 'rasterize', "DisplayList.rasterize")
+    _patch(display_list, 'composite_shadow', "composite_shadow")
+    _patch(build, 'encode_png', "encode_png")
+
+
+@contextmanager
+def screen(name):
+    """Attribute everything timed inside the block to screen name"""
+    if not _patched:
+        yield
+        return
+    previous = _current['screen']
+    _current['screen'] = name
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _screen_time[name] += time.perf_counter() - start
+        _current['screen'] = previous
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:9.1f}"
+
+
+def print_report(limit=15):
+    """Print the hottest helpers overall and the time spent per screen"""
+    if not _screen_time:
+        print("\nHot paths: no screens were rendered")
+        return
+    total = sum(_screen_time.values()) or 1e-9
+
+    print(f"\nHot paths (by self time, {len(_screen_time)} screens)")
+    print(f"{'helper':<32} {'calls':>7} {'incl ms':>9} {'self ms':>9} {'self %':>7}")
+    print("-" * 68)
+    ranked = sorted(_totals.items(), key=lambda item: item[1][2], reverse=True)
+    for name, (calls, incl, own) in ranked[:limit]:
+        print(f"{name:<32} {calls:7d} {_ms(incl)} {_ms(own)} {own / total * 100:6.1f}%")
+
+    print(f"\n{'screen':<40} {'total ms':>9}  hottest helper")
+    print("-" * 80)
+    for name, seconds in _screen_time.items():
+        helpers = _by_screen[name]
+        hottest = max(helpers.items(), key=lambda item: item[1][2], default=(None, [0, 0, 0]))
+        hot = f"{hottest[0]} ({hottest[1][2] * 1000:.1f} ms)" if hottest[0] else "-"
+        print(f"{name:<40} {_ms(seconds)}  {hot}")
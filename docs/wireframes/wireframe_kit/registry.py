@@ -0,0 +1,184 @@
+"""
+Generator registry
+
+A generator script marks each create_* function with
+@generates(filename, *tags) and builds its GENERATORS list with
+collect(globals()), so an image's filename, its function and its tags are
+declared together. discover() imports every script and joins their
+entries into one list for the wireframe_kit command line and the
+benchmark, tagging each with its script. All scripts write into the same
+directory and build manifest, so two generators claiming one filename
+would overwrite each other's image; discover() refuses that.
+
+Importing a script loads Pillow and the rest of the drawing code, which
+costs far more than listing its entries. An Index keeps each script's
+entries in a JSON file together with the modification time and size of
+every file they came from (the script, wireframe_kit, its fonts and the
+data files its generators read, plus their directories so added files are
+noticed), and only re-imports a script when one of those changed. It also
+remembers the outputs found up to date after a build, so asking for the
+same images again with nothing changed is answered from stat() calls alone.
+"""
+
+import fnmatch
+import importlib
+import json
+import os
+from collections import namedtuple
+
+from wireframe_kit.export import output_names
+
+KIT_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_NAME = '.registry-cache.json'
+
+# Generator scripts, each with the tag every one of its images carries
+SCRIPTS = {
+    'generate_professional_wireframes': 'professional',
+    'generate_diagrams': 'diagram',
+    'generate_wireframes': 'basic',
+}
+
+Output = namedtuple('Output', 'filename tags')
+Entry = namedtuple('Entry', 'filename name script tags')
+
+
+def generates(filename, *tags):
+    """Decorator registering a generator as the one producing filename"""
+    def register(generator):
+        generator.output = Output(filename, tags)
+        return generator
+    return register
+
+
+def collect(namespace):
+    """(filename, generator) entries for the registered generators of a namespace, in definition order"""
+    return [(value.output.filename, value) for value in list(namespace.values())
+            if isinstance(getattr(value, 'output', None), Output)]
+
+
+def _stamps(paths):
+    """[mtime_ns, size] of each path, None for missing ones"""
+    stamps = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamps[path] = None
+            continue
+        stamps[path] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+
+def _kit_sources():
+    return [os.path.join(KIT_DIR, n) for n in sorted(os.listdir(KIT_DIR)) if n.endswith('.py')]
+
+
+def _describe(script):
+    """Import a script and record its entries and the files they depend on"""
+    module = importlib.import_module(script)
+    tag = (SCRIPTS[script],) if script in SCRIPTS else ()
+    entries = []
+    paths = [module.__file__, KIT_DIR] + _kit_sources() + list(getattr(module, 'FONT_PATHS', ()))
+    for filename, generator in module.GENERATORS:
+        output = getattr(generator, 'output', None)
+        entries.append([filename, generator.__name__, list(tag + (output.tags if output else ()))])
+        inputs = getattr(generator, 'inputs', None)
+        if inputs:
+            for path in inputs():
+                paths += [path, os.path.dirname(path)]
+    return {'output_dir': module.OUTPUT_DIR, 'stamps': _stamps(sorted(set(paths))), 'entries': entries,
+            'current': {}}
+
+
+def _entries(records):
+    """Entries of the script records, refusing two generators of one filename"""
+    entries, owners = [], {}
+    for script, record in records.items():
+        for filename, name, tags in record['entries']:
+            if filename in owners:
+                raise ValueError(f"{filename} is generated by both {owners[filename]} and {script}")
+            owners[filename] = script
+            entries.append(Entry(filename, name, script, tuple(tags)))
+    return entries
+
+
+def discover(scripts=None):
+    """Entry for every generator of the scripts, in script order, importing them all"""
+    return _entries({script: _describe(script) for script in scripts or SCRIPTS})
+
+
+def names(entry):
+    """Names a glob may match an entry by"""
+    return (entry.filename, os.path.splitext(entry.filename)[0], entry.name,
+            f"{entry.script}:{entry.filename}")
+
+
+def select(entries, patterns=(), tags=()):
+    """Entries matching any of the globs (all when none) and carrying every tag"""
+    return [entry for entry in entries
+            if (not patterns or any(fnmatch.fnmatch(n, p) for n in names(entry) for p in patterns))
+            and set(tags) <= set(entry.tags)]
+
+
+class Index:
+    """Script entries and up-to-date outputs cached in cache_dir"""
+
+    def __init__(self, cache_dir, scripts=None):
+        import PIL
+
+        self.path = os.path.join(cache_dir, INDEX_NAME)
+        self.scripts = list(scripts or SCRIPTS)
+        self.pillow = PIL.__version__
+        try:
+            with open(self.path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        # another Pillow renders other pixels, so nothing is known to be current
+        self.records = cache.get('scripts', {}) if cache.get('pillow') == self.pillow else {}
+        self.changed = False
+
+    def record(self, script):
+        """The cached record of script, re-imported if a file it depends on changed"""
+        record = self.records.get(script)
+        if record is None or _stamps(record['stamps']) != record['stamps']:
+            record = self.records[script] = _describe(script)
+            self.changed = True
+        return record
+
+    def entries(self):
+        """Entry for every generator of the scripts, in script order"""
+        return _entries({script: self.record(script) for script in self.scripts})
+
+    def _outputs(self, entry, formats):
+        directory = self.records[entry.script]['output_dir']
+        return _stamps(os.path.join(directory, name) for name in output_names(entry.filename, formats).values())
+
+    def up_to_date(self, entries, formats, variant):
+        """True if the outputs of every entry are the ones last marked current for these settings"""
+        key = f"{','.join(formats)};{variant}"
+        for entry in entries:
+            current = self.record(entry.script)['current'].get(key, {})
+            if current.get(entry.filename) != self._outputs(entry, formats):
+                return False
+        return True
+
+    def mark_current(self, entries, formats, variant):
+        """Remember that the build manifest found these entries' outputs up to date"""
+        key = f"{','.join(formats)};{variant}"
+        for entry in entries:
+            # against the stamps taken before the build: a script edited since
+            # then no longer matches them and is described afresh next time
+            current = self.records[entry.script]['current'].setdefault(key, {})
+            current[entry.filename] = self._outputs(entry, formats)
+        self.changed = True
+
+    def save(self):
+        """Write the index if anything changed"""
+        if not self.changed:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'pillow': self.pillow, 'scripts': self.records}, f)
+        os.replace(tmp_path, self.path)
+        self.changed = False
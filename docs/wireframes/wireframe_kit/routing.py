@@ -0,0 +1,301 @@
+"""
+Orthogonal edge routing around boxes
+
+Every box goes into a SpatialIndex, grown by a clearance margin. An edge
+leaves its parent from the side facing the child and enters the child on the
+opposite side. Edges that share a side get evenly spaced ports there, ordered
+by where their other end is, which keeps them from crossing at the box.
+Short stubs carry each end out of its box, and then:
+
+1. a handful of two-bend (Z) and one-bend (L) candidates are checked segment
+   by segment against the index, and the first one that is clear is used;
+2. only if none is clear does an A* search run over a sparse visibility
+   grid whose lines pass just outside the boxes near the two ends, with a
+   penalty per bend. A link is checked against the index the first time
+   any search reaches it, and the answer is kept on the Router for the
+   searches after it.
+
+Edges with a clear Z or L route finish after a few index queries. A search
+expands at most max_steps grid points, and its region only widens (4x, at
+most MAX_WIDENINGS times) when it was searched to the end without reaching
+the goal, so no edge costs more than a fixed number of steps. Below that
+cap a search costs about as much as the grid it covers, which grows with
+the distance an edge spans and the boxes along it: diagrams whose edges
+stay between neighbouring layers route in linear time, while long edges
+across a large diagram make it superlinear. Labels go to the first spot
+beside a route segment that overlaps neither a box nor another label.
+"""
+
+import heapq
+from collections import defaultdict, namedtuple
+
+from wireframe_kit.spatial import SpatialIndex
+
+Route = namedtuple('Route', 'points label_xy')
+
+DIRECTIONS = {'top': (0, -1), 'bottom': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+
+# A search region that is closed off grows 4x at most this many times
+MAX_WIDENINGS = 3
+
+
+def _sides(parent, child):
+    """(parent side, child side) for an edge between two boxes"""
+    if child[1] >= parent[3]:
+        return 'bottom', 'top'
+    if child[3] <= parent[1]:
+        return 'top', 'bottom'
+    if child[0] >= parent[2]:
+        return 'right', 'left'
+    return 'left', 'right'
+
+
+def _centre(box):
+    return (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+
+
+def simplify(points):
+    """Drop repeated and collinear points from an orthogonal polyline"""
+    result = []
+    for point in points:
+        if result and point == result[-1]:
+            continue
+        if len(result) >= 2:
+            (x0, y0), (x1, y1) = result[-2], result[-1]
+            if (x0 == x1 == point[0]) or (y0 == y1 == point[1]):
+                result[-1] = point
+                continue
+        result.append(point)
+    return result
+
+
+class Router:
+    """Route orthogonal edges between the boxes of a diagram"""
+
+    def __init__(self, boxes, clearance=10, bend_cost=40, max_steps=20000):
+        self.boxes = boxes
+        self.clearance = clearance
+        self.bend_cost = bend_cost
+        self.max_steps = max_steps
+        self.obstacles = SpatialIndex()
+        for key, (x1, y1, x2, y2) in boxes.items():
+            self.obstacles.insert(key, (x1 - clearance + 1, y1 - clearance + 1,
+                                        x2 + clearance - 1, y2 + clearance - 1))
+        self.labels = SpatialIndex()
+        # (x1, y1, x2, y2) of a grid link -> whether it crosses a box, shared
+        # by every search since neighbouring edges see the same grid lines
+        self.blocked = {}
+
+    def _segment_clear(self, a, b):
+        box = (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]) + 1, max(a[1], b[1]) + 1)
+        return not self.obstacles.query(box)
+
+    def _path_clear(self, points):
+        return all(self._segment_clear(a, b) for a, b in zip(points, points[1:]))
+
+    def _channels(self, a, b, axis):
+        """Coordinates along axis just outside the boxes between a and b"""
+        lo_x, hi_x = sorted((a[0], b[0]))
+        lo_y, hi_y = sorted((a[1], b[1]))
+        pad = 4 * self.clearance
+        near = self.obstacles.query((lo_x - pad, lo_y - pad, hi_x + pad, hi_y + pad))
+        values = set()
+        for key in near:
+            box = self.obstacles.boxes[key]
+            values.add(box[axis] - 1)
+            values.add(box[axis + 2] + 1)
+        return values
+
+    def _candidates(self, a, b, vertical):
+        """Z- and L-shaped routes between a and b, fewest bends first"""
+        (ax, ay), (bx, by) = a, b
+        axis = 1 if vertical else 0
+        start, end = (ay, by) if vertical else (ax, bx)
+        mid = (start + end) // 2
+        channels = sorted({mid, start, end} | self._channels(a, b, axis), key=lambda v: abs(v - mid))
+
+        def z(v):
+            return [a, (ax, v), (bx, v), b] if vertical else [a, (v, ay), (v, by), b]
+
+        yield z(mid)
+        yield [a, (bx, ay), b]
+        yield [a, (ax, by), b]
+        for v in channels[1:]:
+            yield z(v)
+
+    def _blocked(self, x1, y1, x2, y2):
+        """Whether the grid link from (x1, y1) right or down to (x2, y2) crosses a box"""
+        key = (x1, y1, x2, y2)
+        blocked = self.blocked.get(key)
+        if blocked is None:
+            blocked = self.blocked[key] = bool(self.obstacles.query((x1, y1, x2 + 1, y2 + 1)))
+        return blocked
+
+    def _search(self, a, b, pad):
+        """A* over the sparse orthogonal visibility grid around a and b
+
+        Grid lines run through a, b and just outside every box within pad of
+        their bounding box, so any route around the boxes can bend on them.
+        Returns the path or None, and whether the region was searched to the
+        end rather than given up after max_steps.
+        """
+        lo_x, hi_x = min(a[0], b[0]) - pad, max(a[0], b[0]) + pad
+        lo_y, hi_y = min(a[1], b[1]) - pad, max(a[1], b[1]) + pad
+        xs, ys = {a[0], b[0]}, {a[1], b[1]}
+        for key in self.obstacles.query((lo_x, lo_y, hi_x, hi_y)):
+            x1, y1, x2, y2 = self.obstacles.boxes[key]
+            xs.update((x1 - 1, x2 + 1))
+            ys.update((y1 - 1, y2 + 1))
+        xs = sorted(x for x in xs if lo_x <= x <= hi_x)
+        ys = sorted(y for y in ys if lo_y <= y <= hi_y)
+        start, goal = (xs.index(a[0]), ys.index(a[1])), (xs.index(b[0]), ys.index(b[1]))
+        bx, by, bend_cost = b[0], b[1], self.bend_cost
+        blocked = self._blocked
+
+        def h(x, y):
+            # off both of the goal's lines means at least one more bend
+            return abs(x - bx) + abs(y - by) + (bend_cost if x != bx and y != by else 0)
+
+        # One state per grid point, remembering the heading it was reached
+        # with; ties go to the deeper entry so equal-cost routes are not all
+        # expanded. Links are checked against the boxes only when reached.
+        frontier = [(h(a[0], a[1]), 0, start)]
+        came = {start: None}
+        cost = {start: 0}
+        heading = {start: None}
+        steps = 0
+        while frontier and steps < self.max_steps:
+            steps += 1
+            _, g, node = heapq.heappop(frontier)
+            g = -g
+            if node == goal:
+                path = []
+                while node:
+                    path.append((xs[node[0]], ys[node[1]]))
+                    node = came[node]
+                return path[::-1], True
+            if g > cost[node]:
+                continue
+            i0, j0 = node
+            x, y = xs[i0], ys[j0]
+            for direction in DIRECTIONS.values():
+                i, j = i0 + direction[0], j0 + direction[1]
+                if not (0 <= i < len(xs) and 0 <= j < len(ys)):
+                    continue
+                nx, ny = xs[i], ys[j]
+                if blocked(*((x, y, nx, ny) if i > i0 or j > j0 else (nx, ny, x, y))):
+                    continue
+                step = g + abs(nx - x) + abs(ny - y)
+                if heading[node] and heading[node] != direction:
+                    step += bend_cost
+                nxt = (i, j)
+                if step < cost.get(nxt, step + 1):
+                    cost[nxt] = step
+                    came[nxt] = node
+                    heading[nxt] = direction
+                    heapq.heappush(frontier, (step + h(nx, ny), -step, nxt))
+        return None, not frontier
+
+    def _grid_route(self, a, b):
+        """Search around a and b, widening the region while it is closed off"""
+        pad = 4 * self.clearance
+        for _ in range(MAX_WIDENINGS + 1):
+            path, explored = self._search(a, b, pad)
+            if path:
+                return simplify(path)
+            if not explored:
+                # out of steps: a wider region would only take longer
+                return None
+            pad *= 4
+        return None
+
+    def route_between(self, start, start_side, end, end_side):
+        """Orthogonal polyline from a port on start_side to a port on end_side"""
+        sdx, sdy = DIRECTIONS[start_side]
+        edx, edy = DIRECTIONS[end_side]
+        a = (start[0] + sdx * self.clearance, start[1] + sdy * self.clearance)
+        b = (end[0] + edx * self.clearance, end[1] + edy * self.clearance)
+        vertical = start_side in ('top', 'bottom')
+        for middle in self._candidates(a, b, vertical):
+            if self._path_clear(middle):
+                return simplify([start] + middle + [end])
+        middle = self._grid_route(a, b)
+        if middle is None or len(middle) < 2:
+            # Nothing clear: fall back to the straightest candidate
+            middle = next(self._candidates(a, b, vertical))
+        return simplify([start] + middle + [end])
+
+    def place_label(self, points, size):
+        """Top-left of a free spot of the given size beside the route, or None"""
+        w, h = size
+        segments = sorted(zip(points, points[1:]),
+                          key=lambda s: abs(s[1][0] - s[0][0]) + abs(s[1][1] - s[0][1]), reverse=True)
+        fallback = None
+        for (x1, y1), (x2, y2) in segments:
+            for t in (0.5, 0.3, 0.7):
+                mx, my = x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+                if x1 == x2:
+                    spots = [(mx + 4, my - h / 2), (mx - 4 - w, my - h / 2)]
+                else:
+                    spots = [(mx - w / 2, my - h - 3), (mx - w / 2, my + 3)]
+                for x, y in spots:
+                    rect = (int(x), int(y), int(x) + w, int(y) + h)
+                    fallback = fallback or rect
+                    if not self.obstacles.query(rect) and not self.labels.query(rect):
+                        self.labels.insert(len(self.labels), rect)
+                        return rect[:2]
+        if fallback and not self.labels.query(fallback):
+            self.labels.insert(len(self.labels), fallback)
+            return fallback[:2]
+        return None
+
+
+def route_edges(boxes, edges, label_sizes=None, clearance=10):
+    """Route (parent, child) edges between boxes, returning a Route per edge
+
+    label_sizes optionally maps an edge to the (width, height) of its label.
+    """
+    router = Router(boxes, clearance)
+    label_sizes = label_sizes or {}
+
+    # Spread the edges that share a box side along that side
+    sides = {}
+    by_side = defaultdict(list)
+    for edge in edges:
+        parent, child = edge
+        if parent == child:
+            continue
+        parent_side, child_side = _sides(boxes[parent], boxes[child])
+        sides[edge] = parent_side, child_side
+        by_side[(parent, parent_side)].append((edge, child))
+        by_side[(child, child_side)].append((edge, parent))
+
+    ports = {}
+    for (node, side), members in by_side.items():
+        x1, y1, x2, y2 = boxes[node]
+        horizontal = side in ('top', 'bottom')
+        members.sort(key=lambda m: _centre(boxes[m[1]])[0 if horizontal else 1])
+        for i, (edge, _) in enumerate(members, 1):
+            t = i / (len(members) + 1)
+            if horizontal:
+                point = (int(x1 + (x2 - x1) * t), y1 if side == 'top' else y2)
+            else:
+                point = (x1 if side == 'left' else x2, int(y1 + (y2 - y1) * t))
+            ports[(edge, node)] = point
+
+    routes = {}
+    for edge in edges:
+        parent, child = edge
+        if parent == child:
+            # Self reference: a loop off the top-right corner
+            x1, y1, x2, y2 = boxes[parent]
+            gap = 2 * clearance
+            points = [(x2, y1 + gap), (x2 + gap, y1 + gap), (x2 + gap, y1 - gap), (x2 - gap, y1 - gap), (x2 - gap, y1)]
+            label_xy = router.place_label(points, label_sizes[edge]) if edge in label_sizes else None
+            routes[edge] = Route(points, label_xy)
+            continue
+        parent_side, child_side = sides[edge]
+        points = router.route_between(ports[(edge, parent)], parent_side, ports[(edge, child)], child_side)
+        label_xy = router.place_label(points, label_sizes[edge]) if edge in label_sizes else None
+        routes[edge] = Route(points, label_xy)
+    return routes
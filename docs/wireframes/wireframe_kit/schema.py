@@ -0,0 +1,308 @@
+"""
+Schema graph parsed from the backend SQL migrations
+
+Each migration is streamed line by line and split into statements outside
+string literals, comments and dollar-quoted function bodies. CREATE TABLE
+and ALTER TABLE statements (also those nested inside DO $$ blocks) are
+reduced to a list of JSON-friendly events, kept in a wireframe_kit.filecache
+so that only migrations whose contents (or this parser) changed are parsed
+again. Replaying the events of
+every migration in order yields the Schema: tables, their columns and the
+foreign key edges between them.
+
+identifier(), split_top_level() and parenthesized() are shared with the seed
+parser in wireframe_kit.seeds.
+"""
+
+import os
+import re
+import sys
+from collections import namedtuple
+
+from wireframe_kit.filecache import parse_files, source_digest
+
+KIT_DIR = os.path.dirname(os.path.abspath(__file__))
+MIGRATIONS_DIR = os.path.normpath(os.path.join(KIT_DIR, '..', '..', '..', 'backend', 'migrations'))
+CACHE_NAME = '.schema-cache.json'
+
+Column = namedtuple('Column', 'name type nullable primary_key')
+ForeignKey = namedtuple('ForeignKey', 'table column ref_table ref_column')
+Table = namedtuple('Table', 'name source columns')
+
+_SCAN = re.compile(r"'|--|/\*|\$(?:[A-Za-z_]\w*)?\$|;")
+_COMMENT = re.compile(r'/\*|\*/')
+_DO = re.compile(r'DO(?: LANGUAGE \w+)?', re.I)
+_CREATE = re.compile(r'\bCREATE\s+(?:UNLOGGED\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w."]+)\s*\(', re.I)
+_ALTER = re.compile(r'\bALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?([\w."]+)\s+(.*)', re.I)
+_COLUMN = re.compile(r'([\w"]+)\s+(.+?)(?=\s+(?:NOT|NULL|DEFAULT|PRIMARY|UNIQUE|REFERENCES|CHECK|'
+                     r'CONSTRAINT|GENERATED|COLLATE)\b|$)', re.I)
+_REFERENCES = re.compile(r'\bREFERENCES\s+([\w."]+)\s*(?:\(\s*([\w"]+)\s*\))?', re.I)
+_TABLE_FK = re.compile(r'\bFOREIGN\s+KEY\s*\(\s*([\w"]+)\s*\)', re.I)
+_ADD_COLUMN = re.compile(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)', re.I)
+_DROP_COLUMN = re.compile(r'DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?([\w"]+)', re.I)
+_CONSTRAINT_START = ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK', 'EXCLUDE')
+
+
+def identifier(text):
+    """Unquoted, schema-less, lower-case form of an SQL identifier"""
+    return text.split('.')[-1].strip('"').lower()
+
+
+def _statement(buf):
+    """The statement buffered so far, with whitespace normalized"""
+    return ' '.join(''.join(buf).split())
+
+
+def iter_statements(lines):
+    """Yield whitespace-normalized SQL statements from an iterable of lines
+
+    String literals, -- and /* */ comments and dollar-quoted bodies are
+    skipped over, except the body of a DO block: that runs with the
+    migration, so its statements are yielded in place of the block.
+    """
+    buf = []
+    in_string = False
+    comment_depth = 0
+    quote = None
+    block = None
+    for line in lines:
+        pos = 0
+        while True:
+            if in_string:
+                end = line.find("'", pos)
+                if end < 0:
+                    buf.append(line[pos:])
+                    break
+                buf.append(line[pos:end + 1])
+                pos = end + 1
+                in_string = False
+                continue
+            if quote:
+                end = line.find(quote, pos)
+                if end < 0:
+                    break
+                buf.append(quote)
+                pos = end + len(quote)
+                quote = None
+                continue
+            if comment_depth:
+                match = _COMMENT.search(line, pos)
+                if not match:
+                    break
+                comment_depth += 1 if match.group() == '/*' else -1
+                if not comment_depth:
+                    buf.append(' ')
+                pos = match.end()
+                continue
+            match = _SCAN.search(line, pos)
+            if not match:
+                buf.append(line[pos:])
+                break
+            token = match.group()
+            buf.append(line[pos:match.start()])
+            pos = match.end()
+            if token == '--':
+                buf.append('\n')
+                break
+            if token == "'":
+                buf.append("'")
+                in_string = True
+            elif token == '/*':
+                comment_depth = 1
+            elif token == ';' or token == block:
+                statement = _statement(buf)
+                if statement:
+                    yield statement
+                buf = []
+                if token == block:
+                    block = None
+            elif block is None and _DO.fullmatch(_statement(buf)):
+                buf = []
+                block = token
+            else:
+                buf.append(token)
+                quote = token
+    statement = _statement(buf)
+    if statement:
+        yield statement
+
+
+def split_top_level(text):
+    """Split text on commas that are not nested in parentheses, brackets or quotes"""
+    parts, depth, start, in_string = [], 0, 0, False
+    for i, ch in enumerate(text):
+        if ch == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+def parenthesized(text, start):
+    """Return the text between the parenthesis opened at start and its match"""
+    depth, in_string = 0, False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if ch == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i]
+    return text[start + 1:]
+
+
+def _reference(definition):
+    """(ref_table, ref_column) named by a REFERENCES clause, or None"""
+    match = _REFERENCES.search(definition)
+    if not match:
+        return None
+    return [identifier(match.group(1)), identifier(match.group(2) or 'id')]
+
+
+def _column(definition):
+    """Parse a column definition into ([name, type, nullable, primary_key], reference)"""
+    match = _COLUMN.match(definition)
+    if not match:
+        return None, None
+    upper = definition.upper()
+    primary = 'PRIMARY KEY' in upper
+    nullable = not primary and 'NOT NULL' not in upper
+    column = [identifier(match.group(1)), match.group(2).upper(), nullable, primary]
+    return column, _reference(definition)
+
+
+def _create_events(table, body):
+    """Events for one CREATE TABLE statement"""
+    columns, references = [], []
+    for item in split_top_level(body):
+        keyword = item.split(None, 1)[0].upper()
+        if keyword in _CONSTRAINT_START:
+            fk = _TABLE_FK.search(item)
+            ref = _reference(item)
+            if fk and ref:
+                references.append([identifier(fk.group(1))] + ref)
+            continue
+        column, ref = _column(item)
+        if column:
+            columns.append(column)
+            if ref:
+                references.append([column[0]] + ref)
+    return [['table', table, columns, references]]
+
+
+def _alter_events(table, actions):
+    """Events for the actions of one ALTER TABLE statement"""
+    events = []
+    for action in split_top_level(actions):
+        upper = action.upper()
+        if upper.startswith('ADD'):
+            fk = _TABLE_FK.search(action)
+            if fk:
+                ref = _reference(action)
+                if ref:
+                    events.append(['fk', table, identifier(fk.group(1))] + ref)
+                continue
+            if re.match(r'ADD\s+(CONSTRAINT|PRIMARY|UNIQUE|CHECK|EXCLUDE)\b', upper):
+                continue
+            column, ref = _column(_ADD_COLUMN.match(action).group(1))
+            if column:
+                events.append(['column', table, column, ref])
+        elif upper.startswith('DROP') and not re.match(r'DROP\s+(CONSTRAINT|DEFAULT|NOT)\b', upper):
+            match = _DROP_COLUMN.match(action)
+            if match:
+                events.append(['drop_column', table, identifier(match.group(1))])
+    return events
+
+
+def parse_migration(path):
+    """Stream one migration file into a list of schema events"""
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for statement in iter_statements(f):
+            create = _CREATE.search(statement)
+            if create:
+                body = parenthesized(statement, create.end() - 1)
+                events.extend(_create_events(identifier(create.group(1)), body))
+                continue
+            alter = _ALTER.search(statement)
+            if alter:
+                events.extend(_alter_events(identifier(alter.group(1)), alter.group(2)))
+    return events
+
+
+class Schema:
+    """Tables, columns and foreign keys built by replaying migration events"""
+
+    def __init__(self):
+        self.tables = {}
+        self.foreign_keys = []
+
+    def apply(self, event, source):
+        """Apply one parsed event from the migration named source"""
+        kind, table = event[0], event[1]
+        if kind == 'table':
+            if table in self.tables:  # CREATE TABLE IF NOT EXISTS on an existing table
+                return
+            _, _, columns, references = event
+            self.tables[table] = Table(table, source, [Column(*c) for c in columns])
+            self.foreign_keys.extend(ForeignKey(table, *ref) for ref in references)
+        elif table not in self.tables:
+            return
+        elif kind == 'column':
+            _, _, column, ref = event
+            columns = self.tables[table].columns
+            if all(c.name != column[0] for c in columns):
+                columns.append(Column(*column))
+            if ref:
+                self.foreign_keys.append(ForeignKey(table, column[0], *ref))
+        elif kind == 'fk':
+            self.foreign_keys.append(ForeignKey(*event[1:]))
+        elif kind == 'drop_column':
+            columns = self.tables[table].columns
+            columns[:] = [c for c in columns if c.name != event[2]]
+            self.foreign_keys = [fk for fk in self.foreign_keys
+                                 if not (fk.table == table and fk.column == event[2])]
+
+    def edges(self):
+        """Unique (table, ref_table) pairs whose tables both exist"""
+        seen = {}
+        for fk in self.foreign_keys:
+            if fk.ref_table in self.tables:
+                seen.setdefault((fk.table, fk.ref_table), fk)
+        return list(seen.values())
+
+    def key_columns(self, table):
+        """Names of the primary and foreign key columns of table"""
+        fks = {fk.column for fk in self.foreign_keys if fk.table == table}
+        return [c for c in self.tables[table].columns if c.primary_key or c.name in fks]
+
+
+def migration_paths(migrations_dir=MIGRATIONS_DIR):
+    """Numbered migration files in apply order"""
+    names = sorted(n for n in os.listdir(migrations_dir) if re.match(r'\d+_.*\.sql$', n))
+    return [os.path.join(migrations_dir, n) for n in names]
+
+
+def load_schema(migrations_dir=MIGRATIONS_DIR, cache_dir=None):
+    """Build the Schema, re-parsing only migrations whose hash is not cached"""
+    paths = migration_paths(migrations_dir)
+    parsed = parse_files(paths, parse_migration, cache_dir, CACHE_NAME,
+                         source_digest(sys.modules[__name__]))
+    schema = Schema()
+    for path, events in zip(paths, parsed):
+        for event in events:
+            schema.apply(event, os.path.basename(path))
+    return schema
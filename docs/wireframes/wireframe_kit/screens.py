@@ -0,0 +1,501 @@
+"""
+Declarative screen specs
+
+A screen is described in a YAML or JSON file: its title, the active
+sidebar item and a list of sections stacked top to bottom, e.g.
+
+    title: Payroll Runs
+    subtitle: Monthly payroll for outsourced staff
+    nav: 4
+    actions: ["+ New Run", {text: Export, primary: false}]
+    sections:
+      - filters: [{search: Search runs...}, {dropdown: "Status: All"}]
+      - stats: [{label: Gross Pay, value: N48.2M, trend: 4%}]
+      - table:
+          columns: [Period, {title: Staff, width: 80}, Status]
+          rows:
+            - [Nov 2025, 214, {badge: Paid, color: success}]
+
+Section kinds are filters, stats, table, kanban, cards, list, summary and
+pagination (see SECTIONS). The compiler validates a spec into a tree of
+layout boxes (wireframe_kit.layout) stacked in one column, lays the tree
+out in the content frame and flattens it into widget calls, (kind, kwargs)
+pairs that the generator replays through its draw_* helpers. Compiled
+screens are kept in a wireframe_kit.filecache keyed on the frame and the
+source of the compiler and layout engine, so a spec is only parsed and
+validated again when it changes.
+
+JSON specs need only the standard library. YAML specs need PyYAML
+(pip install pyyaml), an optional dependency: without it read_spec()
+raises a SpecError for each YAML spec, which fails only that screen.
+"""
+
+import json
+import os
+import sys
+from collections import namedtuple
+
+from wireframe_kit import layout
+from wireframe_kit.filecache import FileCache, file_digest, source_digest
+from wireframe_kit.fonts import get_font, text_bbox
+from wireframe_kit.layout import Box
+
+CACHE_NAME = '.screen-cache.json'
+SPEC_EXTENSIONS = ('.yaml', '.yml', '.json')
+BADGE_COLORS = ('primary', 'success', 'warning', 'danger', 'info', 'light')
+
+# Rhythm of the hand-drawn screens
+GAP = 20
+PAGE_HEADER_HEIGHTS = {False: 28, True: 36}  # without and with a subtitle
+FILTER_HEIGHT = 36
+TABLE_HEADER_HEIGHT = 44
+TABLE_ROW_HEIGHT = 48
+KANBAN_GAP = 8
+STAT_GAP = 16
+STAT_MIN_HEIGHT = 72
+STAT_TREND_HEIGHT = 28
+CARD_TITLE_HEIGHT = 52
+CARD_LINE_HEIGHT = 28
+LIST_ITEM_HEIGHT = 72
+SUMMARY_HEIGHT = 60
+SUMMARY_COLUMN = 200
+
+# Content area of a screen: left, top, width and bottom
+Frame = namedtuple('Frame', 'x y width bottom')
+Screen = namedtuple('Screen', 'name title nav widgets')
+
+
+class SpecError(ValueError):
+    """A screen spec that does not validate, with the file and key path"""
+
+
+_REQUIRED = object()
+
+
+def _field(spec, key, types, where, default=_REQUIRED):
+    """spec[key] checked against types, or default when it is optional"""
+    if key not in spec:
+        if default is _REQUIRED:
+            raise SpecError(f"{where}: missing '{key}'")
+        return default
+    value = spec[key]
+    if isinstance(value, bool) and bool not in types:
+        raise SpecError(f"{where}.{key}: expected {' or '.join(t.__name__ for t in types)}")
+    if not isinstance(value, types):
+        raise SpecError(f"{where}.{key}: expected {' or '.join(t.__name__ for t in types)}, "
+                        f"got {type(value).__name__}")
+    return value
+
+
+def _mapping(value, keys, where):
+    """Check that value is a mapping using only the given keys"""
+    if not isinstance(value, dict):
+        raise SpecError(f"{where}: expected a mapping, got {type(value).__name__}")
+    unknown = sorted(set(value) - set(keys))
+    if unknown:
+        raise SpecError(f"{where}: unknown key '{unknown[0]}' (expected one of {', '.join(keys)})")
+    return value
+
+
+def _items(value, where, minimum=1):
+    if not isinstance(value, list) or len(value) < minimum:
+        raise SpecError(f"{where}: expected a list of at least {minimum} item(s)")
+    return list(enumerate(value))
+
+
+def _color(spec, key, where, default):
+    color = _field(spec, key, (str,), where, default)
+    if color not in BADGE_COLORS:
+        raise SpecError(f"{where}.{key}: '{color}' is not one of {', '.join(BADGE_COLORS)}")
+    return color
+
+
+def _text(value, where):
+    """Scalars (numbers included) shown as text"""
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise SpecError(f"{where}: expected text, got {type(value).__name__}")
+
+
+def _button(value, where, primary):
+    """[text, primary] from "text" or {text, primary}"""
+    if isinstance(value, dict):
+        _mapping(value, ('text', 'primary'), where)
+        return [_text(_field(value, 'text', (str,), where), where),
+                _field(value, 'primary', (bool,), where, primary)]
+    return [_text(value, where), primary]
+
+
+# ============ Sections ============
+# Each validates its spec and returns a layout box; boxes with a widget
+# become draw_* calls at the rectangle the layout gives them
+
+def _widget(kind, args, *children, direction='column', **props):
+    return Box(direction if children else None, children, widget=kind, args=args, **props)
+
+
+def _label(text, size=12, bold=False, color='text', **props):
+    args = {'size': size, 'bold': bold, 'color': color}
+    return layout.text(text, get_font(size, bold=bold), widget='label', args=args,
+                       finish=_label_text, **props)
+
+
+def _label_text(box, args):
+    # the text lives on the box so that editing it relays the label out
+    return dict(args, text=box.data['text'])
+
+
+def _measure_badge(box):
+    bbox = text_bbox(box.data['args']['text'], get_font(11, bold=True))
+    return bbox[2] - bbox[0] + 16, 22
+
+
+def _filters(spec, where):
+    fields = []
+    for i, item in _items(spec, where):
+        at = f"{where}[{i}]"
+        _mapping(item, ('search', 'dropdown', 'width'), at)
+        if ('search' in item) == ('dropdown' in item):
+            raise SpecError(f"{at}: expected exactly one of 'search' or 'dropdown'")
+        kind = 'input' if 'search' in item else 'dropdown'
+        text = _text(item['search' if kind == 'input' else 'dropdown'], at)
+        width = _field(item, 'width', (int,), at, 280 if kind == 'input' else 140)
+        args = {'placeholder': text} if kind == 'input' else {'text': text}
+        fields.append(_widget(kind, args, width=width, height=FILTER_HEIGHT))
+    return layout.row(*fields, gap=GAP)
+
+
+def _stats(spec, where):
+    cards = []
+    for i, item in _items(spec, where):
+        at = f"{where}[{i}]"
+        _mapping(item, ('label', 'value', 'trend', 'down', 'height'), at)
+        trend = _field(item, 'trend', (str, int, float), at, None)
+        height = _field(item, 'height', (int,), at, 100)
+        minimum = STAT_MIN_HEIGHT + (STAT_TREND_HEIGHT if trend is not None else 0)
+        if height < minimum:
+            raise SpecError(f"{at}.height: this stat card needs at least {minimum}px")
+        cards.append(_widget('stat_card', {
+            'label': _text(_field(item, 'label', (str,), at), at),
+            'value': _text(_field(item, 'value', (str, int, float), at), at),
+            'trend': None if trend is None else str(trend),
+            'trend_up': not _field(item, 'down', (bool,), at, False),
+        }, grow=1, height=height))
+    return layout.row(*cards, gap=STAT_GAP, align='start')
+
+
+def _cell(value, where):
+    """Table cell: text, or [text, color] for a badge"""
+    if isinstance(value, dict):
+        _mapping(value, ('badge', 'color'), where)
+        return [_text(_field(value, 'badge', (str,), where), where),
+                _color(value, 'color', where, 'primary')]
+    if value is None:
+        return ""
+    return _text(value, where)
+
+
+def _table(spec, where):
+    _mapping(spec, ('columns', 'rows'), where)
+    headers, widths = [], []
+    for i, column in _items(_field(spec, 'columns', (list,), where), f"{where}.columns"):
+        at = f"{where}.columns[{i}]"
+        if isinstance(column, dict):
+            _mapping(column, ('title', 'width'), at)
+            headers.append(_text(_field(column, 'title', (str,), at), at))
+            widths.append(_field(column, 'width', (int,), at, None))
+        else:
+            headers.append(_text(column, at))
+            widths.append(None)
+
+    rows = []
+    for i, row in _items(_field(spec, 'rows', (list,), where), f"{where}.rows", minimum=0):
+        at = f"{where}.rows[{i}]"
+        if not isinstance(row, list) or len(row) != len(headers):
+            raise SpecError(f"{at}: expected a list of {len(headers)} cells")
+        rows.append([_cell(cell, f"{at}[{j}]") for j, cell in enumerate(row)])
+    return _widget('table', {'headers': headers, 'rows': rows, 'col_widths': widths},
+                   height=TABLE_HEADER_HEIGHT + TABLE_ROW_HEIGHT * len(rows),
+                   measure=_measure_table, finish=_share_columns)
+
+
+def _measure_table(box):
+    return sum(w for w in box.data['args']['col_widths'] if w is not None), 0
+
+
+def _share_columns(box, args):
+    """Columns without a width share what the others leave of the table"""
+    widths = args['col_widths']
+    free = widths.count(None)
+    share = (box.rect.width - sum(w for w in widths if w is not None)) // free if free else 0
+    return dict(args, col_widths=[share if w is None else w for w in widths])
+
+
+def _kanban(spec, where):
+    columns = []
+    for i, column in _items(spec, where):
+        at = f"{where}[{i}]"
+        _mapping(column, ('title', 'count', 'value', 'unit', 'cards'), at)
+        cards = []
+        for j, card in _items(_field(column, 'cards', (list,), at, []), f"{at}.cards", minimum=0):
+            card_at = f"{at}.cards[{j}]"
+            _mapping(card, ('title', 'value', 'owner'), card_at)
+            cards.append({key: _text(_field(card, key, (str, int, float), card_at, ""), card_at)
+                          for key in ('title', 'value', 'owner')})
+        columns.append(_widget('kanban_column', {
+            'title': _text(_field(column, 'title', (str,), at), at),
+            'count': _text(_field(column, 'count', (str, int), at, len(cards)), at),
+            'value': _text(_field(column, 'value', (str, int, float), at, ""), at),
+            'cards': cards,
+            'unit': _text(_field(column, 'unit', (str,), at, "deals"), at),
+        }, grow=1))
+    # the board takes whatever height the other sections leave
+    return layout.row(*columns, gap=KANBAN_GAP, grow=1)
+
+
+def _pairs(items, where):
+    """[label, value] items as text pairs"""
+    pairs = []
+    for i, item in items:
+        at = f"{where}[{i}]"
+        if not isinstance(item, list) or len(item) != 2:
+            raise SpecError(f"{at}: expected [label, value]")
+        pairs.append((_text(item[0], at), _text(item[1], at)))
+    return pairs
+
+
+def _cards(spec, where):
+    cards = []
+    for i, card in _items(spec, where):
+        at = f"{where}[{i}]"
+        _mapping(card, ('title', 'items', 'height'), at)
+        pairs = _pairs(_items(_field(card, 'items', (list,), at), f"{at}.items", minimum=0),
+                       f"{at}.items")
+        lines = [layout.row(_label(label, color='text_secondary', grow=1), _label(value, bold=True, grow=1),
+                            height=CARD_LINE_HEIGHT)
+                 for label, value in pairs]
+        cards.append(_widget('card', {'title': _text(_field(card, 'title', (str,), at), at)}, *lines,
+                             grow=1, height=_field(card, 'height', (int,), at, None),
+                             padding=(CARD_TITLE_HEIGHT, 16, 0, 16)))
+    return layout.row(*cards, gap=STAT_GAP, align='start')
+
+
+def _list(spec, where):
+    items = []
+    for i, item in _items(spec, where):
+        at = f"{where}[{i}]"
+        _mapping(item, ('title', 'detail', 'badge', 'color', 'due'), at)
+        lines = [_label(_text(_field(item, 'title', (str,), at), at), size=13, bold=True)]
+        detail = _field(item, 'detail', (str,), at, None)
+        if detail:
+            lines.append(_label(detail, size=11, color='text_secondary'))
+        badge = _field(item, 'badge', (str,), at, None)
+        due = _field(item, 'due', (str,), at, None)
+        if badge:
+            end = Box(measure=_measure_badge, widget='badge',
+                      args={'text': badge, 'color': _color(item, 'color', at, 'primary')})
+        elif due:
+            end = _label(f"Due: {due}", size=11, color='text_secondary')
+        else:
+            end = layout.spacer(0)
+        items.append(_widget('card', {}, Box(width=20, height=20, widget='checkbox', args={}),
+                             layout.column(*lines, gap=8, grow=1), end,
+                             direction='row', height=LIST_ITEM_HEIGHT, padding=(0, 20), gap=16,
+                             align='center'))
+    return layout.column(*items, gap=12)
+
+
+def _summary(spec, where):
+    pairs = [layout.column(_label(label, color='text_secondary', height=20),
+                           _label(value, size=14, bold=True), width=SUMMARY_COLUMN)
+             for label, value in _pairs(_items(spec, where), where)]
+    return _widget('card', {}, *pairs, direction='row', height=SUMMARY_HEIGHT, padding=(14, 24))
+
+
+def _pagination(spec, where):
+    """Footer pinned to the bottom of the frame"""
+    _mapping(spec, ('text',), where)
+    text = _text(_field(spec, 'text', (str,), where), where)
+    return layout.row(_label(text, color='text_secondary'), layout.spacer(),
+                      _widget('button', {'text': "Previous"}, width=80, height=32),
+                      _widget('button', {'text': "Next", 'primary': True}, width=80, height=32),
+                      height=32, gap=10, align='center', pinned=True)
+
+
+SECTIONS = {
+    'filters': _filters,
+    'stats': _stats,
+    'table': _table,
+    'kanban': _kanban,
+    'cards': _cards,
+    'list': _list,
+    'summary': _summary,
+    'pagination': _pagination,
+}
+
+# Which of x, y, width and height each draw_* helper takes from its box
+GEOMETRY = {
+    'page_header': ('x', 'y', 'width'),
+    'input': ('x', 'y', 'width'),
+    'dropdown': ('x', 'y', 'width'),
+    'table': ('x', 'y', 'width'),
+    'button': ('x', 'y', 'width', 'height'),
+    'card': ('x', 'y', 'width', 'height'),
+    'stat_card': ('x', 'y', 'width', 'height'),
+    'kanban_column': ('x', 'y', 'width', 'height'),
+    'label': ('x', 'y'),
+    'badge': ('x', 'y'),
+    'checkbox': ('x', 'y'),
+}
+
+
+def build_spec(spec, name='screen'):
+    """Validate a parsed spec into (title, nav, layout box) without placing it"""
+    where = name
+    _mapping(spec, ('title', 'subtitle', 'nav', 'actions', 'sections'), where)
+    title = _text(_field(spec, 'title', (str,), where), f"{where}.title")
+    subtitle = _field(spec, 'subtitle', (str,), where, None)
+    nav = _field(spec, 'nav', (int,), where, 0)
+    if nav < 0:
+        raise SpecError(f"{where}.nav: expected a sidebar item index, got {nav}")
+    actions = [_button(action, f"{where}.actions[{i}]", i == 0)
+               for i, action in _items(_field(spec, 'actions', (list,), where, []),
+                                       f"{where}.actions", minimum=0)]
+
+    root = layout.column(gap=GAP)
+    root.append(_widget('page_header', {'title': title, 'subtitle': subtitle, 'buttons': actions},
+                        height=PAGE_HEADER_HEIGHTS[bool(subtitle)]))
+    for i, section in _items(_field(spec, 'sections', (list,), where), f"{where}.sections"):
+        at = f"{where}.sections[{i}]"
+        if not isinstance(section, dict) or len(section) != 1:
+            raise SpecError(f"{at}: expected a single 'kind: ...' mapping")
+        (kind, body), = section.items()
+        if kind not in SECTIONS:
+            raise SpecError(f"{at}: unknown section '{kind}' (expected one of {', '.join(SECTIONS)})")
+        box = SECTIONS[kind](body, f"{at}.{kind}")
+        box.data['where'] = f"{at}.{kind}"
+        if box.data.get('pinned'):
+            root.append(layout.spacer())
+        root.append(box)
+    return title, nav, root
+
+
+def place(root, frame):
+    """Lay a built screen out in frame and flatten it into (kind, kwargs) widgets"""
+    height = frame.bottom - frame.y
+    if root.size()[1] > height:
+        raise SpecError(f"sections need {root.size()[1]}px, the screen has {height}px")
+    root.layout(frame.x, frame.y, frame.width, height)
+    widgets = []
+    for box in root.walk():
+        if 'where' in box.data and box.size()[0] > box.rect.width:
+            raise SpecError(f"{box.data['where']}: needs {box.size()[0]}px, the screen has "
+                            f"{box.rect.width}px")
+        kind = box.data.get('widget')
+        if kind:
+            geometry = dict(zip(('x', 'y', 'width', 'height'), box.rect))
+            args = dict({k: geometry[k] for k in GEOMETRY[kind]}, **box.data['args'])
+            if 'finish' in box.data:
+                args = box.data['finish'](box, args)
+            widgets.append((kind, args))
+    return widgets
+
+
+def compile_spec(spec, frame, name='screen'):
+    """Validate a parsed spec and lay it out into frame as a Screen"""
+    title, nav, root = build_spec(spec, name)
+    try:
+        widgets = place(root, frame)
+    except SpecError as e:
+        message = str(e)
+        raise SpecError(message if message.startswith(name) else f"{name}: {message}") from None
+    return Screen(name, title, nav, widgets)
+
+
+def _thaw(screen):
+    """Screen with the tuples JSON turned into lists restored"""
+    widgets = []
+    for kind, args in screen.widgets:
+        kind = str(kind)
+        if kind == 'table':
+            # draw_table tells badge cells by their tuple type
+            args = dict(args, rows=[[tuple(c) if isinstance(c, list) else c for c in row]
+                                    for row in args['rows']])
+        widgets.append((kind, args))
+    return Screen(screen.name, screen.title, screen.nav, tuple(widgets))
+
+
+def read_spec(path):
+    """Parse a spec file, JSON or YAML by extension"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            try:
+                return json.load(f)
+            except ValueError as e:
+                raise SpecError(f"{os.path.basename(path)}: {e}") from None
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError(f"{os.path.basename(path)}: reading YAML specs needs PyYAML "
+                            "(pip install pyyaml), or write the spec as JSON") from None
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise SpecError(f"{os.path.basename(path)}: {e}") from None
+
+
+def spec_paths(specs_dir):
+    """Spec files in a directory, in name order"""
+    names = sorted(n for n in os.listdir(specs_dir) if n.endswith(SPEC_EXTENSIONS))
+    return [os.path.join(specs_dir, n) for n in names]
+
+
+def spec_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# Compiled screens of this process, keyed by path, file hash and frame
+_compiled = {}
+
+
+def load_screens(paths, frame, cache_dir=None, errors=None):
+    """Compile spec files into Screens, reusing the cached layout of unchanged ones
+
+    Raises SpecError for the first spec that does not validate, unless an
+    errors dict is given: each such spec is then left out and its SpecError
+    stored under its path.
+    """
+    frame = Frame(*frame)
+    cache = FileCache(cache_dir, CACHE_NAME,
+                      [source_digest(sys.modules[__name__], layout), list(frame)])
+    screens = []
+    for path in paths:
+        name = spec_name(path)
+        digest = file_digest(path)
+        screen = _compiled.get((path, digest, frame))
+        if screen is None:
+            stored = cache.get(name, digest)
+            if stored is not None:
+                screen = _thaw(Screen(*stored))
+        if screen is None:
+            try:
+                screen = _thaw(compile_spec(read_spec(path), frame, name))
+            except SpecError as e:
+                if errors is None:
+                    raise
+                errors[path] = e
+                continue
+        _compiled[(path, digest, frame)] = screen
+        cache.put(name, digest, screen)
+        screens.append(screen)
+    cache.save()
+    return screens
+
+
+def load_screen(path, frame):
+    """Screen for one spec file, compiled by an earlier load_screens() if unchanged"""
+    frame = Frame(*frame)
+    key = (path, file_digest(path), frame)
+    if key not in _compiled:
+        _compiled[key] = _thaw(compile_spec(read_spec(path), frame, spec_name(path)))
+    return _compiled[key]
@@ -0,0 +1,185 @@
+"""
+Seed rows streamed from the backend SQL migrations
+
+Screens can be filled with the demo data the backend seeds
+(002_seed_data.sql, 009_teamace_employees_seed.sql and the other
+migrations that insert rows) instead of hand-typed rows. Each migration is
+streamed statement by statement with the schema parser's splitter, and
+every INSERT INTO table (columns) VALUES (...), (...) is reduced to its
+table, columns and rows of literal values: strings, numbers, booleans,
+NULL and ARRAY[...] lists, with casts dropped. Any other expression, such
+as uuid_generate_v4() or NOW(), becomes an Expression holding its SQL.
+INSERT ... SELECT statements are skipped.
+
+The inserts of each migration go through the same wireframe_kit.filecache
+as the schema events, so only a changed migration is parsed again. Seeds.records(table)
+yields the rows of a table as namedtuples whose fields are the union of
+the columns its inserts name. Seeds are a handful of rows per table; a
+Volume repeats them up to a production-like count as a sequence that
+wireframe_kit.viewport slices without materializing, and whose totals
+are summed over the seeds times their repeats, so screens can be rendered
+at thousands of rows for what the visible ones cost.
+"""
+
+import re
+import sys
+from collections import namedtuple
+from collections.abc import Sequence
+from itertools import cycle, islice
+
+from wireframe_kit import schema
+from wireframe_kit.filecache import parse_files, source_digest
+from wireframe_kit.schema import (
+    MIGRATIONS_DIR, identifier, iter_statements, migration_paths, parenthesized, split_top_level,
+)
+
+CACHE_NAME = '.seed-cache.json'
+
+Expression = namedtuple('Expression', 'sql')
+
+_INSERT = re.compile(r'INSERT\s+INTO\s+([\w."]+)\s*\(', re.I)
+_VALUES = re.compile(r'\s*VALUES\s*', re.I)
+_NEXT_ROW = re.compile(r'\s*,\s*')
+_NUMBER = re.compile(r'[-+]?\d+(\.\d*)?([eE][-+]?\d+)?$')
+_CAST = re.compile(r'::[\w ]+(\[\])?$')
+_ARRAY = re.compile(r'ARRAY\s*\[(.*)\]$', re.I | re.S)
+
+
+def _value(text):
+    """Python value of a SQL literal, or an Expression"""
+    text = _CAST.sub('', text).strip()
+    upper = text.upper()
+    if upper == 'NULL':
+        return None
+    if upper in ('TRUE', 'FALSE'):
+        return upper == 'TRUE'
+    if len(text) >= 2 and text[0] == "'" and text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    number = _NUMBER.match(text)
+    if number:
+        return float(text) if number.group(1) or number.group(2) else int(text)
+    array = _ARRAY.match(text)
+    if array:
+        return [_value(item) for item in split_top_level(array.group(1))]
+    return {'sql': text}
+
+
+def _insert(statement):
+    """[table, columns, rows] of an INSERT ... VALUES statement, or None"""
+    match = _INSERT.match(statement)
+    if not match:
+        return None
+    names = parenthesized(statement, match.end() - 1)
+    columns = [identifier(c) for c in split_top_level(names)]
+    pos = match.end() + len(names) + 1
+    values = _VALUES.match(statement, pos)
+    if not values:
+        return None
+    rows, pos = [], values.end()
+    while pos < len(statement) and statement[pos] == '(':
+        body = parenthesized(statement, pos)
+        row = [_value(item) for item in split_top_level(body)]
+        if len(row) == len(columns):
+            rows.append(row)
+        pos += len(body) + 2
+        comma = _NEXT_ROW.match(statement, pos)
+        if not comma:
+            break
+        pos = comma.end()
+    return [identifier(match.group(1)), columns, rows]
+
+
+def parse_seeds(path):
+    """Stream one migration file into a list of [table, columns, rows] inserts"""
+    inserts = []
+    with open(path, encoding='utf-8') as f:
+        for statement in iter_statements(f):
+            insert = _insert(statement)
+            if insert and insert[2]:
+                inserts.append(insert)
+    return inserts
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        return Expression(value['sql'])
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class Seeds:
+    """Rows inserted by the migrations, by table"""
+
+    def __init__(self, inserts):
+        self.inserts = {}
+        for table, columns, rows in inserts:
+            self.inserts.setdefault(table, []).append((columns, rows))
+        self._types = {}
+
+    def tables(self):
+        """Names of the tables that have seed rows"""
+        return list(self.inserts)
+
+    def columns(self, table):
+        """Every column the inserts into table name, in first-seen order"""
+        return list(dict.fromkeys(c for columns, _ in self.inserts.get(table, ()) for c in columns))
+
+    def record_type(self, table):
+        """namedtuple with a field per column of table"""
+        record = self._types.get(table)
+        if record is None:
+            name = ''.join(part.title() for part in table.split('_')) or 'Record'
+            record = self._types[table] = namedtuple(name, self.columns(table) or ['id'], rename=True)
+        return record
+
+    def records(self, table):
+        """Yield the seed rows of table in migration order, unnamed columns None"""
+        record = self.record_type(table)
+        index = {column: i for i, column in enumerate(self.columns(table))}
+        for columns, rows in self.inserts.get(table, ()):
+            positions = [index[c] for c in columns]
+            for row in rows:
+                values = [None] * len(record._fields)
+                for position, value in zip(positions, row):
+                    values[position] = _decode(value)
+                yield record._make(values)
+
+    def by_id(self, table):
+        """Seed rows of table keyed by their id column"""
+        return {r.id: r for r in self.records(table)}
+
+
+class Volume(Sequence):
+    """count records, the seeds repeated in order as often as needed, without copying them"""
+
+    def __init__(self, records, count):
+        self.seeds = list(records)
+        self.count = count if self.seeds else 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.seeds[index % len(self.seeds)]
+
+    def __iter__(self):
+        return islice(cycle(self.seeds), self.count)
+
+    def repeats(self):
+        """(seed, times it occurs) pairs, for totals that cost as much at any count"""
+        whole, extra = divmod(self.count, len(self.seeds)) if self.seeds else (0, 0)
+        return [(seed, whole + (i < extra)) for i, seed in enumerate(self.seeds)]
+
+
+def load_seeds(migrations_dir=MIGRATIONS_DIR, cache_dir=None):
+    """Parse the seed rows, re-parsing only migrations whose hash is not cached"""
+    parsed = parse_files(migration_paths(migrations_dir), parse_seeds, cache_dir, CACHE_NAME,
+                         source_digest(sys.modules[__name__], schema))
+    return Seeds(insert for inserts in parsed for insert in inserts)
@@ -0,0 +1,52 @@
+"""
+Soft drop shadows composited into RGB canvases
+
+Pillow ignores the alpha byte of '#RRGGBBAA' fills on an RGB image, so shadows
+drawn that way come out opaque. Instead each shadow is rendered once as a
+blurred greyscale mask the size of the shape plus a blur margin, cached by
+(width, height, radius, blur, alpha), and pasted with the shadow color
+through that mask. Only the shadow's own region of the canvas is touched.
+"""
+
+from functools import lru_cache
+
+
+def parse_color(color):
+    """Split '#RRGGBB' or '#RRGGBBAA' into ((r, g, b), alpha)"""
+    hex_color = color.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    alpha = int(hex_color[6:8], 16) if len(hex_color) == 8 else 255
+    return rgb, alpha
+
+
+def margin(blur):
+    """Pixels the blur spreads beyond the shape on each side"""
+    return blur * 3
+
+
+@lru_cache(maxsize=256)
+def shadow_mask(width, height, radius, blur, alpha):
+    """Return the blurred 'L' mask for a rounded rectangle of the given size"""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    pad = margin(blur)
+    mask = Image.new('L', (width + 2 * pad, height + 2 * pad), 0)
+    ImageDraw.Draw(mask).rounded_rectangle((pad, pad, pad + width, pad + height),
+                                           radius=radius, fill=alpha)
+    if blur:
+        mask = mask.filter(ImageFilter.GaussianBlur(blur))
+    return mask
+
+
+def composite_shadow(img, coords, radius=8, blur=5, color='#00000015'):
+    """Blend a soft shadow for the rounded rectangle coords into img"""
+    x1, y1, x2, y2 = (int(round(c)) for c in coords)
+    rgb, alpha = parse_color(color)
+    mask = shadow_mask(x2 - x1, y2 - y1, radius, blur, alpha)
+    pad = margin(blur)
+    img.paste(rgb, (x1 - pad, y1 - pad, x1 - pad + mask.width, y1 - pad + mask.height), mask)
+
+
+def shadow_cache_info():
+    """Return the mask cache statistics"""
+    return shadow_mask.cache_info()
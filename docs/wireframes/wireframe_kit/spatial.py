@@ -0,0 +1,55 @@
+"""
+Uniform-grid spatial index for rectangles
+
+Boxes are bucketed into square cells, so an overlap query only looks at the
+boxes sharing a cell with the query rectangle instead of every placed box.
+Used by the graph layout to find free space and by the edge router to find
+the obstacles along a segment.
+"""
+
+from collections import defaultdict
+
+
+def overlaps(a, b):
+    """True if two (x1, y1, x2, y2) boxes share interior area"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class SpatialIndex:
+    """Bucket grid mapping cells to the keys of the boxes that cover them"""
+
+    def __init__(self, cell=128):
+        self.cell = cell
+        self.boxes = {}
+        self._buckets = defaultdict(list)
+
+    def _cells(self, box):
+        x1, y1, x2, y2 = box
+        cell = self.cell
+        for cx in range(int(x1 // cell), int(x2 // cell) + 1):
+            for cy in range(int(y1 // cell), int(y2 // cell) + 1):
+                yield cx, cy
+
+    def insert(self, key, box):
+        """Add a box under key"""
+        self.boxes[key] = box
+        for cell in self._cells(box):
+            self._buckets[cell].append(key)
+
+    def remove(self, key):
+        """Drop the box stored under key"""
+        box = self.boxes.pop(key)
+        for cell in self._cells(box):
+            self._buckets[cell].remove(key)
+
+    def query(self, box):
+        """Keys of the boxes that overlap box"""
+        found = set()
+        for cell in self._cells(box):
+            for key in self._buckets.get(cell, ()):
+                if key not in found and overlaps(self.boxes[key], box):
+                    found.add(key)
+        return found
+
+    def __len__(self):
+        return len(self.boxes)
@@ -0,0 +1,291 @@
+"""
+Rasterized components cached on disk across runs
+
+Helpers decorated with @sprite (buttons, badges, avatars, stat cards,
+kanban columns) still record their ops into the DisplayList, so SVG,
+HiDPI, supersampled and banded output replay them as vectors. The ops are
+also marked as one group, keyed by a hash of the helper's fingerprint
+(its source, the helpers it calls and the palette and other constants they
+read), its arguments other than the position, and the fractional part of
+that position.
+
+When rasterize() reaches a group it adds the fonts the group uses and its
+clipped extent to the key. On a miss the ops are replayed and the region
+is stored together with a mask of the pixels the group's opaque ops
+(everything but text and shadows) paint, which no longer depend on what
+was under the group. On a hit the group's text and shadows that reach
+outside that mask are replayed onto the canvas and the bitmap is pasted
+through the mask, so the result is identical to replaying every op
+whatever the group is drawn over.
+
+Sprites live in memory for the process and as raw RGBA files in
+SPRITE_DIR across runs. A hit touches the file's modification time, and
+once the directory grows past MAX_BYTES the least recently used files
+are deleted.
+"""
+
+import functools
+import hashlib
+import math
+import os
+from collections import OrderedDict
+
+from wireframe_kit.display_list import OP_ARC, OP_LAYER, OP_LINE, OP_SHADOW, OP_TEXT, _PAINTERS
+from wireframe_kit.manifest import SOURCE_ROOT, fingerprint, font_fingerprint
+
+SPRITE_DIR = os.path.join(SOURCE_ROOT, '.sprite-cache')
+# Size bounds of the directory and of the decoded sprites kept in memory
+MAX_BYTES = 64 * 1024 * 1024
+MAX_MEMORY_BYTES = 32 * 1024 * 1024
+
+_memory = OrderedDict()
+_memory_bytes = 0
+_stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+
+# On-disk sprites of this process: file name -> (size, mtime), read on first use
+_disk = None
+
+_helper_digests = {}
+_font_digests = {}
+
+# Ops that blend with the pixels under them; every other op paints opaquely
+_BLENDED = frozenset((OP_TEXT, OP_SHADOW))
+
+
+def _helper_digest(helper):
+    digest = _helper_digests.get(helper)
+    if digest is None:
+        digest = _helper_digests[helper] = fingerprint(helper)
+    return digest
+
+
+def sprite(helper):
+    """Decorator caching the raster of a draw_*(draw, x, y, ...) helper"""
+    @functools.wraps(helper)
+    def draw_sprite(draw, x, y, *args, **kwargs):
+        group = getattr(draw, 'sprite', None)
+        if group is None:
+            # drawing straight into a Pillow image
+            return helper(draw, x, y, *args, **kwargs)
+        key = repr((_helper_digest(helper), x % 1, y % 1, args, sorted(kwargs.items())))
+        with group(hashlib.sha256(key.encode('utf-8')).hexdigest(), (x, y)):
+            return helper(draw, x, y, *args, **kwargs)
+    return draw_sprite
+
+
+def _font_file(font):
+    """Path of a font's file, or '' for fonts loaded from memory"""
+    path = getattr(font, 'path', None)
+    # Pillow's default font is read from bytes and its path is a BytesIO
+    return path if isinstance(path, str) else ''
+
+
+def _fonts(canvas, start, stop):
+    """Fingerprint of the fonts the text ops of a group use"""
+    paths = sorted({_font_file(attrs[2])
+                    for opcode, _, attrs in canvas.ops(start, stop) if opcode == OP_TEXT})
+    key = tuple(paths)
+    if key not in _font_digests:
+        digest = font_fingerprint([p for p in paths if p])
+        if '' in paths:
+            import PIL
+
+            # the built-in font only changes with Pillow
+            digest += f";builtin:{PIL.__version__}"
+        _font_digests[key] = digest
+    return _font_digests[key]
+
+
+def _bounds(canvas, start, stop, img):
+    """Integer box the ops of a group can paint, clipped to img"""
+    from wireframe_kit.tiles import op_bounds
+
+    boxes = [op_bounds(opcode, points, attrs) for opcode, points, attrs in canvas.ops(start, stop)]
+    x1 = max(math.floor(min(b[0] for b in boxes)), 0)
+    y1 = max(math.floor(min(b[1] for b in boxes)), 0)
+    x2 = min(math.ceil(max(b[2] for b in boxes)) + 1, img.width)
+    y2 = min(math.ceil(max(b[3] for b in boxes)) + 1, img.height)
+    return x1, y1, x2, y2
+
+
+def _opaque(color):
+    return None if color is None else 255
+
+
+def _coverage(canvas, start, stop, box):
+    """'L' mask of the pixels of box that the opaque ops of a group paint"""
+    from PIL import Image, ImageDraw
+
+    mask = Image.new('L', (box[2] - box[0], box[3] - box[1]), 0)
+    draw = ImageDraw.Draw(mask)
+    for opcode, points, attrs in canvas.ops(start, stop):
+        if opcode in _BLENDED:
+            continue
+        points = [(x - box[0], y - box[1]) for x, y in points]
+        if opcode == OP_LAYER:
+            x, y = (int(v) for v in points[0])
+            mask.paste(255, (x, y, x + attrs[0].width, y + attrs[0].height))
+            continue
+        if opcode in (OP_LINE, OP_ARC):
+            attrs = (_opaque(attrs[0]),) + attrs[1:]
+        else:
+            attrs = (_opaque(attrs[0]), _opaque(attrs[1])) + attrs[2:]
+        _PAINTERS[opcode](mask, draw, points, attrs)
+    return mask
+
+
+def _showing(canvas, start, stop, box, cached):
+    """Indices of the blended ops of a group that reach pixels outside the sprite's mask"""
+    from wireframe_kit.tiles import op_bounds
+
+    showing = []
+    mask = None
+    for index in range(start, stop):
+        opcode = canvas.opcodes[index]
+        if opcode not in _BLENDED:
+            continue
+        if mask is None:
+            mask = cached.getchannel('A')
+        x1, y1, x2, y2 = op_bounds(opcode, canvas.points(index), canvas.attributes(index))
+        part = (max(math.floor(x1) - box[0], 0), max(math.floor(y1) - box[1], 0),
+                min(math.ceil(x2) + 1 - box[0], mask.width), min(math.ceil(y2) + 1 - box[1], mask.height))
+        if part[0] < part[2] and part[1] < part[3] and mask.crop(part).getextrema()[0] < 255:
+            showing.append(index)
+    return showing
+
+
+def _disk_index():
+    global _disk
+    if _disk is None:
+        _disk = {}
+        try:
+            entries = list(os.scandir(SPRITE_DIR))
+        except OSError:
+            entries = []
+        for entry in entries:
+            # .rgb files hold sprites keyed on the pixels under them; they
+            # are never hit again and go once the directory is full
+            if entry.name.endswith(('.rgb', '.rgba')):
+                st = entry.stat()
+                _disk[entry.name] = (st.st_size, st.st_mtime)
+    return _disk
+
+
+def _file_name(key, size):
+    return f"{key}-{size[0]}x{size[1]}.rgba"
+
+
+def _load(key, size):
+    """Sprite from memory, then from disk, or None"""
+    img = _memory.get(key)
+    if img is not None:
+        _memory.move_to_end(key)
+        _stats['hits'] += 1
+        return img
+    name = _file_name(key, size)
+    if name not in _disk_index():
+        return None
+    from PIL import Image
+
+    path = os.path.join(SPRITE_DIR, name)
+    try:
+        with open(path, 'rb') as f:
+            img = Image.frombytes('RGBA', size, f.read())
+        os.utime(path)
+    except (OSError, ValueError):
+        # evicted by another process, or truncated
+        _disk.pop(name, None)
+        return None
+    _disk[name] = (_disk[name][0], os.stat(path).st_mtime)
+    _stats['disk_hits'] += 1
+    _remember(key, img)
+    return img
+
+
+def _remember(key, img):
+    global _memory_bytes
+    _memory[key] = img
+    _memory_bytes += len(img.mode) * img.width * img.height
+    while _memory_bytes > MAX_MEMORY_BYTES and len(_memory) > 1:
+        _, old = _memory.popitem(last=False)
+        _memory_bytes -= len(old.mode) * old.width * old.height
+
+
+def _store(key, img):
+    """Keep an RGBA sprite in memory and write it to disk, evicting the oldest files"""
+    _remember(key, img)
+    name = _file_name(key, img.size)
+    path = os.path.join(SPRITE_DIR, name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(SPRITE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(img.tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    disk = _disk_index()
+    disk[name] = (os.stat(path).st_size, os.stat(path).st_mtime)
+    total = sum(size for size, _ in disk.values())
+    if total <= MAX_BYTES:
+        return
+    for old in sorted(disk, key=lambda n: disk[n][1]):
+        if total <= MAX_BYTES * 3 // 4:
+            break
+        try:
+            os.remove(os.path.join(SPRITE_DIR, old))
+        except OSError:
+            pass
+        total -= disk.pop(old)[0]
+        _stats['evictions'] += 1
+
+
+def replay(canvas, img, draw, start=0, stop=None, inside=None):
+    """Paint ops [start, stop) of canvas, pasting cached sprites for marked groups
+
+    inside is the start of the group being replayed after a miss, so its
+    own mark is not looked up again. Only RGB images use the cache.
+    """
+    stop = len(canvas) if stop is None else stop
+    index = start
+    while index < stop:
+        group = canvas.sprites.get(index)
+        if group is None or index == inside or img.mode != 'RGB':
+            opcode, points, attrs = canvas.op(index)
+            _PAINTERS[opcode](img, draw, points, attrs)
+            index += 1
+            continue
+        end, key, (x, y) = group
+        box = _bounds(canvas, index, end, img)
+        if box[0] >= box[2] or box[1] >= box[3]:
+            index = end
+            continue
+        offset = (box[0] - math.floor(x), box[1] - math.floor(y), box[2] - box[0], box[3] - box[1])
+        full_key = hashlib.sha256(
+            f"{key}{offset}{_fonts(canvas, index, end)}".encode('utf-8')).hexdigest()
+        cached = _load(full_key, offset[2:])
+        if cached is not None:
+            for shown in _showing(canvas, index, end, box, cached):
+                opcode, points, attrs = canvas.op(shown)
+                _PAINTERS[opcode](img, draw, points, attrs)
+            img.paste(cached, box[:2], cached)
+        else:
+            _stats['misses'] += 1
+            replay(canvas, img, draw, index, end, inside=index)
+            cached = img.crop(box)
+            cached.putalpha(_coverage(canvas, index, end, box))
+            _store(full_key, cached)
+        index = end
+    return img
+
+
+def sprite_cache_info():
+    """Return sprite cache statistics as a dict"""
+    return dict(_stats, size=len(_memory), files=len(_disk or ()))
+
+
+def print_sprite_cache_info():
+    """Print a summary of sprite cache usage"""
+    info = sprite_cache_info()
+    print(f"Sprite cache: {info['hits']} hits, {info['disk_hits']} from disk, "
+          f"{info['misses']} misses")
@@ -0,0 +1,171 @@
+"""
+SVG backend for display lists
+
+Emits the same scene a DisplayList rasterizes as vector markup. Coordinates
+follow Pillow's pixel model: a filled shape with inclusive corners (x0, y0)
+and (x1, y1) covers [x0, x1 + 1), strokes are kept inside the shape bounds,
+and lines and polygon vertices sit on pixel centres. Text is positioned on
+its baseline using the font's ascent so it lines up with the raster output.
+"""
+
+import base64
+import io
+import math
+from xml.sax.saxutils import escape, quoteattr
+
+from wireframe_kit.display_list import (
+    DisplayList, OP_ARC, OP_ELLIPSE, OP_LAYER, OP_LINE, OP_PIESLICE, OP_POLYGON,
+    OP_RECT, OP_ROUNDED_RECT, OP_SHADOW, OP_TEXT,
+)
+
+
+def _num(value):
+    """Format a coordinate compactly"""
+    if isinstance(value, float):
+        return f"{value:.2f}".rstrip('0').rstrip('.')
+    return str(value)
+
+
+def _paint(color, prop):
+    """Return fill/stroke attributes for a '#RRGGBB' or '#RRGGBBAA' color"""
+    if color is None:
+        return f'{prop}="none"'
+    if isinstance(color, tuple):
+        color = '#' + ''.join(f"{c:02X}" for c in color)
+    if isinstance(color, str) and color.startswith('#') and len(color) == 9:
+        alpha = int(color[7:9], 16) / 255
+        return f'{prop}="{color[:7]}" {prop}-opacity="{_num(round(alpha, 3))}"'
+    return f'{prop}={quoteattr(color)}'
+
+
+def _shape_box(points, outline, width):
+    """Return (x, y, w, h) of a shape, inset by half the stroke when outlined"""
+    (x0, y0), (x1, y1) = points
+    inset = width / 2 if outline else 0
+    return (x0 + inset, y0 + inset, x1 - x0 + 1 - 2 * inset, y1 - y0 + 1 - 2 * inset)
+
+
+def _stroke(outline, width):
+    if not outline or not width:
+        return ''
+    return f' {_paint(outline, "stroke")} stroke-width="{_num(width)}"'
+
+
+def _arc_path(points, start, end, pie):
+    """SVG path for a Pillow arc or pieslice (degrees, clockwise from 3 o'clock)"""
+    (x0, y0), (x1, y1) = points
+    cx, cy = (x0 + x1 + 1) / 2, (y0 + y1 + 1) / 2
+    rx, ry = (x1 - x0 + 1) / 2, (y1 - y0 + 1) / 2
+    sx = cx + rx * math.cos(math.radians(start))
+    sy = cy + ry * math.sin(math.radians(start))
+    ex = cx + rx * math.cos(math.radians(end))
+    ey = cy + ry * math.sin(math.radians(end))
+    large = 1 if (end - start) % 360 > 180 else 0
+    arc = f"A{_num(rx)},{_num(ry)} 0 {large} 1 {_num(ex)},{_num(ey)}"
+    if pie:
+        return f"M{_num(cx)},{_num(cy)} L{_num(sx)},{_num(sy)} {arc} Z"
+    return f"M{_num(sx)},{_num(sy)} {arc}"
+
+
+def _font_attrs(font):
+    """font-family, font-size and font-weight for a Pillow font"""
+    try:
+        family, style = font.getname()
+        size = font.size
+    except AttributeError:
+        family, style, size = 'sans-serif', 'Regular', 11
+    weight = ' font-weight="bold"' if style and 'Bold' in style else ''
+    return f'font-family={quoteattr(family + ", Helvetica, Arial, sans-serif")} font-size="{_num(size)}"{weight}'
+
+
+def _ascent(font):
+    try:
+        return font.getmetrics()[0]
+    except AttributeError:
+        return 11
+
+
+def _image_href(img):
+    buf = io.BytesIO()
+    img.save(buf, 'PNG')
+    return 'data:image/png;base64,' + base64.b64encode(buf.getvalue()).decode('ascii')
+
+
+def _emit_ops(canvas, out, blurs):
+    """Append SVG elements for every op in canvas to out, noting shadow blurs used"""
+    for opcode, points, attrs in canvas:
+        if opcode in (OP_RECT, OP_ROUNDED_RECT, OP_ELLIPSE):
+            fill, outline, width = attrs[:3]
+            x, y, w, h = _shape_box(points, outline, width)
+            paint = _paint(fill, 'fill') + _stroke(outline, width)
+            if opcode == OP_ELLIPSE:
+                out.append(f'<ellipse cx="{_num(x + w / 2)}" cy="{_num(y + h / 2)}" '
+                           f'rx="{_num(w / 2)}" ry="{_num(h / 2)}" {paint}/>')
+            else:
+                radius = f' rx="{_num(attrs[3])}"' if opcode == OP_ROUNDED_RECT else ''
+                out.append(f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(w)}" '
+                           f'height="{_num(h)}"{radius} {paint}/>')
+        elif opcode in (OP_POLYGON, OP_LINE):
+            pts = ' '.join(f"{_num(px + 0.5)},{_num(py + 0.5)}" for px, py in points)
+            if opcode == OP_POLYGON:
+                fill, outline, width = attrs
+                out.append(f'<polygon points="{pts}" {_paint(fill, "fill")}{_stroke(outline, width)}/>')
+            else:
+                fill, width = attrs
+                out.append(f'<polyline points="{pts}" fill="none"{_stroke(fill, width)}/>')
+        elif opcode == OP_TEXT:
+            text, fill, font = attrs
+            x, y = points[0]
+            out.append(f'<text x="{_num(x)}" y="{_num(y + _ascent(font))}" {_font_attrs(font)} '
+                       f'{_paint(fill, "fill")} xml:space="preserve">{escape(text)}</text>')
+        elif opcode in (OP_PIESLICE, OP_ARC):
+            if opcode == OP_PIESLICE:
+                fill, outline, width, start, end = attrs
+                paint = _paint(fill, 'fill') + _stroke(outline, width)
+            else:
+                fill, width, start, end = attrs
+                paint = 'fill="none"' + _stroke(fill, width)
+            out.append(f'<path d="{_arc_path(points, start, end, opcode == OP_PIESLICE)}" {paint}/>')
+        elif opcode == OP_LAYER:
+            layer = attrs[0]
+            x, y = points[0]
+            if isinstance(layer, DisplayList):
+                out.append(f'<svg x="{_num(x)}" y="{_num(y)}" width="{layer.width}" height="{layer.height}">')
+                out.append(f'<rect width="100%" height="100%" {_paint(layer.background, "fill")}/>')
+                _emit_ops(layer, out, blurs)
+                out.append('</svg>')
+            else:
+                out.append(f'<image x="{_num(x)}" y="{_num(y)}" width="{layer.width}" '
+                           f'height="{layer.height}" href="{_image_href(layer)}"/>')
+        elif opcode == OP_SHADOW:
+            radius, blur, color = attrs
+            (x0, y0), (x1, y1) = points
+            blurs.add(blur)
+            out.append(f'<rect x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" '
+                       f'height="{_num(y1 - y0)}" rx="{_num(radius)}" {_paint(color, "fill")} '
+                       f'filter="url(#shadow-{blur})"/>')
+
+
+def to_svg(canvas):
+    """Render a DisplayList (or, as a fallback, embed a Pillow image) as SVG text"""
+    width, height = canvas.size
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'viewBox="0 0 {width} {height}">']
+    if isinstance(canvas, DisplayList):
+        out.append(f'<rect width="100%" height="100%" {_paint(canvas.background, "fill")}/>')
+        blurs = set()
+        _emit_ops(canvas, out, blurs)
+        if blurs:
+            filters = ''.join(f'<filter id="shadow-{blur}" x="-50%" y="-50%" width="200%" height="200%">'
+                              f'<feGaussianBlur stdDeviation="{_num(blur)}"/></filter>'
+                              for blur in sorted(blurs))
+            out.insert(1, f'<defs>{filters}</defs>')
+    else:
+        out.append(f'<image width="{width}" height="{height}" href="{_image_href(canvas)}"/>')
+    out.append('</svg>')
+    return '\n'.join(out) + '\n'
+
+
+def encode_svg(canvas):
+    """Encode a generator result as UTF-8 SVG bytes"""
+    return to_svg(canvas).encode('utf-8')
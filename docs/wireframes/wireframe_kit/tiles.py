@@ -0,0 +1,400 @@
+"""
+Tiled rasterization and streaming PNG output for very large canvases
+
+A DisplayList is rasterized in full-width bands of BAND_HEIGHT rows instead
+of one canvas-sized image. Every op gets a conservative bounding box once,
+and ops are bucketed by the rows they touch, so each band only replays the
+ops that can reach it, shifted into band coordinates. Nested layers are
+rendered the same way, clipped to the band. Finished bands are filtered,
+deflated and written as IDAT chunks straight away. Peak memory is one band
+plus the compressor window, whatever the canvas height. It grows only with
+the width. A palette PNG needs every colour counted before the palette is
+chosen, so its bands are rendered once, counted and spilled, quickly
+deflated, to a temporary file, then read back to be indexed and encoded.
+"""
+
+import io
+import math
+import struct
+import tempfile
+import zlib
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+from PIL import Image, ImageColor, ImageDraw
+
+from wireframe_kit.display_list import (
+    DisplayList, OP_ARC, OP_ELLIPSE, OP_LAYER, OP_LINE, OP_PIESLICE, OP_POLYGON, OP_RECT,
+    OP_ROUNDED_RECT, OP_SHADOW, OP_TEXT, _PAINTERS, _flatten,
+)
+from wireframe_kit.fonts import load_font, text_bbox
+from wireframe_kit.png import band_palette
+from wireframe_kit.shadows import margin, parse_color, shadow_mask
+
+BAND_HEIGHT = 256
+# Canvases with more pixels than this are encoded tile by tile
+TILED_PIXELS = 16_000_000
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+IDAT_SIZE = 1 << 16
+
+
+def op_bounds(opcode, points, attrs):
+    """Conservative (x1, y1, x2, y2) that an op can paint"""
+    if opcode == OP_TEXT:
+        x1, y1, x2, y2 = text_bbox(attrs[0], attrs[2], points[0])
+        return x1 - 1, y1 - 1, x2 + 1, y2 + 1
+    if opcode == OP_LAYER:
+        x, y = points[0]
+        return x, y, x + attrs[0].width, y + attrs[0].height
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    if opcode == OP_SHADOW:
+        pad = margin(attrs[1]) + 1
+    elif opcode == OP_LINE:
+        pad = attrs[1] + 1
+    else:
+        pad = 1
+    return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+
+class TileIndex:
+    """Ops of one DisplayList bucketed by the bands of rows they touch"""
+
+    def __init__(self, canvas, band=BAND_HEIGHT):
+        self.canvas = canvas
+        self.band = band
+        self.bounds = []
+        self.buckets = defaultdict(list)
+        for index, (opcode, points, attrs) in enumerate(canvas):
+            bounds = op_bounds(opcode, points, attrs)
+            self.bounds.append(bounds)
+            for bucket in range(max(int(bounds[1] // band), 0), int(bounds[3] // band) + 1):
+                self.buckets[bucket].append(index)
+
+    def ops_between(self, top, bottom, left=None, right=None):
+        """Indices, in paint order, of the ops that may touch rows [top, bottom)
+
+        left and right optionally narrow the search to columns [left, right).
+        """
+        found = set()
+        for bucket in range(max(top // self.band, 0), (bottom - 1) // self.band + 1):
+            found.update(self.buckets.get(bucket, ()))
+        if left is not None:
+            found = {i for i in found if self.bounds[i][0] < right and self.bounds[i][2] >= left}
+        return sorted(found)
+
+
+# Ops whose first two points are the inclusive corners of a bounding box
+_BOX_OPS = frozenset((OP_RECT, OP_ROUNDED_RECT, OP_ELLIPSE, OP_PIESLICE, OP_ARC, OP_SHADOW))
+
+
+def scale_op(opcode, points, attrs, scale):
+    """Points and attrs of an op drawn at scale times the resolution
+
+    Box corners map to the outer edges of the scaled pixel blocks, and path
+    points to their centres, so axis-aligned shapes cover exactly the same
+    pixels after a scale-times reduction.
+    """
+    if opcode in _BOX_OPS:
+        (x1, y1), (x2, y2) = points[:2]
+        points = [(x1 * scale, y1 * scale), (x2 * scale + scale - 1, y2 * scale + scale - 1)]
+    elif opcode in (OP_LINE, OP_POLYGON):
+        centre = (scale - 1) / 2
+        points = [(x * scale + centre, y * scale + centre) for x, y in points]
+    else:
+        points = [(x * scale, y * scale) for x, y in points]
+
+    if opcode == OP_TEXT:
+        text, fill, font = attrs
+        attrs = (text, fill, scaled_font(font, scale))
+    elif opcode == OP_SHADOW:
+        radius, blur, color = attrs
+        attrs = (radius * scale, blur * scale, color)
+    elif opcode == OP_ROUNDED_RECT:
+        fill, outline, width, radius = attrs
+        attrs = (fill, outline, width * scale, radius * scale)
+    elif opcode == OP_LINE:
+        attrs = (attrs[0], attrs[1] * scale)
+    elif opcode in (OP_RECT, OP_ELLIPSE, OP_POLYGON, OP_PIESLICE):
+        attrs = attrs[:2] + (attrs[2] * scale,) + attrs[3:]
+    elif opcode == OP_ARC:
+        attrs = (attrs[0], attrs[1] * scale) + attrs[2:]
+    return points, attrs
+
+
+@lru_cache(maxsize=1024)
+def _text_mask(text, font, fx, fy, scale):
+    """(mask, dx, dy) for text hinted at 1x and blown up scale times
+
+    fx, fy are the fractional part of the text origin, which changes the
+    glyph raster; dx, dy place the mask relative to the integer origin.
+    """
+    x1, y1, x2, y2 = text_bbox(text, font, (fx, fy))
+    dx, dy = math.floor(x1), math.floor(y1)
+    mask = Image.new('L', (max(math.ceil(x2) - dx, 1), max(math.ceil(y2) - dy, 1)), 0)
+    ImageDraw.Draw(mask).text((fx - dx, fy - dy), text, fill=255, font=font)
+    return mask.resize((mask.width * scale, mask.height * scale), Image.NEAREST), dx, dy
+
+
+def _paint_text_scaled(img, xy, attrs, scale, left, top):
+    """Paint text into a scale-times image from its 1x glyph mask
+
+    Repeating each mask pixel into a scale x scale block means reducing the
+    image gives back exactly the 1x text instead of a re-hinted version.
+    """
+    text, fill, font = attrs
+    x, y = xy
+    ix, iy = math.floor(x), math.floor(y)
+    mask, dx, dy = _text_mask(text, font, x - ix, y - iy, scale)
+    ox, oy = (ix + dx) * scale - left, (iy + dy) * scale - top
+    img.paste(ImageColor.getrgb(fill) if isinstance(fill, str) else fill,
+              (ox, oy, ox + mask.width, oy + mask.height), mask)
+
+
+def scaled_font(font, scale):
+    """The same face at scale times the size"""
+    path = getattr(font, 'path', None)
+    if path is None:
+        return font
+    return load_font(path, font.size * scale, index=font.index)
+
+
+def axis_aligned(points):
+    """True if every segment of a polyline is horizontal or vertical"""
+    return all(a[0] == b[0] or a[1] == b[1] for a, b in zip(points, points[1:]))
+
+
+def _paint_line_scaled(img, points, attrs, bounds, scale, left, top):
+    """Paint an axis-aligned line into a scale-times image from a 1x mask
+
+    Such lines do not alias, and Pillow's rounding of wide or bent lines
+    differs between scales, so the 1x pixels are drawn and blown up.
+    """
+    fill, width = attrs
+    x1 = max(int(bounds[0]), left // scale)
+    y1 = max(int(bounds[1]), top // scale)
+    x2 = min(int(bounds[2]) + 1, -(-(left + img.width) // scale))
+    y2 = min(int(bounds[3]) + 1, -(-(top + img.height) // scale))
+    if x1 >= x2 or y1 >= y2:
+        return
+    mask = Image.new('L', (x2 - x1, y2 - y1), 0)
+    ImageDraw.Draw(mask).line([(x - x1, y - y1) for x, y in points], fill=255, width=width)
+    mask = mask.resize((mask.width * scale, mask.height * scale), Image.NEAREST)
+    x, y = x1 * scale - left, y1 * scale - top
+    img.paste(ImageColor.getrgb(fill) if isinstance(fill, str) else fill,
+              (x, y, x + mask.width, y + mask.height), mask)
+
+
+def _paint_shadow_scaled(img, points, attrs, scale, left, top):
+    """Paint a shadow into a scale-times image from its 1x blurred mask
+
+    Blurs are smooth already, so only the part of the cached 1x mask that
+    falls inside img is cropped and blown up.
+    """
+    radius, blur, color = attrs
+    x1, y1, x2, y2 = (int(round(c)) for c in _flatten(points))
+    rgb, alpha = parse_color(color)
+    mask = shadow_mask(x2 - x1, y2 - y1, radius, blur, alpha)
+    pad = margin(blur)
+    ox, oy = x1 - pad, y1 - pad
+    crop = (max(left // scale - ox, 0), max(top // scale - oy, 0),
+            min(-(-(left + img.width) // scale) - ox, mask.width),
+            min(-(-(top + img.height) // scale) - oy, mask.height))
+    if crop[0] >= crop[2] or crop[1] >= crop[3]:
+        return
+    mask = mask.crop(crop)
+    mask = mask.resize((mask.width * scale, mask.height * scale), Image.NEAREST)
+    x, y = (ox + crop[0]) * scale - left, (oy + crop[1]) * scale - top
+    img.paste(rgb, (x, y, x + mask.width, y + mask.height), mask)
+
+
+def render_region(canvas, img, left, top, indexes=None, scale=1, hidpi=False):
+    """Paint the part of canvas covered by img, whose origin is canvas (left, top)
+
+    With scale > 1 the canvas is drawn scale times larger and left, top are
+    in scaled pixels. Text and shadows then come from their 1x masks, ready
+    to be reduced again, unless hidpi is set, which draws them natively at
+    the scale for a high-density image. indexes maps id(DisplayList) to its TileIndex so
+    repeated calls for the bands of one canvas (and its layers) bucket each
+    list only once.
+    """
+    if indexes is None:
+        indexes = {}
+    index = indexes.get(id(canvas))
+    if index is None:
+        index = indexes[id(canvas)] = TileIndex(canvas)
+
+    draw = ImageDraw.Draw(img)
+    ops = index.ops_between(top // scale, -(-(top + img.height) // scale),
+                            left // scale, -(-(left + img.width) // scale))
+    for i in ops:
+        opcode = canvas.opcodes[i]
+        points = canvas.points(i)
+        attrs = canvas.attributes(i)
+        if scale != 1:
+            if opcode == OP_TEXT and not hidpi:
+                _paint_text_scaled(img, points[0], attrs, scale, left, top)
+                continue
+            if opcode == OP_SHADOW and not hidpi:
+                _paint_shadow_scaled(img, points, attrs, scale, left, top)
+                continue
+            if opcode == OP_LINE and axis_aligned(points):
+                _paint_line_scaled(img, points, attrs, index.bounds[i], scale, left, top)
+                continue
+            points, attrs = scale_op(opcode, points, attrs, scale)
+        points = [(x - left, y - top) for x, y in points]
+        if opcode == OP_LAYER:
+            _render_layer(attrs[0], img, points[0], indexes, scale, hidpi)
+        elif opcode == OP_SHADOW:
+            _PAINTERS[opcode](img, draw, _flatten(points), attrs)
+        else:
+            _PAINTERS[opcode](img, draw, points, attrs)
+
+
+def _render_layer(layer, img, xy, indexes, scale=1, hidpi=False):
+    """Paint the rows of a nested DisplayList or Image that fall inside img"""
+    x, y = xy
+    if not isinstance(layer, DisplayList):
+        if scale != 1:
+            layer = layer.resize((layer.width * scale, layer.height * scale), Image.NEAREST)
+        img.paste(layer, (x, y))
+        return
+    first = max(0, -y)
+    last = min(layer.height * scale, img.height - y)
+    if last <= first:
+        return
+    part = Image.new(layer.mode, (layer.width * scale, last - first), layer.background)
+    render_region(layer, part, 0, first, indexes, scale, hidpi)
+    img.paste(part, (x, y + first))
+
+
+def _chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def iter_bands(canvas, band=BAND_HEIGHT, scale=1, hidpi=False, indexes=None):
+    """Yield (top, image) for each full-width band of the canvas
+
+    With scale > 1 each band is rendered supersampled and reduced, or kept at
+    the scale when hidpi is set. top is in canvas rows either way. indexes
+    is a TileIndex cache as for render_region().
+    """
+    if indexes is None:
+        indexes = {}
+    for top in range(0, canvas.height, band):
+        rows = min(band, canvas.height - top)
+        img = Image.new(canvas.mode, (canvas.width * scale, rows * scale), canvas.background)
+        render_region(canvas, img, 0, top * scale, indexes, scale, hidpi)
+        yield top, img.reduce(scale) if scale != 1 and not hidpi else img
+
+
+def _spill(bands, spill, palette, colors):
+    """Count the colours of the RGB bands while storing them in the file spill
+
+    Returns the {(r, g, b): pixels} histogram, cut short once 'exact' cannot
+    fit colors, and an iterator reading the bands back.
+    """
+    histogram = Counter()
+    stored = []
+    counting = True
+    for img in bands:
+        if counting:
+            for count, color in img.getcolors(img.width * img.height):
+                histogram[color] += count
+            counting = palette != 'exact' or len(histogram) <= colors
+        data = zlib.compress(img.tobytes(), 1)
+        spill.write(data)
+        stored.append((img.size, len(data)))
+
+    def read_back():
+        spill.seek(0)
+        for size, length in stored:
+            yield Image.frombytes('RGB', size, zlib.decompress(spill.read(length)))
+    return histogram, read_back()
+
+
+def _indexed(img, lookup, index=None):
+    """A band as indices into the lookup palette, exactly when index maps every colour to one
+
+    Pillow maps to a given palette through a reduced-precision cache, so
+    close colours can swap. An exact palette instead goes through a median
+    cut of the band, lossless while it has no more colours than the
+    palette, whose entries are then renumbered.
+    """
+    if index is None:
+        return img.quantize(palette=lookup, dither=Image.Dither.NONE)
+    img = img.quantize(256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    entries = img.getpalette()
+    renumber = [index.get(tuple(entries[i:i + 3]), 0) for i in range(0, len(entries), 3)]
+    return img.point(renumber + [0] * (256 - len(renumber)))
+
+
+def _write_png(fp, width, height, bands, compress_level, lookup=None, index=None):
+    """Write RGB band images as one RGB PNG, or indexed into the lookup palette"""
+    fp.write(PNG_SIGNATURE)
+    if lookup is None:
+        fp.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        stride = width * 3
+    else:
+        fp.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)))
+        fp.write(_chunk(b'PLTE', bytes(lookup.getpalette())))
+        stride = width
+
+    compressor = zlib.compressobj(compress_level)
+    pending = []
+    pending_size = 0
+    for img in bands:
+        if lookup is not None:
+            img = _indexed(img, lookup, index)
+        raw = img.tobytes()
+        # filter type 0 (None) per scanline
+        rows = b''.join(b'\x00' + raw[i:i + stride] for i in range(0, len(raw), stride))
+        data = compressor.compress(rows)
+        if data:
+            pending.append(data)
+            pending_size += len(data)
+        if pending_size >= IDAT_SIZE:
+            fp.write(_chunk(b'IDAT', b''.join(pending)))
+            pending, pending_size = [], 0
+    pending.append(compressor.flush())
+    fp.write(_chunk(b'IDAT', b''.join(pending)))
+    fp.write(_chunk(b'IEND', b''))
+
+
+def write_png_tiled(canvas, fp, band=BAND_HEIGHT, compress_level=6, scale=1, hidpi=False,
+                    palette='off', colors=256, indexes=None):
+    """Stream canvas to the binary file object fp as an RGB or palette PNG
+
+    palette and colors pick the palette as wireframe_kit.png does for whole
+    images. Any mode but 'off' spills the bands to a temporary file while
+    counting their colours. indexes is a TileIndex cache as for
+    render_region().
+    """
+    out = scale if hidpi else 1
+    width, height = canvas.width * out, canvas.height * out
+    bands = (img.convert('RGB') for _, img in iter_bands(canvas, band, scale, hidpi, indexes))
+    if palette == 'off':
+        _write_png(fp, width, height, bands, compress_level)
+        return
+    with tempfile.TemporaryFile() as spill:
+        histogram, bands = _spill(bands, spill, palette, colors)
+        lookup = band_palette(histogram, palette, colors)
+        index = None
+        if lookup is not None and len(histogram) <= colors:
+            entries = lookup.getpalette()
+            index = {tuple(entries[i:i + 3]): i // 3 for i in range(0, len(entries), 3)}
+        _write_png(fp, width, height, bands, compress_level, lookup, index)
+
+
+def encode_png_tiled(canvas, band=BAND_HEIGHT, compress_level=6, scale=1, hidpi=False,
+                     palette='off', colors=256, indexes=None):
+    """Encode canvas as PNG bytes without allocating the full raster"""
+    buf = io.BytesIO()
+    write_png_tiled(canvas, buf, band, compress_level, scale, hidpi, palette, colors, indexes)
+    return buf.getvalue()
+
+
+def needs_tiling(canvas, scale=1):
+    """True for display lists too large to rasterize in one piece at scale"""
+    return isinstance(canvas, DisplayList) and canvas.width * canvas.height * scale * scale > TILED_PIXELS
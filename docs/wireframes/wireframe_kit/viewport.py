@@ -0,0 +1,54 @@
+"""
+Virtualized lists for tables and other scrolling widgets
+
+A widget that scrolls shows a window onto its rows: the ones that fit its
+viewport, starting at some first row. window() takes those from any
+iterable with itertools.islice, so a generator streaming thousands of rows
+is only consumed up to the end of the viewport and drawing costs the same
+whatever the size of the dataset. The total row count, which the scrollbar
+and the "Showing 1-20 of 156" footer need, is taken from len() when the
+rows have one (a list is sliced rather than iterated), else from the
+caller, and only as a last resort by counting the rest of the iterator,
+which never draws anything.
+"""
+
+from collections import namedtuple
+from collections.abc import Sequence, Sized
+from itertools import islice
+
+# first is the index of rows[0] within all total rows
+Window = namedtuple('Window', 'first rows total')
+
+MIN_THUMB = 24
+
+
+def window(rows, first=0, capacity=None, total=None):
+    """The rows [first, first + capacity) of an iterable, with the total count"""
+    if isinstance(rows, Sequence):
+        first = min(max(first, 0), len(rows))
+        stop = len(rows) if capacity is None else first + capacity
+        return Window(first, list(rows[first:stop]), len(rows) if total is None else total)
+    if total is None and isinstance(rows, Sized):
+        total = len(rows)
+    iterator = iter(rows)
+    skipped = sum(1 for _ in islice(iterator, max(first, 0)))
+    visible = list(iterator if capacity is None else islice(iterator, capacity))
+    if total is None:
+        total = skipped + len(visible) + sum(1 for _ in iterator)
+    return Window(skipped, visible, total)
+
+
+def scrollbar(top, height, first, visible, total, min_thumb=MIN_THUMB):
+    """(y, height) of the thumb of a scrollbar track, or None when every row is visible"""
+    if total <= visible or height <= 0:
+        return None
+    thumb = min(max(height * visible // total, min_thumb), height)
+    travel = height - thumb
+    return top + travel * min(first, total - visible) // (total - visible), thumb
+
+
+def range_label(view, noun):
+    """'Showing 1-20 of 156 clients' for a window, or 'No clients'"""
+    if not view.rows:
+        return f"No {noun}"
+    return f"Showing {view.first + 1:,}-{view.first + len(view.rows):,} of {view.total:,} {noun}"
@@ -0,0 +1,149 @@
+"""
+Watch mode for the generator scripts
+
+After the first build the script stays running and polls the modification
+times of its own source, the data files its generators declare through
+inputs() and any extra directories (e.g. the screen specs). On a change
+the script is executed again into a fresh namespace, which takes a few
+milliseconds because Pillow and wireframe_kit stay imported, and the
+new generators go through the build manifest: only those whose
+fingerprint changed (their own source, a helper they reach, a constant
+they read or one of their inputs) are rendered, serially in this process
+so the font registry, text metrics and shadow caches stay warm.
+
+Module-level caches of the script itself (the professional script's
+chrome tiles) are carried over to the new namespace as long as the
+function that fills them fingerprints the same. A change to wireframe_kit
+itself restarts the process, since modules that import each other cannot
+be swapped safely in place.
+"""
+
+import os
+import sys
+import time
+import types
+
+from wireframe_kit.build import Quality, build_outputs, describe
+from wireframe_kit.manifest import KIT_DIR, fingerprint
+
+POLL_INTERVAL = 0.25
+
+
+def _snapshot(paths, dirs):
+    """Modification times of paths and of the files directly inside dirs"""
+    stamps = {}
+    for directory in dirs:
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            names = []
+        stamps[directory] = tuple(sorted(names))
+        paths = list(paths) + [os.path.join(directory, n) for n in names]
+    for path in paths:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def _kit_sources():
+    return [os.path.join(KIT_DIR, n) for n in sorted(os.listdir(KIT_DIR)) if n.endswith('.py')]
+
+
+def _input_paths(entries):
+    paths = []
+    for _, generator in entries:
+        inputs = getattr(generator, 'inputs', None)
+        if inputs:
+            paths.extend(inputs())
+    return paths
+
+
+def load_script(path, name='__watch__'):
+    """Execute a generator script as a new module without running main()
+
+    The module is registered under name so inspect finds the source of the
+    classes it defines.
+    """
+    with open(path, encoding='utf-8') as f:
+        code = compile(f.read(), path, 'exec')
+    module = types.ModuleType(name)
+    module.__file__ = path
+    previous = sys.modules.get(name)
+    sys.modules[name] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        if previous is not None:
+            sys.modules[name] = previous
+        else:
+            del sys.modules[name]
+        raise
+    return module.__dict__
+
+
+def _fingerprints(namespace, keep):
+    return {cache: fingerprint(namespace[filler]) for cache, filler in keep.items()
+            if filler in namespace}
+
+
+def watch(script, output_dir, font_paths=(), formats=('png',), quality=Quality(), dirs=(), keep=None,
+          entries_name='GENERATORS', interval=POLL_INTERVAL):
+    """Re-render the generators of script whenever what they depend on changes
+
+    keep maps module-level cache names to the function that fills them;
+    a cache survives a reload while that function fingerprints the same.
+    Runs until interrupted.
+    """
+    script = os.path.abspath(script)
+    keep = keep or {}
+    namespace = sys.modules['__main__'].__dict__
+    fillers = _fingerprints(namespace, keep)
+    entries = namespace[entries_name]
+    kit = _snapshot(_kit_sources(), ())
+    stamps = _snapshot([script] + _input_paths(entries), dirs)
+
+    print(f"Watching {os.path.basename(script)} for changes (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            if _snapshot(_kit_sources(), ()) != kit:
+                print("wireframe_kit changed, restarting...")
+                sys.stdout.flush()
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            current = _snapshot([script] + _input_paths(entries), dirs)
+            if current == stamps:
+                continue
+            stamps = current
+
+            start = time.perf_counter()
+            try:
+                reloaded = load_script(script)
+            except Exception as e:
+                print(f"  ERROR: {os.path.basename(script)} - {type(e).__name__}: {e}")
+                continue
+            reloaded_fillers = _fingerprints(reloaded, keep)
+            for cache, digest in reloaded_fillers.items():
+                if fillers.get(cache) == digest and cache in namespace:
+                    reloaded[cache] = namespace[cache]
+            namespace, fillers = reloaded, reloaded_fillers
+            entries = namespace[entries_name]
+            # inputs may have been added or removed with the script
+            stamps = _snapshot([script] + _input_paths(entries), dirs)
+
+            rendered = 0
+            for result in build_outputs(entries, output_dir, font_paths=font_paths,
+                                        formats=formats, quality=quality):
+                if result.skipped:
+                    continue
+                rendered += 1
+                if result.error:
+                    print(f"  ERROR: {result.filename} - {result.error}")
+                    continue
+                details = describe(result)
+                print(f"  Generated: {result.filename}" + (f" ({details})" if details else ""))
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"  {rendered} of {len(entries)} re-rendered in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")